@@ -0,0 +1,54 @@
+# ============================================================
+# ADD NOTE app
+# ============================================================
+
+from __main__ import *
+
+def save_note(text):
+    try:
+        with open("notes.txt", "a") as f:
+            f.write(text + "\n")
+    except:
+        pass
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down), rate=120, fastest=40)
+    chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,-!?"
+    index = 0
+    note = ""
+
+    while True:
+        pip_screen("ADD NOTE")
+        draw_status_bar()
+
+        draw_med_text(10, CONTENT_TOP,     "NOTE:", PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+18,  note[:18], PIP_GREEN)
+
+        draw_med_text(10, CONTENT_TOP+48,  "CHAR: {}".format(chars[index]), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+66,  "UP/DOWN: CHANGE", PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+84,  "A: ADD CHAR", PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+102, "X: SAVE", PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+120, "B: CANCEL", PIP_GREEN)
+
+        draw_footer("A: ADD", "X: SAVE")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            index = (index - 1) % len(chars)
+
+        if k == down:
+            index = (index + 1) % len(chars)
+
+        if k == keyA:
+            note += chars[index]
+
+        if k == keyX:
+            save_note(note)
+            return
+
+        if k == keyB:
+            return
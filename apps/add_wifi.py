@@ -0,0 +1,132 @@
+# ============================================================
+# ADD WIFI app
+# ============================================================
+
+from __main__ import *
+import json
+
+async def run():
+    import network
+    screen_flicker()
+
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+
+    # --- SCAN ---
+    pip_screen("SCAN WIFI")
+    draw_status_bar()
+    draw_med_text(20, CONTENT_TOP, "Scanning...", PIP_GREEN)
+    LCD.show()
+
+    nets = wlan.scan()
+    networks = []
+
+    for n in nets:
+        ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
+        if len(ssid) > 0:
+            networks.append(ssid)
+
+    if not networks:
+        pip_screen("ADD WIFI")
+        draw_status_bar()
+        draw_med_text(20, CONTENT_TOP, "No networks found", PIP_RED)
+        draw_footer("B: BACK", "")
+        LCD.show()
+        await idle_until(None, (keyB,))
+        return
+
+    index = 0
+
+    # --- SELECT NETWORK ---
+    while True:
+        pip_screen("ADD WIFI")
+        draw_status_bar()
+
+        y = CONTENT_TOP
+        for i, ssid in enumerate(networks):
+            color = PIP_GREEN if i == index else PIP_DIM
+            draw_med_text(20, y, ssid, color)
+            y += 20
+
+        draw_footer("A: SELECT", "B: BACK")
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == up:
+            index = (index - 1) % len(networks)
+
+        if k == down:
+            index = (index + 1) % len(networks)
+
+        if k == keyA:
+            ssid = networks[index]
+            break
+
+        if k == keyB:
+            return
+
+    # --- ENTER PASSWORD ---
+    password = await keyboard_input("PASSWORD")
+
+# --- RESET WIFI STACK ---
+    ap = network.WLAN(network.AP_IF)
+    ap.active(False)
+
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(False)
+    await asyncio.sleep_ms(200)
+    wlan.active(True)
+    await asyncio.sleep_ms(200)
+
+# --- CONNECT ---
+    wlan.connect(ssid, password)
+
+    timeout = 0
+    while not wlan.isconnected() and timeout < 150:
+        await asyncio.sleep_ms(100)
+        timeout += 1
+        
+    for _ in range(120):  # 12 seconds
+        if wlan.isconnected():
+            break
+        await asyncio.sleep_ms(100)
+
+    if not wlan.isconnected():
+        pip_screen("FAILED")
+        draw_status_bar()
+        draw_med_text(20, CONTENT_TOP, "Connection failed", PIP_RED)
+        draw_footer("B: BACK", "")
+        LCD.show()
+        await idle_until(None, (keyB,))
+        return
+
+    # --- SAVE CREDENTIALS ---
+    try:
+        with open("wifi.json", "w") as f:
+            f.write(json.dumps({"ssid": ssid, "password": password}))
+    except:
+        pass
+
+    # --- AUTO UPDATE TIME ---
+    try:
+        ntptime.settime()
+    except:
+        pass
+
+    # --- AUTO UPDATE WEATHER ---
+    try:
+        from apps.weather import update_weather
+        update_weather()
+    except:
+        pass
+
+    # --- SUCCESS ---
+    pip_screen("CONNECTED")
+    draw_status_bar()
+    draw_med_text(20, CONTENT_TOP, "WiFi Connected!", PIP_GREEN)
+    draw_med_text(20, CONTENT_TOP + 20, ssid, PIP_GREEN)
+    draw_footer("B: BACK", "")
+    LCD.show()
+
+    await idle_until(None, (keyB,))
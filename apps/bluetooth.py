@@ -0,0 +1,82 @@
+# ============================================================
+# BLUETOOTH SCANNER (BASIC)
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    try:
+        import bluetooth
+        has_ble = True
+    except:
+        has_ble = False
+    if not has_ble:
+        pip_screen("BLUETOOTH")
+        draw_status_bar()
+        draw_med_text(10, CONTENT_TOP+10, "BLE NOT AVAILABLE", PIP_GREEN)
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+        await idle_until(None, (keyB,))
+        return
+
+    ble = bluetooth.BLE()
+    ble.active(True)
+    devices = []
+
+    def scan_cb(addr_type, addr, adv_type, rssi, adv_data):
+        name = ""
+        try:
+            name = adv_data.decode(errors="ignore")
+        except:
+            name = ""
+        devices.append((addr, rssi, name))
+
+    # NOTE: MicroPython BLE API differs by port; this is a placeholder.
+    # You may need to adapt to your firmware's BLE scan API.
+
+    start = utime.ticks_ms()
+    while utime.ticks_diff(utime.ticks_ms(), start) < 3000:
+        await asyncio.sleep_ms(100)
+
+    def draw_device(i, y, selected):
+        addr, rssi, name = devices[i]
+        addr_str = ":".join(["{:02X}".format(b) for b in addr])
+        line = "{} {}".format(addr_str[-8:], rssi)
+        if selected:
+            LCD.fill_rect(0, y, 240, 18, PIP_BLACK)
+        draw_med_text(10, y + 2, line[:18], PIP_GREEN)
+
+    dev_list = ListView(CONTENT_TOP - 2, 18, 6, draw_device)
+    index = 0
+
+    pip_screen("BLUETOOTH")
+    draw_status_bar()
+    if not devices:
+        draw_med_text(10, CONTENT_TOP, "NO DEVICES FOUND", PIP_GREEN)
+    else:
+        dev_list.draw(len(devices), index, index)
+    draw_footer("B: BACK", "")
+    draw_noise(120)
+    LCD.show()
+
+    while True:
+        draw_status_bar()
+        if devices:
+            dev_list.move(index, index)
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == up:
+            if index > 0:
+                index -= 1
+
+        if k == down:
+            if devices and index < len(devices) - 1:
+                index += 1
+
+        if k == keyB:
+            ble.active(False)
+            return
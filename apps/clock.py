@@ -0,0 +1,52 @@
+# ============================================================
+# CLOCK app
+# ============================================================
+
+from __main__ import *
+
+EDGE_POLL_MS = 20
+
+async def run():
+    screen_flicker()
+    pip_screen("CLOCK")
+    draw_status_bar()
+    draw_footer("B: BACK", "")
+    draw_noise(120)
+
+    status = status_bar_key()
+    field = DigitField(30, 120, PIP_GREEN)
+    last_s = -1
+    tick = None     # ticks_ms of the last second edge, None until pinned
+    checked = 0     # ticks_ms of the last localtime() read
+
+    while True:
+        t = utime.localtime()
+        now = utime.ticks_ms()
+        changed = False
+        if t[5] != last_s:
+            # the edge fell between the last read and this one; pin it
+            # only when that gap was a poll step, else poll for the next
+            if last_s >= 0 and utime.ticks_diff(now, checked) <= 2 * EDGE_POLL_MS:
+                tick = now
+            else:
+                tick = None
+            last_s = t[5]
+            field.update("{:02d}:{:02d}:{:02d}".format(t[3], t[4], t[5]))
+            changed = True
+        key = status_bar_key()
+        if key != status:
+            status = key
+            draw_status_bar()
+            changed = True
+        if changed:
+            LCD.show()
+        checked = now
+
+        # sleep to just before the next edge, then poll across it
+        if tick is None or utime.ticks_diff(now, tick) >= 1000 - EDGE_POLL_MS:
+            deadline = utime.ticks_add(now, EDGE_POLL_MS)
+        else:
+            deadline = utime.ticks_add(tick, 1000 - EDGE_POLL_MS)
+
+        if await idle_until(status_bar_wake(deadline), (keyB,)) == keyB:
+            return
@@ -0,0 +1,64 @@
+# ============================================================
+# COMPASS app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((left, right), delay=250, rate=80, fastest=20)
+
+    heading = 0  # degrees, 0 = North
+
+    while True:
+        pip_screen("COMPASS")
+        draw_status_bar()
+
+        # center of compass
+        cx = 120
+        cy = 140
+        radius = 60
+
+        # outer circle
+        for angle in range(0, 360, 4):
+            rad = math.radians(angle)
+            px = int(cx + radius * math.cos(rad))
+            py = int(cy + radius * math.sin(rad))
+            if 0 <= px < 240 and 0 <= py < 240:
+                LCD.pixel(px, py, PIP_GREEN)
+
+        # cardinal marks
+        LCD.text("N", cx - 3, cy - radius - 10, PIP_GREEN)
+        LCD.text("S", cx - 3, cy + radius + 2, PIP_GREEN)
+        LCD.text("W", cx - radius - 10, cy - 3, PIP_GREEN)
+        LCD.text("E", cx + radius + 4, cy - 3, PIP_GREEN)
+
+        # needle (red tip to North-ish)
+        rad = math.radians(heading)
+        nx = int(cx + (radius - 8) * math.sin(rad))
+        ny = int(cy - (radius - 8) * math.cos(rad))
+        LCD.line(cx, cy, nx, ny, colour(255, 60, 60))
+
+        # tail (dim)
+        tx = int(cx - (radius - 20) * math.sin(rad))
+        ty = int(cy + (radius - 20) * math.cos(rad))
+        LCD.line(cx, cy, tx, ty, PIP_DIM)
+
+        # heading readout
+        draw_med_text(70, CONTENT_TOP, "HEADING: {:03d}°".format(heading % 360), PIP_GREEN)
+        draw_small_text(40, CONTENT_TOP + 20, "LEFT/RIGHT: ADJUST (VIRTUAL)", PIP_DIM)
+
+        draw_footer("B: BACK", "")
+        draw_noise(80)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == left:
+            heading = (heading - 5) % 360
+
+        if k == right:
+            heading = (heading + 5) % 360
+
+        if k == keyB:
+            return
@@ -0,0 +1,52 @@
+# ============================================================
+# FILES app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down))
+    pip_screen("FILES")
+    draw_status_bar()
+
+    try:
+        entries = os.listdir()
+    except:
+        entries = []
+
+    if not entries:
+        draw_med_text(10, CONTENT_TOP+10, "NO FILES FOUND", PIP_GREEN)
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+        await idle_until(None, (keyB,))
+        return
+
+    def draw_entry(i, y, selected):
+        draw_med_text(10, y + 2, entries[i][:18], PIP_GREEN)
+
+    files = ListView(CONTENT_TOP - 2, 18, 6, draw_entry)
+    index = 0
+
+    files.draw(len(entries), index)
+    draw_footer("UP/DOWN: SCROLL", "B: BACK")
+    draw_noise(120)
+    LCD.show()
+
+    while True:
+        draw_status_bar()
+        files.move(index)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            index = max(0, index - 1)
+
+        if k == down:
+            if index < max(0, len(entries) - 6):
+                index += 1
+
+        if k == keyB:
+            return
@@ -0,0 +1,64 @@
+# ============================================================
+# FLASHLIGHT app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+
+    # 0 = dim, 1 = medium, 2 = bright
+    level = 1
+    # 0 = white, 1 = green, 2 = red
+    mode = 0
+
+    def get_color():
+        if mode == 0:  # white
+            if level == 0:
+                return colour(80, 80, 80)
+            elif level == 1:
+                return colour(160, 160, 160)
+            else:
+                return colour(255, 255, 255)
+        elif mode == 1:  # green
+            if level == 0:
+                return colour(0, 60, 0)
+            elif level == 1:
+                return colour(0, 140, 0)
+            else:
+                return colour(0, 255, 0)
+        else:  # red
+            if level == 0:
+                return colour(60, 0, 0)
+            elif level == 1:
+                return colour(140, 0, 0)
+            else:
+                return colour(255, 0, 0)
+
+    while True:
+        c = get_color()
+        LCD.fill(c)
+
+        draw_status_bar()
+        pip_title("FLASHLIGHT")
+
+        draw_med_text(10, CONTENT_TOP, "LEVEL: {}".format(level + 1), PIP_GREEN)
+        mode_name = ["WHITE", "GREEN", "RED"][mode]
+        draw_med_text(10, CONTENT_TOP + 18, "MODE: {}".format(mode_name), PIP_GREEN)
+
+        draw_footer("A: MODE  UP/DN: BRIGHT", "B: BACK")
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == up:
+            level = min(2, level + 1)
+
+        if k == down:
+            level = max(0, level - 1)
+
+        if k == keyA:
+            mode = (mode + 1) % 3
+
+        if k == keyB:
+            return
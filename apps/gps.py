@@ -0,0 +1,38 @@
+# ============================================================
+# GPS (MOCK) APP
+# ============================================================
+
+from __main__ import *
+
+def get_gps_data():
+    return {
+        "lat": 43.0123,
+        "lon": -83.6870,
+        "fix": True,
+        "sats": 7,
+        "map_x": 0.5,
+        "map_y": 0.5
+    }
+
+async def run():
+    screen_flicker()
+    while True:
+        pip_screen("GPS")
+        draw_status_bar()
+
+        gps = get_gps_data()
+
+        draw_med_text(10, CONTENT_TOP,     "LAT: {:.4f}".format(gps["lat"]), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+24,  "LON: {:.4f}".format(gps["lon"]), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+48,  "SAT: {} FIX: {}".format(gps["sats"], gps["fix"]), PIP_GREEN)
+
+        draw_minimap(150, CONTENT_TOP, gps["map_x"], gps["map_y"])
+
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == keyB:
+            return
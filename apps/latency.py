@@ -0,0 +1,57 @@
+# ============================================================
+# LATENCY app
+# ============================================================
+
+from __main__ import *
+import __main__ as core
+
+async def run():
+    screen_flicker()
+    scroll_y = 0
+    ROW_H = 12
+    repeat = Repeat((up, down))
+
+    while True:
+        pip_screen("LATENCY")
+        draw_status_bar()
+
+        draw_med_text(10, CONTENT_TOP, "TIMING: " + ("ON" if core.LATENCY_ON else "OFF"),
+                      PIP_GREEN if core.LATENCY_ON else PIP_DIM)
+        y = CONTENT_TOP + 22
+        draw_small_text(10, y, "APP          N P50 P95 MAX", PIP_DIM)
+        y += ROW_H
+
+        apps = sorted(latency_stats)
+        if not apps:
+            draw_small_text(10, y, "No presses timed", PIP_DIM)
+
+        # rows scroll under the header, clipped above the footer
+        top = y
+        for i, app in enumerate(apps):
+            ry = top + i * ROW_H - scroll_y
+            if ry < top or ry > 192:
+                continue
+            n, p50, p95, worst = latency_summary(app)
+            draw_small_text(10, ry, "{:<10}{:>4}{:>4}{:>4}{:>4}".format(
+                app[:10], min(n, 999), p50, p95, worst), PIP_GREEN)
+
+        draw_small_text(10, 206, "X: DUMP  HOLD Y: RESET", PIP_DIM)
+        draw_footer("A: ON/OFF", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat, hold=(keyY,))
+
+        if k == up:
+            scroll_y = max(0, scroll_y - ROW_H)
+        if k == down:
+            scroll_y = min(max(0, (len(apps) - 7) * ROW_H), scroll_y + ROW_H)
+        if k == keyA:
+            latency_enable(not core.LATENCY_ON)
+        if k == keyX:
+            latency_dump()
+        if k == held(keyY):
+            latency_reset()
+            scroll_y = 0
+        if k == keyB:
+            return
@@ -0,0 +1,59 @@
+# ============================================================
+# SET DATE app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down), rate=120, fastest=25)
+    year, month, day, weekday, hour, minute, second, sub = rtc.datetime()
+    cursor = 0  # 0=year,1=month,2=day
+
+    while True:
+        pip_screen("SET DATE")
+        draw_status_bar()
+
+        labels = ["YEAR", "MONTH", "DAY"]
+        values = [year, month, day]
+
+        for i, label in enumerate(labels):
+            draw_med_text(10, CONTENT_TOP + i*24,
+                          label + ":", PIP_GREEN if cursor == i else PIP_DIM)
+            draw_med_text(130, CONTENT_TOP + i*24,
+                          str(values[i]), PIP_GREEN)
+
+        draw_footer("A: APPLY", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            if cursor == 0:
+                year += 1
+            elif cursor == 1:
+                month = 1 if month >= 12 else month + 1
+            elif cursor == 2:
+                day = 1 if day >= 31 else day + 1
+
+        if k == down:
+            if cursor == 0:
+                year -= 1
+            elif cursor == 1:
+                month = 12 if month <= 1 else month - 1
+            elif cursor == 2:
+                day = 31 if day <= 1 else day - 1
+
+        if k == left:
+            cursor = (cursor - 1) % 3
+
+        if k == right:
+            cursor = (cursor + 1) % 3
+
+        if k == keyA:
+            rtc.datetime((year, month, day, weekday, hour, minute, second, sub))
+            return
+
+        if k == keyB:
+            return
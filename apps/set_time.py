@@ -0,0 +1,59 @@
+# ============================================================
+# SET TIME app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down), rate=120, fastest=25)
+    year, month, day, weekday, hour, minute, second, sub = rtc.datetime()
+    cursor = 0  # 0=hour,1=minute,2=second
+
+    while True:
+        pip_screen("SET TIME")
+        draw_status_bar()
+
+        labels = ["HOUR", "MINUTE", "SECOND"]
+        values = [hour, minute, second]
+
+        for i, label in enumerate(labels):
+            draw_med_text(10, CONTENT_TOP + i*24,
+                          label + ":", PIP_GREEN if cursor == i else PIP_DIM)
+            draw_med_text(130, CONTENT_TOP + i*24,
+                          "{:02d}".format(values[i]), PIP_GREEN)
+
+        draw_footer("A: APPLY", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            if cursor == 0:
+                hour = (hour + 1) % 24
+            elif cursor == 1:
+                minute = (minute + 1) % 60
+            elif cursor == 2:
+                second = (second + 1) % 60
+
+        if k == down:
+            if cursor == 0:
+                hour = (hour - 1) % 24
+            elif cursor == 1:
+                minute = (minute - 1) % 60
+            elif cursor == 2:
+                second = (second - 1) % 60
+
+        if k == left:
+            cursor = (cursor - 1) % 3
+
+        if k == right:
+            cursor = (cursor + 1) % 3
+
+        if k == keyA:
+            rtc.datetime((year, month, day, weekday, hour, minute, second, sub))
+            return
+
+        if k == keyB:
+            return
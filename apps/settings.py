@@ -0,0 +1,65 @@
+# ============================================================
+# SETTINGS app
+# ============================================================
+
+from __main__ import *
+import __main__ as core
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down, keyA))
+    mode_index = 0
+    modes = ["BRIGHTNESS", "COLOR MODE", "NOISE"]
+
+    while True:
+        pip_screen("SETTINGS")
+        draw_status_bar()
+
+        draw_med_text(10, CONTENT_TOP,     "UP/DOWN: SELECT OPTION", core.PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+18,  "A: CHANGE VALUE", core.PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+36,  "B: BACK", core.PIP_GREEN)
+
+        y = CONTENT_TOP+60
+        for i, m in enumerate(modes):
+            if i == mode_index:
+                LCD.fill_rect(0, y - 2, 240, 18, PIP_BLACK)
+                LCD.fill_rect(6, y, 6, 14, core.PIP_GREEN)
+            draw_med_text(40, y, m, core.PIP_GREEN)
+            y += 18
+
+        if modes[mode_index] == "BRIGHTNESS":
+            draw_med_text(10, y, "LEVEL: {}%".format(core.brightness_level), core.PIP_GREEN)
+        elif modes[mode_index] == "COLOR MODE":
+            draw_med_text(10, y, "MODE: {}".format(core.COLOR_MODE), core.PIP_GREEN)
+        elif modes[mode_index] == "NOISE":
+            draw_med_text(10, y, "NOISE: {}".format(core.NOISE_LEVEL), core.PIP_GREEN)
+
+        draw_footer("A: CHANGE", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        # A only repeats on brightness; held on the toggles it would flicker
+        repeat.keys = (up, down, keyA) if modes[mode_index] == "BRIGHTNESS" else (up, down)
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            mode_index = (mode_index - 1) % len(modes)
+
+        if k == down:
+            mode_index = (mode_index + 1) % len(modes)
+
+        if k == keyA:
+            if modes[mode_index] == "BRIGHTNESS":
+                core.brightness_level += 10
+                if core.brightness_level > 100:
+                    core.brightness_level = 10
+                apply_brightness()
+            elif modes[mode_index] == "COLOR MODE":
+                core.COLOR_MODE = "AMBER" if core.COLOR_MODE == "GREEN" else "GREEN"
+                apply_theme()
+            elif modes[mode_index] == "NOISE":
+                i = NOISE_LEVELS.index(core.NOISE_LEVEL)
+                core.NOISE_LEVEL = NOISE_LEVELS[(i + 1) % len(NOISE_LEVELS)]
+
+        if k == keyB:
+            return
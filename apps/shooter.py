@@ -0,0 +1,105 @@
+# ============================================================
+# PIP Shooter game.
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+
+    # Player
+    px = 120
+    py = 210
+    p_speed = 4
+
+    # Bullets
+    bullets = []
+
+    # Enemies
+    enemies = []
+    enemy_timer = 0
+    enemy_speed = 2
+
+    score = 0
+    lives = 3
+
+    while True:
+        pip_screen("PIP-SHOOTER")
+        draw_status_bar()
+
+        # --- INPUT ---
+        if pressed(left):
+            px -= p_speed
+        if pressed(right):
+            px += p_speed
+        if pressed(keyA):
+            bullets.append([px, py - 10])
+
+        # Clamp player
+        px = max(10, min(230, px))
+
+        # --- UPDATE BULLETS ---
+        for b in bullets:
+            b[1] -= 6
+        bullets = [b for b in bullets if b[1] > 0]
+
+        # --- SPAWN ENEMIES ---
+        enemy_timer += 1
+        if enemy_timer > 20:
+            enemy_timer = 0
+            enemies.append([random.randint(10, 230), 0])
+
+        # --- UPDATE ENEMIES ---
+        for e in enemies:
+            e[1] += enemy_speed
+
+        # --- COLLISIONS ---
+        for b in bullets:
+            for e in enemies:
+                if abs(b[0] - e[0]) < 10 and abs(b[1] - e[1]) < 10:
+                    score += 1
+                    e[1] = 999  # remove enemy
+                    b[1] = -999 # remove bullet
+
+        enemies = [e for e in enemies if e[1] < 240]
+
+        # --- ENEMY HITS BOTTOM ---
+        for e in enemies:
+            if e[1] > 200:
+                lives -= 1
+                e[1] = 999
+
+        if lives <= 0:
+            pip_screen("GAME OVER")
+            draw_status_bar()
+            draw_med_text(40, 120, "SCORE: {}".format(score), PIP_GREEN)
+            draw_footer("B: BACK", "")
+            LCD.show()
+            await idle_until(None, (keyB,))
+            return
+
+        # --- DRAW PLAYER ---
+        LCD.fill_rect(px - 5, py - 5, 10, 10, PIP_GREEN)
+
+        # --- DRAW BULLETS ---
+        for b in bullets:
+            LCD.fill_rect(b[0] - 1, b[1] - 4, 2, 4, colour(180, 255, 180))
+
+        # --- DRAW ENEMIES ---
+        for e in enemies:
+            LCD.fill_rect(e[0] - 5, e[1] - 5, 10, 10, colour(255, 60, 60))
+
+        # --- HUD ---
+        draw_med_text(10, CONTENT_TOP, "SCORE: {}".format(score), PIP_GREEN)
+        draw_med_text(150, CONTENT_TOP, "LIVES: {}".format(lives), PIP_GREEN)
+
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+
+        if pressed(keyB):
+            await asyncio.sleep_ms(200)
+            return
+
+        # held keys are read with pressed(); presses are not needed
+        await next_frame(keys=())
@@ -0,0 +1,85 @@
+# ============================================================
+# SNAKE game
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    grid_size = 10
+    cell = 14
+    offset_x = 25
+    offset_y = CONTENT_TOP
+
+    snake = [(5, 5), (4, 5), (3, 5)]
+    direction = (1, 0)
+    food = (8, 5)
+    alive = True
+    last_move = utime.ticks_ms()
+    dirty = True
+
+    def draw_grid():
+        pip_screen("SNAKE")
+        draw_status_bar()
+        LCD.rect(offset_x-2, offset_y-2, grid_size*cell+4, grid_size*cell+4, PIP_GREEN)
+        for (sx, sy) in snake:
+            LCD.fill_rect(offset_x + sx*cell, offset_y + sy*cell, cell-2, cell-2, PIP_GREEN)
+        LCD.fill_rect(offset_x + food[0]*cell+3, offset_y + food[1]*cell+3, cell-6, cell-6, PIP_GREEN)
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+
+    def spawn_food():
+        while True:
+            fx = urandom.getrandbits(4) % grid_size
+            fy = urandom.getrandbits(4) % grid_size
+            if (fx, fy) not in snake:
+                return (fx, fy)
+
+    while True:
+        if not alive:
+            pip_screen("SNAKE")
+            draw_status_bar()
+            draw_med_text(40, 120, "GAME OVER", PIP_GREEN)
+            draw_footer("B: BACK", "")
+            draw_noise(120)
+            LCD.show()
+            if await idle_until(None, (keyB,)) == keyB:
+                return
+
+        if dirty:
+            draw_grid()
+            dirty = False
+
+        if pressed(up) and direction != (0, 1):
+            direction = (0, -1)
+        elif pressed(down) and direction != (0, -1):
+            direction = (0, 1)
+        elif pressed(left) and direction != (1, 0):
+            direction = (-1, 0)
+        elif pressed(right) and direction != (-1, 0):
+            direction = (1, 0)
+
+        if pressed(keyB):
+            await asyncio.sleep_ms(200)
+            return
+
+        if utime.ticks_diff(utime.ticks_ms(), last_move) > 220:
+            last_move = utime.ticks_ms()
+            head = snake[0]
+            new_head = (head[0] + direction[0], head[1] + direction[1])
+
+            if (new_head[0] < 0 or new_head[0] >= grid_size or
+                new_head[1] < 0 or new_head[1] >= grid_size or
+                new_head in snake):
+                alive = False
+                continue
+
+            snake.insert(0, new_head)
+            if new_head == food:
+                food = spawn_food()
+            else:
+                snake.pop()
+            dirty = True
+
+        await next_frame(keys=())
@@ -0,0 +1,137 @@
+# ============================================================
+# STATUS app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    # the beacon scan runs only while this screen is open
+    spawn("beacon", BEACON.run)
+    try:
+        await status_screen()
+    finally:
+        cancel("beacon")
+
+async def status_screen():
+    import network
+    screen_flicker()
+
+    scroll_y = 0
+    SCROLL_STEP = 14
+    MAX_SCROLL = 140  # adjust if you add more lines
+
+    start_time = utime.ticks_ms()
+
+    while True:
+        pip_screen("STATUS")
+        draw_status_bar()
+
+        y = CONTENT_TOP - scroll_y
+
+        # --- DEVICE ---
+        draw_med_text(10, y, "DEVICE", PIP_GREEN)
+        y += 18
+        draw_small_text(20, y, "Model: Pico 2 W", PIP_GREEN)
+        y += 14
+        draw_small_text(20, y, "OS: TinyPIP v1.8.0", PIP_GREEN)
+        y += 20
+
+        # --- SYSTEM ---
+        draw_med_text(10, y, "SYSTEM", PIP_GREEN)
+        y += 18
+
+        # CPU MHz
+        try:
+            cpu = machine.freq() // 1000000
+        except:
+            cpu = 133
+        draw_small_text(20, y, "CPU: {} MHz".format(cpu), PIP_GREEN)
+        y += 14
+
+        # Uptime
+        uptime_ms = utime.ticks_ms() - start_time
+        uptime_s = uptime_ms // 1000
+        uptime_m = uptime_s // 60
+        uptime_h = uptime_m // 60
+        draw_small_text(20, y, "Uptime: {}h {}m".format(uptime_h, uptime_m % 60), PIP_GREEN)
+        y += 14
+
+        # RAM usage
+        import gc
+        free_ram = gc.mem_free()
+        used_ram = gc.mem_alloc()
+        draw_small_text(20, y, "RAM: {} used / {} free".format(used_ram, free_ram), PIP_GREEN)
+        y += 20
+
+        # --- NETWORK ---
+        draw_med_text(10, y, "NETWORK", PIP_GREEN)
+        y += 18
+
+        wlan = network.WLAN(network.STA_IF)
+        if wlan.active() and wlan.isconnected():
+            ip = wlan.ifconfig()[0]
+            draw_small_text(20, y, "WiFi: Connected", PIP_GREEN)
+            y += 14
+            draw_small_text(20, y, "IP: {}".format(ip), PIP_GREEN)
+            y += 14
+        else:
+            draw_small_text(20, y, "WiFi: Offline", PIP_DIM)
+            y += 20
+
+        # --- BEACON STATUS (from the last background scan) ---
+        draw_med_text(10, y, "BEACON", PIP_GREEN)
+        y += 18
+
+        if not BEACON.scanned():
+            draw_small_text(20, y, "Status: SCANNING", PIP_DIM)
+            y += 20
+        elif BEACON.online():
+            draw_small_text(20, y, "Status: ONLINE", PIP_GREEN)
+            y += 14
+            if BEACON.battery is not None:
+                draw_small_text(20, y, "Battery: {}%".format(BEACON.battery), PIP_GREEN)
+                y += 14
+            draw_small_text(20, y, "RSSI: {} dBm".format(BEACON.rssi), PIP_GREEN)
+            y += 20
+        else:
+            draw_small_text(20, y, "Status: OFFLINE", PIP_DIM)
+            y += 14
+            ago = BEACON.seen_ago_s()
+            if ago is not None:
+                draw_small_text(20, y, "Last seen: {}s ago".format(ago), PIP_DIM)
+                y += 14
+            y += 6
+
+        # --- STORAGE ---
+        draw_med_text(10, y, "STORAGE", PIP_GREEN)
+        y += 18
+
+        try:
+            fs = os.statvfs("/")
+            total = (fs[0] * fs[2]) // 1024
+            free = (fs[0] * fs[3]) // 1024
+            used = total - free
+            draw_small_text(20, y, "Used: {} KB".format(used), PIP_GREEN)
+            y += 14
+            draw_small_text(20, y, "Free: {} KB".format(free), PIP_GREEN)
+            y += 14
+        except:
+            draw_small_text(20, y, "Storage: N/A", PIP_DIM)
+            y += 14
+
+        # FOOTER
+        draw_footer("UP/DN: SCROLL", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        # INPUT
+        k = await next_frame()
+
+        if k == up:
+            scroll_y = max(0, scroll_y - SCROLL_STEP)
+
+        if k == down:
+            scroll_y = min(MAX_SCROLL, scroll_y + SCROLL_STEP)
+
+        if k == keyB:
+            return
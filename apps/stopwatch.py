@@ -0,0 +1,55 @@
+# ============================================================
+# STOPWATCH app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    running = False
+    start_time = 0
+    elapsed = 0
+
+    pip_screen("STOPWATCH")
+    draw_status_bar()
+    draw_footer("A: START/STOP", "B: RESET/BACK")
+    draw_noise(120)
+
+    status = status_bar_key()
+    field = DigitField(40, 120, PIP_GREEN)
+
+    while True:
+        if running:
+            elapsed = utime.ticks_diff(utime.ticks_ms(), start_time)
+
+        total_s = elapsed // 1000
+        mins = total_s // 60
+        secs = total_s % 60
+
+        field.update("{:02d}:{:02d}".format(mins, secs))
+        key = status_bar_key()
+        if key != status:
+            status = key
+            draw_status_bar()
+        LCD.show()
+
+        # nothing on screen changes before the next whole second
+        if running:
+            deadline = utime.ticks_add(start_time, (total_s + 1) * 1000)
+        else:
+            deadline = utime.ticks_add(utime.ticks_ms(), 1000)
+        k = await idle_until(status_bar_wake(deadline), (keyA, keyB))
+
+        if k == keyA:
+            if not running:
+                start_time = utime.ticks_ms() - elapsed
+                running = True
+            else:
+                running = False
+
+        elif k == keyB:
+            if elapsed > 0:
+                elapsed = 0
+                running = False
+            else:
+                return
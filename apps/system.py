@@ -0,0 +1,117 @@
+# ============================================================
+# SYSTEM app
+# ============================================================
+
+from __main__ import *
+import __main__ as core
+
+async def run():
+    import network
+    screen_flicker()
+
+    start_time = utime.ticks_ms()
+    scroll_y = 0
+    SCROLL_STEP = 14
+    MAX_SCROLL = 180 + 14 * len(core.LAST_UPDATE_STEPS)  # adjust if you add more lines
+
+    while True:
+        pip_screen("SYSTEM INFO")
+        draw_status_bar()
+
+        y = CONTENT_TOP - scroll_y
+
+        # --- DEVICE SECTION ---
+        draw_med_text(10, y, "DEVICE", PIP_GREEN)
+        y += 18
+        draw_small_text(20, y, "Model: Pico 2 W", PIP_GREEN)
+        y += 14
+        draw_small_text(20, y, "OS: TinyPIP v1.8.0", PIP_GREEN)
+        y += 20
+
+        # --- SYSTEM SECTION ---
+        draw_med_text(10, y, "SYSTEM", PIP_GREEN)
+        y += 18
+
+        try:
+            cpu = machine.freq() // 1000000
+        except:
+            cpu = 133
+        draw_small_text(20, y, "CPU: {} MHz".format(cpu), PIP_GREEN)
+        y += 14
+
+        uptime_ms = utime.ticks_ms() - start_time
+        uptime_s = uptime_ms // 1000
+        uptime_m = uptime_s // 60
+        uptime_h = uptime_m // 60
+        draw_small_text(20, y, "Uptime: {}h {}m".format(uptime_h, uptime_m % 60), PIP_GREEN)
+        y += 20
+
+        # --- NETWORK SECTION ---
+        draw_med_text(10, y, "NETWORK", PIP_GREEN)
+        y += 18
+
+        wlan = network.WLAN(network.STA_IF)
+        if wlan.active() and wlan.isconnected():
+            ip = wlan.ifconfig()[0]
+            draw_small_text(20, y, "WiFi: Connected", PIP_GREEN)
+            y += 14
+            draw_small_text(20, y, "IP: {}".format(ip), PIP_GREEN)
+            y += 14
+        else:
+            draw_small_text(20, y, "WiFi: Offline", PIP_DIM)
+            y += 20
+
+        # --- STORAGE SECTION ---
+        draw_med_text(10, y, "STORAGE", PIP_GREEN)
+        y += 18
+
+        try:
+            fs_stat = os.statvfs("/")
+            total = (fs_stat[0] * fs_stat[2]) // 1024
+            free = (fs_stat[0] * fs_stat[3]) // 1024
+            used = total - free
+            draw_small_text(20, y, "Used: {} KB".format(used), PIP_GREEN)
+            y += 14
+            draw_small_text(20, y, "Free: {} KB".format(free), PIP_GREEN)
+            y += 14
+        except:
+            draw_small_text(20, y, "Storage: N/A", PIP_DIM)
+            y += 14
+
+        # --- MEMORY SECTION ---
+        draw_med_text(10, y, "MEMORY", PIP_GREEN)
+        y += 18
+        draw_small_text(20, y, "Heap free: {} KB".format(gc.mem_free() // 1024), PIP_GREEN)
+        y += 14
+        draw_small_text(20, y, "Text cache: {}/{} B".format(core.text_cache_used, TEXT_CACHE_BYTES), PIP_GREEN)
+        y += 14
+        draw_small_text(20, y, "Hits: {} Miss: {}".format(core.text_cache_hits, core.text_cache_misses), PIP_GREEN)
+        y += 20
+
+        # --- LAST UPDATE SECTION ---
+        draw_med_text(10, y, "LAST UPDATE", PIP_GREEN)
+        y += 18
+        if not core.LAST_UPDATE_STEPS:
+            draw_small_text(20, y, "None yet (Y in menu)", PIP_DIM)
+            y += 14
+        for step, outcome, ms in core.LAST_UPDATE_STEPS:
+            draw_small_text(20, y, "{:<8}{:<8}{:>5} ms".format(step, outcome, ms),
+                            PIP_GREEN if outcome in ("ok", "skip") else PIP_DIM)
+            y += 14
+
+        # FOOTER
+        draw_footer("UP/DOWN: SCROLL", "B: BACK")
+        draw_noise(120)
+        LCD.show()
+
+        # --- INPUT ---
+        k = await next_frame()
+
+        if k == up:
+            scroll_y = max(0, scroll_y - SCROLL_STEP)
+
+        if k == down:
+            scroll_y = min(MAX_SCROLL, scroll_y + SCROLL_STEP)
+
+        if k == keyB:
+            return
@@ -0,0 +1,69 @@
+# ============================================================
+# TIMER app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down), rate=120, fastest=25)
+    minutes = 1
+    running = False
+    end_time = 0
+
+    pip_screen("TIMER")
+    draw_status_bar()
+
+    draw_med_text(10, CONTENT_TOP,     "UP/DOWN: SET MINUTES", PIP_GREEN)
+    draw_med_text(10, CONTENT_TOP+18,  "A: START/STOP", PIP_GREEN)
+    draw_med_text(10, CONTENT_TOP+36,  "B: BACK", PIP_GREEN)
+
+    draw_footer("A: START/STOP", "B: BACK")
+    draw_noise(120)
+
+    status = status_bar_key()
+    field = DigitField(40, 130, PIP_GREEN)
+
+    while True:
+        if not running:
+            timestr = "{:02d}:00".format(minutes)
+        else:
+            remaining_ms = utime.ticks_diff(end_time, utime.ticks_ms())
+            if remaining_ms <= 0:
+                remaining_ms = 0
+                running = False
+            total_s = remaining_ms // 1000
+            m = total_s // 60
+            s = total_s % 60
+            timestr = "{:02d}:{:02d}".format(m, s)
+
+        field.update(timestr)
+        key = status_bar_key()
+        if key != status:
+            status = key
+            draw_status_bar()
+        LCD.show()
+
+        # the readout next changes when the remaining time drops below
+        # the whole second shown
+        if running:
+            deadline = utime.ticks_add(end_time, 1 - total_s * 1000)
+            k = await idle_until(status_bar_wake(deadline), (keyA, keyB))
+        else:
+            deadline = utime.ticks_add(utime.ticks_ms(), 1000)
+            k = await idle_until(status_bar_wake(deadline), (up, down, keyA, keyB), repeat=repeat)
+
+        if k == up:
+            minutes = min(99, minutes + 1)
+        elif k == down:
+            minutes = max(1, minutes - 1)
+
+        elif k == keyA:
+            if not running:
+                end_time = utime.ticks_ms() + minutes * 60 * 1000
+                running = True
+            else:
+                running = False
+
+        elif k == keyB:
+            return
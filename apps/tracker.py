@@ -0,0 +1,115 @@
+# ============================================================
+# BEACON APP (DRAGON BALL STYLE)
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    import network
+    screen_flicker()
+
+    wlan = network.WLAN(network.STA_IF)
+    if not wlan.active():
+        wlan.active(True)
+
+    pulse = 0  # radar pulse animation counter
+
+    while True:
+        pip_screen("BEACON TRACKER")
+        draw_status_bar()
+
+        # --- RSSI AVERAGING ---
+        rssi_values = []
+        ssid_found = None
+
+        for _ in range(8):
+            try:
+                nets = wlan.scan()
+            except:
+                nets = []
+
+            for n in nets:
+                raw_ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
+                if raw_ssid.startswith("BEACON"):
+                    ssid_found = raw_ssid
+                    rssi_values.append(n[3])
+                    break
+
+            await asyncio.sleep_ms(30)
+
+        found = ssid_found is not None and len(rssi_values) > 0
+
+        # --- Parse battery from SSID ---
+        battery = None
+        if found and "|" in ssid_found:
+            try:
+                battery = int(ssid_found.split("|")[1])
+            except:
+                battery = None
+
+        if found:
+            avg_rssi = sum(rssi_values) / len(rssi_values)
+
+            freq = 2412
+            distance = 10 ** ((27.55 - (20 * math.log10(freq)) + abs(avg_rssi)) / 20)
+
+            draw_med_text(10, CONTENT_TOP, "BEACON FOUND", PIP_GREEN)
+            draw_med_text(10, CONTENT_TOP+18, "DIST: {:.1f} m".format(distance), PIP_GREEN)
+
+            if battery is not None:
+                draw_med_text(10, CONTENT_TOP+36, "BAT: {}%".format(battery), PIP_GREEN)
+
+            bar = max(0, min(100, 100 + int(avg_rssi)))
+            LCD.fill_rect(10, CONTENT_TOP+54, bar, 12, PIP_GREEN)
+
+            tpos = max(0.0, min(1.0, (100 + avg_rssi) / 100.0))
+        else:
+            draw_med_text(10, CONTENT_TOP, "SEARCHING...", PIP_DIM)
+            tpos = 0.5
+
+        # --- MINIMAP LOWERED ---
+        map_x = 150
+        map_y = CONTENT_TOP + 70
+        draw_minimap(map_x, map_y, tpos, 0.5)
+
+        # --- RADAR PULSE RING ---
+        pulse = (pulse + 1) % 30
+        radius = pulse
+
+        cx = map_x + 35
+        cy = map_y + 35
+
+        fade = max(20, 120 - radius * 4)
+        pulse_color = colour(0, fade, 0)
+
+        for angle in range(0, 360, 10):
+            rad = math.radians(angle)
+            px = int(cx + radius * math.cos(rad))
+            py = int(cy + radius * math.sin(rad))
+            if 0 <= px < 240 and 0 <= py < 240:
+                LCD.pixel(px, py, pulse_color)
+
+        # --- PULSING DOT ---
+        dot_radius = 3 + (pulse // 6)
+        dot_color = PIP_GREEN if found else PIP_DIM
+
+        dot_x = int(map_x + tpos * 70)
+        dot_y = int(map_y + 0.5 * 70)
+
+        for angle in range(0, 360, 20):
+            rad = math.radians(angle)
+            px = int(dot_x + dot_radius * math.cos(rad))
+            py = int(dot_y + dot_radius * math.sin(rad))
+            if 0 <= px < 240 and 0 <= py < 240:
+                LCD.pixel(px, py, dot_color)
+
+        LCD.pixel(dot_x, dot_y, dot_color)
+
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == keyB:
+            return
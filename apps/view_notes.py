@@ -0,0 +1,45 @@
+# ============================================================
+# VIEW NOTES app
+# ============================================================
+
+from __main__ import *
+
+async def run():
+    screen_flicker()
+    repeat = Repeat((up, down))
+
+    try:
+        with open("notes.txt") as f:
+            lines = f.read().splitlines()
+    except:
+        lines = ["NO NOTES FOUND"]
+
+    def draw_line(i, y, selected):
+        draw_med_text(10, y + 2, lines[i][:18], PIP_GREEN)
+
+    notes = ListView(CONTENT_TOP - 2, 18, 6, draw_line)
+    index = 0
+
+    pip_screen("VIEW NOTES")
+    draw_status_bar()
+    notes.draw(len(lines), index)
+    draw_footer("UP/DOWN: SCROLL", "B: BACK")
+    draw_noise(120)
+    LCD.show()
+
+    while True:
+        draw_status_bar()
+        notes.move(index)
+        LCD.show()
+
+        k = await next_frame(repeat=repeat)
+
+        if k == up:
+            index = max(0, index - 1)
+
+        if k == down:
+            if index < max(0, len(lines) - 6):
+                index += 1
+
+        if k == keyB:
+            return
@@ -0,0 +1,190 @@
+# ============================================================
+# WEATHER APP + UPDATER
+# ============================================================
+
+from __main__ import *
+import json
+
+def draw_icon(x, y, code, color):
+    # All icons are 12×12 pixel blocks
+
+    if code == "CLEAR":
+        # Simple sun: square center + rays
+        LCD.fill_rect(x+4, y+4, 4, 4, color)
+        LCD.pixel(x+6, y+1, color)
+        LCD.pixel(x+6, y+10, color)
+        LCD.pixel(x+1, y+6, color)
+        LCD.pixel(x+10, y+6, color)
+
+    elif code == "CLOUDY":
+        # Cloud shape using rectangles
+        LCD.fill_rect(x+2, y+6, 8, 4, color)
+        LCD.fill_rect(x+4, y+4, 6, 3, color)
+
+    elif code == "RAIN":
+        # Cloud + rain drops
+        LCD.fill_rect(x+2, y+4, 8, 4, color)
+        LCD.pixel(x+4, y+9, color)
+        LCD.pixel(x+7, y+9, color)
+        LCD.pixel(x+10, y+9, color)
+
+    elif code == "PART":
+        # Half sun + cloud
+        LCD.fill_rect(x+2, y+6, 8, 4, color)   # cloud
+        LCD.fill_rect(x+4, y+4, 3, 3, color)   # sun core
+        LCD.pixel(x+5, y+2, color)             # sun ray
+
+    else:
+        # Unknown → X
+        LCD.pixel(x+4, y+4, color)
+        LCD.pixel(x+7, y+7, color)
+        LCD.pixel(x+4, y+7, color)
+        LCD.pixel(x+7, y+4, color)
+
+# Weather Update
+def get_weather_data():
+    try:
+        with open("weather.json") as f:
+            data = json.loads(f.read())
+            return data
+    except:
+        # fallback if file missing or corrupted
+        return {
+            "today": ("ERR", "--", "NO DATA"),
+            "week": []
+        }
+
+# app
+async def run():
+    screen_flicker()
+    page = 0  # 0 = today, 1 = week
+
+    while True:
+        pip_screen("WEATHER")
+        draw_status_bar()
+
+        data = get_weather_data()
+
+        # -------------------------------
+        # TODAY VIEW
+        # -------------------------------
+        if page == 0:
+            day, temp, cond = data["today"]
+
+            # Icon
+            draw_icon(10, CONTENT_TOP, cond, PIP_GREEN)
+
+            # Text
+            draw_med_text(40, CONTENT_TOP, day, PIP_GREEN)
+            draw_med_text(40, CONTENT_TOP+24, temp, PIP_GREEN)
+            draw_med_text(40, CONTENT_TOP+48, cond, PIP_GREEN)
+
+            draw_footer("A: WEEK", "B: BACK")
+
+        # -------------------------------
+        # WEEK VIEW (7‑day grid)
+        # -------------------------------
+        else:
+            y = CONTENT_TOP
+            for d, t, c in data["week"]:
+                # Icon
+                draw_icon(10, y, c, PIP_GREEN)
+
+                # DAY TEMP COND
+                draw_small_text(30, y, d, PIP_GREEN)
+                draw_small_text(70, y, t, PIP_GREEN)
+                draw_small_text(120, y, c, PIP_GREEN)
+
+                y += 20
+
+            draw_footer("A: TODAY", "B: BACK")
+
+        draw_noise(120)
+        LCD.show()
+
+        # Controls
+        k = await next_frame()
+
+        if k == keyA:
+            page = 1 - page
+
+        if k == keyB:
+            return
+
+# Updater
+
+# Your location (Flint area)
+LAT = 43.0
+LON = -83.7
+
+# Map Open‑Meteo weather codes → TinyPIP condition strings
+def map_code(code):
+    if code in (0, 1):
+        return "CLEAR"
+    if code in (2,):
+        return "PART"
+    if code in (3,):
+        return "CLOUDY"
+    if code in (51, 53, 55, 61, 63, 65, 80, 81, 82):
+        return "RAIN"
+    return "CLOUDY"
+
+def update_weather():
+    import urequests
+    try:
+        # Request daily + current weather
+        url = (
+            "https://api.open-meteo.com/v1/forecast?"
+            f"latitude={LAT}&longitude={LON}"
+            "&current_weather=true"
+            "&daily=weathercode,temperature_2m_max"
+            "&timezone=auto"
+        )
+
+        r = urequests.get(url)
+        data = r.json()
+        r.close()
+
+        # -------------------------------
+        # TODAY
+        # -------------------------------
+        temp_now = int(data["current_weather"]["temperature"])
+        code_now = map_code(data["current_weather"]["weathercode"])
+
+        today = (
+            "TODAY",
+            f"{temp_now}F",
+            code_now
+        )
+
+        # -------------------------------
+        # WEEK (7‑day forecast)
+        # -------------------------------
+        week = []
+        days = ["MON","TUE","WED","THU","FRI","SAT","SUN"]
+
+        temps = data["daily"]["temperature_2m_max"]
+        codes = data["daily"]["weathercode"]
+
+        for i in range(7):
+            t = int(temps[i])
+            c = map_code(codes[i])
+            week.append((days[i], f"{t}F", c))
+
+        # -------------------------------
+        # FINAL STRUCTURE
+        # -------------------------------
+        final = {
+            "today": today,
+            "week": week
+        }
+
+        # Write to weather.json
+        with open("weather.json", "w") as f:
+            f.write(json.dumps(final))
+
+        return True
+
+    except Exception as e:
+        print("WEATHER UPDATE ERROR:", e)
+        return False
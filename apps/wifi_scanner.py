@@ -0,0 +1,109 @@
+# ============================================================
+# WIFI SCANNER + DETAILS
+# ============================================================
+
+from __main__ import *
+
+async def app_wifi_details(net):
+    ssid, bssid, channel, rssi, auth, hidden = net
+
+    freq = 2412
+    distance = 10 ** ((27.55 - (20 * math.log10(freq)) + abs(rssi)) / 20)
+
+    screen_flicker()
+    while True:
+        pip_screen("WIFI INFO")
+        draw_status_bar()
+
+        ssid_str = ssid.decode() if isinstance(ssid, bytes) else ssid
+        bssid_hex = ":".join(["{:02X}".format(b) for b in bssid])
+
+        draw_med_text(10, CONTENT_TOP,     "SSID: " + ssid_str[:12], PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+18,  "BSSID: " + bssid_hex, PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+36,  "RSSI: {} dBm".format(rssi), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+54,  "CHAN: {}".format(channel), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+72,  "DIST: {:.1f} m".format(distance), PIP_GREEN)
+
+        bar = max(0, min(100, 100 + rssi))
+        LCD.fill_rect(10, CONTENT_TOP+96, bar, 10, PIP_GREEN)
+
+        draw_footer("B: BACK", "")
+        draw_noise(120)
+        LCD.show()
+
+        k = await next_press(1000)
+
+        if k == keyB:
+            return
+
+async def run():
+    import network
+    screen_flicker()
+    wlan = network.WLAN(network.STA_IF)
+    if not wlan.active():
+        wlan.active(True)
+
+    nets = []
+    lines = []
+    index = 0
+
+    def draw_net(i, y, selected):
+        if selected:
+            LCD.fill_rect(0, y, 240, 18, PIP_BLACK)
+        draw_med_text(10, y + 2, lines[i], PIP_GREEN)
+
+    net_list = ListView(CONTENT_TOP - 2, 18, 6, draw_net)
+    redraw = True
+
+    while True:
+        try:
+            nets = wlan.scan()
+        except:
+            nets = []
+
+        if index >= len(nets):
+            index = max(0, len(nets) - 1)
+
+        found = []
+        for n in nets:
+            ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
+            found.append("{} ({})".format(ssid[:10], n[3]))
+
+        if redraw:
+            pip_clear()
+            pip_title("WIFI SCANNER")
+            draw_footer("A: DETAILS", "B: BACK")
+            draw_noise(120)
+
+        old_lines = lines
+        lines = found
+
+        if not found:
+            if redraw or old_lines:
+                LCD.fill_rect(3, CONTENT_TOP - 2, 234, 108, PIP_DARK)
+                draw_med_text(10, CONTENT_TOP, "NO NETWORKS FOUND", PIP_GREEN)
+        elif redraw or found != old_lines:
+            net_list.draw(len(lines), index, index)
+        else:
+            net_list.move(index, index)
+        redraw = False
+
+        draw_status_bar()
+        LCD.show()
+
+        k = await next_frame()
+
+        if k == up:
+            if index > 0:
+                index -= 1
+
+        if k == down:
+            if nets and index < len(nets) - 1:
+                index += 1
+
+        if k == keyA and nets:
+            await app_wifi_details(nets[index])
+            redraw = True
+
+        if k == keyB:
+            return
@@ -0,0 +1,65 @@
+# ============================================================
+# tinyPIP FONT BUILDER (host only, not saved on device)
+# ============================================================
+
+# Packs the ASCII-art glyphs in fonts_src.py into fonts.py as bytes
+# constants. Run with desktop Python after editing fonts_src.py:
+#
+#     python build_fonts.py
+#
+# Each glyph is stored 1x as MONO_HLSB rows, STRIDE bytes per glyph,
+# so the device can wrap a slice in a FrameBuffer without parsing
+# strings. Freeze fonts.py into the firmware and the data stays in
+# flash instead of the heap; a .py or .mpy on the filesystem is
+# loaded into RAM.
+
+from fonts_src import BIG_FONT, MED_FONT
+
+OUT = "fonts.py"
+
+def pack_glyph(pattern, height, row_bytes):
+    data = bytearray(row_bytes * height)
+    for row, line in enumerate(pattern):
+        for col, pixel in enumerate(line):
+            if pixel == "#":
+                data[row * row_bytes + col // 8] |= 0x80 >> (col % 8)
+    return data
+
+def pack_font(name, font):
+    chars = "".join(font)
+    height = max(len(p) for p in font.values())
+    width = max(len(line) for p in font.values() for line in p)
+    row_bytes = (width + 7) // 8
+    widths = bytearray()
+    data = bytearray()
+    for ch in chars:
+        pattern = font[ch]
+        widths.append(max(len(line) for line in pattern))
+        data += pack_glyph(pattern, height, row_bytes)
+
+    out = []
+    out.append("%s_CHARS = %r" % (name, chars))
+    out.append("%s_H = %d" % (name, height))
+    out.append("%s_STRIDE = %d" % (name, row_bytes * height))
+    out.append("%s_WIDTHS = %r" % (name, bytes(widths)))
+    out.append("%s_DATA = (" % name)
+    stride = row_bytes * height
+    for i, ch in enumerate(chars):
+        out.append("    %r  # %r" % (bytes(data[i*stride:(i+1)*stride]), ch))
+    out.append(")")
+    return "\n".join(out)
+
+def main():
+    lines = [
+        "# Generated by build_fonts.py from fonts_src.py -- do not edit.",
+        "",
+        pack_font("BIG", BIG_FONT),
+        "",
+        pack_font("MED", MED_FONT),
+        "",
+    ]
+    with open(OUT, "w", newline="\r\n") as f:
+        f.write("\n".join(lines))
+    print("wrote", OUT, len(BIG_FONT), "big +", len(MED_FONT), "med glyphs")
+
+main()
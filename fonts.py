@@ -0,0 +1,92 @@
+# Generated by build_fonts.py from fonts_src.py -- do not edit.
+
+BIG_CHARS = '0123456789:'
+BIG_H = 8
+BIG_STRIDE = 8
+BIG_WIDTHS = b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x03'
+BIG_DATA = (
+    b'~\xc3\xc7\xcb\xd3\xe3\xc3~'  # '0'
+    b'\x18x\x18\x18\x18\x18\x18~'  # '1'
+    b'~\xc3\x03\x06\x1c0`\xff'  # '2'
+    b'~\xc3\x03\x1e\x03\x03\xc3~'  # '3'
+    b'\xc6\xc6\xc6\xc6\xff\x06\x06\x06'  # '4'
+    b'\xff\xc0\xc0\xfc\x06\x06\xc6~'  # '5'
+    b'~\xc3\xc0\xfc\xc6\xc6\xc6~'  # '6'
+    b'\xff\x06\x0c\x180`\xc0\xc0'  # '7'
+    b'~\xc3\xc3~\xc3\xc3\xc3~'  # '8'
+    b'~\xc3\xc3\x7f\x03\x03\xc3~'  # '9'
+    b'\x00\xc0\xc0\x00\x00\xc0\xc0\x00'  # ':'
+)
+
+MED_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-:/ abcdefghijklmnopqrstuvwxyz'
+MED_H = 8
+MED_STRIDE = 16
+MED_WIDTHS = b'\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\n\x04\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n'
+MED_DATA = (
+    b'\x1e\x003\x00a\x80a\x80\x7f\x80a\x80a\x80a\x80'  # 'A'
+    b'\x7f\x00a\x80a\x80\x7f\x00a\x80a\x80a\x80\x7f\x00'  # 'B'
+    b'?\x00a\x80`\x00`\x00`\x00`\x00a\x80?\x00'  # 'C'
+    b'\x7f\x00a\x80a\x80a\x80a\x80a\x80a\x80\x7f\x00'  # 'D'
+    b'\x7f\x80`\x00`\x00\x7f\x00`\x00`\x00`\x00\x7f\x80'  # 'E'
+    b'\x7f\x80`\x00`\x00\x7f\x00`\x00`\x00`\x00`\x00'  # 'F'
+    b'?\x00a\x80`\x00g\x80a\x80a\x80a\x80?\x00'  # 'G'
+    b'a\x80a\x80a\x80\x7f\x80a\x80a\x80a\x80a\x80'  # 'H'
+    b'\x7f\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x7f\x00'  # 'I'
+    b'\x07\x00\x03\x00\x03\x00\x03\x00\x03\x00c\x00c\x00>\x00'  # 'J'
+    b'c\x00f\x00l\x00x\x00x\x00l\x00f\x00c\x00'  # 'K'
+    b'`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x7f\x80'  # 'L'
+    b'a\x80s\x80\x7f\x80m\x80a\x80a\x80a\x80a\x80'  # 'M'
+    b'a\x80q\x80y\x80m\x80g\x80c\x80a\x80a\x80'  # 'N'
+    b'?\x00a\x80a\x80a\x80a\x80a\x80a\x80?\x00'  # 'O'
+    b'\x7f\x00a\x80a\x80\x7f\x00`\x00`\x00`\x00`\x00'  # 'P'
+    b'?\x00a\x80a\x80a\x80e\x80c\x80a\x80?\x80'  # 'Q'
+    b'\x7f\x00a\x80a\x80\x7f\x00f\x00c\x00a\x80a\x80'  # 'R'
+    b'?\x00a\x80`\x00?\x00\x01\x80\x01\x80a\x80?\x00'  # 'S'
+    b'\x7f\x80\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00'  # 'T'
+    b'a\x80a\x80a\x80a\x80a\x80a\x80a\x80?\x00'  # 'U'
+    b'a\x80a\x80a\x80a\x803\x00\x1e\x00\x1e\x00\x0c\x00'  # 'V'
+    b'a\x80a\x80a\x80m\x80\x7f\x80s\x80a\x80a\x80'  # 'W'
+    b'a\x803\x00\x1e\x00\x0c\x00\x1e\x003\x00a\x80a\x80'  # 'X'
+    b'a\x80a\x803\x00\x1e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00'  # 'Y'
+    b'\x7f\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00\x7f\x80'  # 'Z'
+    b'?\x00a\x80c\x80e\x80i\x80q\x80a\x80?\x00'  # '0'
+    b'\x18\x00x\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00~\x00'  # '1'
+    b'?\x00a\x80\x01\x80\x06\x00\x1c\x000\x00`\x00\x7f\x80'  # '2'
+    b'?\x00a\x80\x01\x80\x1e\x00\x01\x80\x01\x80a\x80?\x00'  # '3'
+    b'c\x00c\x00c\x00\x7f\x80\x03\x00\x03\x00\x03\x00\x03\x00'  # '4'
+    b'\x7f\x80`\x00`\x00~\x00\x03\x00\x03\x00c\x00?\x00'  # '5'
+    b'?\x00a\x80`\x00~\x00c\x00c\x00c\x00?\x00'  # '6'
+    b'\x7f\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00`\x00'  # '7'
+    b'?\x00a\x80a\x80?\x00a\x80a\x80a\x80?\x00'  # '8'
+    b'?\x00a\x80a\x80?\x80\x01\x80\x01\x80a\x80?\x00'  # '9'
+    b'\x00\x00\x00\x00\x00\x00?\x00?\x00\x00\x00\x00\x00\x00\x00'  # '-'
+    b'\x00\x00`\x00`\x00\x00\x00\x00\x00`\x00`\x00\x00\x00'  # ':'
+    b'\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00\xc0\x00\x00\x00'  # '/'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # ' '
+    b'\x00\x00\x1e\x00\x01\x80\x1f\x801\x801\x80\x1f\x80\x00\x00'  # 'a'
+    b'`\x00`\x00o\x00q\x80a\x80a\x80q\x80?\x00'  # 'b'
+    b'\x00\x00\x1f\x001\x80`\x00`\x001\x80\x1f\x00\x00\x00'  # 'c'
+    b'\x01\x80\x01\x80\x1f\x801\xc0a\x80a\x801\xc0\x1f\x80'  # 'd'
+    b'\x00\x00\x1f\x001\x80\x7f\x80`\x001\x80\x1f\x00\x00\x00'  # 'e'
+    b'\x0f\x00\x18\x00\x7f\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00'  # 'f'
+    b'\x00\x00\x1f\x801\x801\x80\x1f\x80\x01\x801\x80\x1f\x00'  # 'g'
+    b'`\x00`\x00o\x00s\x00c\x00c\x00c\x00\x00\x00'  # 'h'
+    b'\x18\x00\x00\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00'  # 'i'
+    b'\x06\x00\x00\x00\x06\x00\x06\x00\x06\x00f\x00f\x00<\x00'  # 'j'
+    b'`\x00c\x00f\x00x\x00x\x00f\x00c\x00\x00\x00'  # 'k'
+    b'0\x000\x000\x000\x000\x000\x00\x1e\x00\x00\x00'  # 'l'
+    b'\x00\x00{\x00m\x80m\x80m\x80a\x80a\x80\x00\x00'  # 'm'
+    b'\x00\x00o\x00s\x00c\x00c\x00c\x00c\x00\x00\x00'  # 'n'
+    b'\x00\x00\x1e\x003\x00a\x80a\x803\x00\x1e\x00\x00\x00'  # 'o'
+    b'\x00\x00o\x00q\x80a\x80q\x80\x7f\x00`\x00`\x00'  # 'p'
+    b'\x00\x00\x1f\x801\x80a\x80c\x80=\x80\x01\x80\x01\x80'  # 'q'
+    b'\x00\x00o\x00q\x80`\x00`\x00`\x00`\x00\x00\x00'  # 'r'
+    b'\x00\x00?\x00a\x80\x1c\x00\x03\x80a\x80?\x00\x00\x00'  # 's'
+    b'\x18\x00\x18\x00\x7f\x00\x18\x00\x18\x00\x18\x00\x0f\x00\x00\x00'  # 't'
+    b'\x00\x00c\x00c\x00c\x00c\x00c\x00?\x00\x00\x00'  # 'u'
+    b'\x00\x00c\x00c\x006\x006\x00\x1c\x00\x08\x00\x00\x00'  # 'v'
+    b'\x00\x00c\x00c\x00k\x00\x7f\x80w\x00c\x00\x00\x00'  # 'w'
+    b'\x00\x00c\x006\x00\x1c\x00\x1c\x006\x00c\x00\x00\x00'  # 'x'
+    b'\x00\x00c\x00c\x006\x00\x1c\x00\x0c\x00\x18\x00x\x00'  # 'y'
+    b'\x00\x00\x7f\x00\x06\x00\x0c\x00\x18\x000\x00\x7f\x00\x00\x00'  # 'z'
+)
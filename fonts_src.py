@@ -0,0 +1,810 @@
+# ============================================================
+# tinyPIP FONT SOURCE (host only, not saved on device)
+# ============================================================
+
+# Edit glyphs here, then run "python build_fonts.py" to regenerate fonts.py.
+# Each glyph is a list of rows; "#" is a lit pixel.
+
+BIG_FONT = {
+    "0": [
+        " ###### ",
+        "##    ##",
+        "##   ###",
+        "##  # ##",
+        "## #  ##",
+        "###   ##",
+        "##    ##",
+        " ###### "
+    ],
+    "1": [
+        "   ##   ",
+        " ####   ",
+        "   ##   ",
+        "   ##   ",
+        "   ##   ",
+        "   ##   ",
+        "   ##   ",
+        " ###### "
+    ],
+    "2": [
+        " ###### ",
+        "##    ##",
+        "      ##",
+        "     ## ",
+        "   ###  ",
+        "  ##    ",
+        " ##     ",
+        "########"
+    ],
+    "3": [
+        " ###### ",
+        "##    ##",
+        "      ##",
+        "   #### ",
+        "      ##",
+        "      ##",
+        "##    ##",
+        " ###### "
+    ],
+    "4": [
+        "##   ## ",
+        "##   ## ",
+        "##   ## ",
+        "##   ## ",
+        "########",
+        "     ## ",
+        "     ## ",
+        "     ## "
+    ],
+    "5": [
+        "########",
+        "##      ",
+        "##      ",
+        "######  ",
+        "     ## ",
+        "     ## ",
+        "##   ## ",
+        " ###### "
+    ],
+    "6": [
+        " ###### ",
+        "##    ##",
+        "##      ",
+        "######  ",
+        "##   ## ",
+        "##   ## ",
+        "##   ## ",
+        " ###### "
+    ],
+    "7": [
+        "########",
+        "     ## ",
+        "    ##  ",
+        "   ##   ",
+        "  ##    ",
+        " ##     ",
+        "##      ",
+        "##      "
+    ],
+    "8": [
+        " ###### ",
+        "##    ##",
+        "##    ##",
+        " ###### ",
+        "##    ##",
+        "##    ##",
+        "##    ##",
+        " ###### "
+    ],
+    "9": [
+        " ###### ",
+        "##    ##",
+        "##    ##",
+        " #######",
+        "      ##",
+        "      ##",
+        "##    ##",
+        " ###### "
+    ],
+    ":": [
+        "   ",
+        "## ",
+        "## ",
+        "   ",
+        "   ",
+        "## ",
+        "## ",
+        "   "
+    ]
+}
+
+MED_FONT = {
+    "A": [
+        "   ####    ",
+        "  ##  ##   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ########  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "B": [
+        " #######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " #######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " #######   "
+    ],
+    "C": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "D": [
+        " #######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " #######   "
+    ],
+    "E": [
+        " ########  ",
+        " ##        ",
+        " ##        ",
+        " #######   ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ########  "
+    ],
+    "F": [
+        " ########  ",
+        " ##        ",
+        " ##        ",
+        " #######   ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        "
+    ],
+    "G": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##        ",
+        " ##  ####  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "H": [
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ########  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "I": [
+        " #######   ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        " #######   "
+    ],
+    "J": [
+        "     ###   ",
+        "      ##   ",
+        "      ##   ",
+        "      ##   ",
+        "      ##   ",
+        " ##   ##   ",
+        " ##   ##   ",
+        "  #####    "
+    ],
+    "K": [
+        " ##   ##   ",
+        " ##  ##    ",
+        " ## ##     ",
+        " ####      ",
+        " ####      ",
+        " ## ##     ",
+        " ##  ##    ",
+        " ##   ##   "
+    ],
+    "L": [
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ########  "
+    ],
+    "M": [
+        " ##    ##  ",
+        " ###  ###  ",
+        " ########  ",
+        " ## ## ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "N": [
+        " ##    ##  ",
+        " ###   ##  ",
+        " ####  ##  ",
+        " ## ## ##  ",
+        " ##  ####  ",
+        " ##   ###  ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "O": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "P": [
+        " #######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " #######   ",
+        " ##        ",
+        " ##        ",
+        " ##        ",
+        " ##        "
+    ],
+    "Q": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##  # ##  ",
+        " ##   ###  ",
+        " ##    ##  ",
+        "  #######  "
+    ],
+    "R": [
+        " #######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " #######   ",
+        " ##  ##    ",
+        " ##   ##   ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "S": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##        ",
+        "  ######   ",
+        "       ##  ",
+        "       ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "T": [
+        " ########  ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     "
+    ],
+    "U": [
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "V": [
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ##  ##   ",
+        "   ####    ",
+        "   ####    ",
+        "    ##     "
+    ],
+    "W": [
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ## ## ##  ",
+        " ########  ",
+        " ###  ###  ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "X": [
+        " ##    ##  ",
+        "  ##  ##   ",
+        "   ####    ",
+        "    ##     ",
+        "   ####    ",
+        "  ##  ##   ",
+        " ##    ##  ",
+        " ##    ##  "
+    ],
+    "Y": [
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ##  ##   ",
+        "   ####    ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     ",
+        "    ##     "
+    ],
+    "Z": [
+        " ########  ",
+        "      ##   ",
+        "     ##    ",
+        "    ##     ",
+        "   ##      ",
+        "  ##       ",
+        " ##        ",
+        " ########  "
+    ],
+
+    "0": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##   ###  ",
+        " ##  # ##  ",
+        " ## #  ##  ",
+        " ###   ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "1": [
+        "   ##      ",
+        " ####      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        "   ##      ",
+        " ######    "
+    ],
+    "2": [
+        "  ######   ",
+        " ##    ##  ",
+        "       ##  ",
+        "     ##    ",
+        "   ###     ",
+        "  ##       ",
+        " ##        ",
+        " ########  "
+    ],
+    "3": [
+        "  ######   ",
+        " ##    ##  ",
+        "       ##  ",
+        "   ####    ",
+        "       ##  ",
+        "       ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "4": [
+        " ##   ##   ",
+        " ##   ##   ",
+        " ##   ##   ",
+        " ########  ",
+        "      ##   ",
+        "      ##   ",
+        "      ##   ",
+        "      ##   "
+    ],
+    "5": [
+        " ########  ",
+        " ##        ",
+        " ##        ",
+        " ######    ",
+        "      ##   ",
+        "      ##   ",
+        " ##   ##   ",
+        "  ######   "
+    ],
+    "6": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##        ",
+        " ######    ",
+        " ##   ##   ",
+        " ##   ##   ",
+        " ##   ##   ",
+        "  ######   "
+    ],
+    "7": [
+        " ########  ",
+        "      ##   ",
+        "     ##    ",
+        "    ##     ",
+        "   ##      ",
+        "  ##       ",
+        " ##        ",
+        " ##        "
+    ],
+    "8": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+    "9": [
+        "  ######   ",
+        " ##    ##  ",
+        " ##    ##  ",
+        "  #######  ",
+        "       ##  ",
+        "       ##  ",
+        " ##    ##  ",
+        "  ######   "
+    ],
+
+    "-": [
+        "          ",
+        "          ",
+        "          ",
+        "  ######  ",
+        "  ######  ",
+        "          ",
+        "          ",
+        "          "
+    ],
+    ":": [
+        "    ",
+        " ## ",
+        " ## ",
+        "    ",
+        "    ",
+        " ## ",
+        " ## ",
+        "    "
+    ],
+    "/": [
+        "      ##  ",
+        "     ##   ",
+        "    ##    ",
+        "   ##     ",
+        "  ##      ",
+        " ##       ",
+        "##        ",
+        "          "
+    ],
+    " ": [
+        "          ",
+        "          ",
+        "          ",
+        "          ",
+        "          ",
+        "          ",
+        "          ",
+        "          "
+    ],
+}
+# --- LOWERCASE MED FONT ---
+MED_FONT["a"] = [
+    "          ",
+    "   ####   ",
+    "       ## ",
+    "   ###### ",
+    "  ##   ## ",
+    "  ##   ## ",
+    "   ###### ",
+    "          "
+]
+
+MED_FONT["b"] = [
+    " ##       ",
+    " ##       ",
+    " ## ####  ",
+    " ###   ## ",
+    " ##    ## ",
+    " ##    ## ",
+    " ###   ## ",
+    "  ######  "
+]
+
+MED_FONT["c"] = [
+    "          ",
+    "   #####  ",
+    "  ##   ## ",
+    " ##       ",
+    " ##       ",
+    "  ##   ## ",
+    "   #####  ",
+    "          "
+]
+
+MED_FONT["d"] = [
+    "       ## ",
+    "       ## ",
+    "   ###### ",
+    "  ##   ###",
+    " ##    ## ",
+    " ##    ## ",
+    "  ##   ###",
+    "   ###### "
+]
+
+MED_FONT["e"] = [
+    "          ",
+    "   #####  ",
+    "  ##   ## ",
+    " ######## ",
+    " ##       ",
+    "  ##   ## ",
+    "   #####  ",
+    "          "
+]
+
+MED_FONT["f"] = [
+    "    ####  ",
+    "   ##     ",
+    " #######  ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "          "
+]
+
+MED_FONT["g"] = [
+    "          ",
+    "   ###### ",
+    "  ##   ## ",
+    "  ##   ## ",
+    "   ###### ",
+    "       ## ",
+    "  ##   ## ",
+    "   #####  "
+]
+
+MED_FONT["h"] = [
+    " ##       ",
+    " ##       ",
+    " ## ####  ",
+    " ###  ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    "          "
+]
+
+MED_FONT["i"] = [
+    "   ##     ",
+    "          ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "          "
+]
+
+MED_FONT["j"] = [
+    "     ##   ",
+    "          ",
+    "     ##   ",
+    "     ##   ",
+    "     ##   ",
+    " ##  ##   ",
+    " ##  ##   ",
+    "  ####    "
+]
+
+MED_FONT["k"] = [
+    " ##       ",
+    " ##   ##  ",
+    " ##  ##   ",
+    " ####     ",
+    " ####     ",
+    " ##  ##   ",
+    " ##   ##  ",
+    "          "
+]
+
+MED_FONT["l"] = [
+    "  ##      ",
+    "  ##      ",
+    "  ##      ",
+    "  ##      ",
+    "  ##      ",
+    "  ##      ",
+    "   ####   ",
+    "          "
+]
+
+MED_FONT["m"] = [
+    "          ",
+    " #### ##  ",
+    " ## ## ## ",
+    " ## ## ## ",
+    " ## ## ## ",
+    " ##    ## ",
+    " ##    ## ",
+    "          "
+]
+
+MED_FONT["n"] = [
+    "          ",
+    " ## ####  ",
+    " ###  ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    "          "
+]
+
+MED_FONT["o"] = [
+    "          ",
+    "   ####   ",
+    "  ##  ##  ",
+    " ##    ## ",
+    " ##    ## ",
+    "  ##  ##  ",
+    "   ####   ",
+    "          "
+]
+
+MED_FONT["p"] = [
+    "          ",
+    " ## ####  ",
+    " ###   ## ",
+    " ##    ## ",
+    " ###   ## ",
+    " #######  ",
+    " ##       ",
+    " ##       "
+]
+
+MED_FONT["q"] = [
+    "          ",
+    "   ###### ",
+    "  ##   ## ",
+    " ##    ## ",
+    " ##   ### ",
+    "  #### ## ",
+    "       ## ",
+    "       ## "
+]
+
+MED_FONT["r"] = [
+    "          ",
+    " ## ####  ",
+    " ###   ## ",
+    " ##       ",
+    " ##       ",
+    " ##       ",
+    " ##       ",
+    "          "
+]
+
+MED_FONT["s"] = [
+    "          ",
+    "  ######  ",
+    " ##    ## ",
+    "   ###    ",
+    "      ### ",
+    " ##    ## ",
+    "  ######  ",
+    "          "
+]
+
+MED_FONT["t"] = [
+    "   ##     ",
+    "   ##     ",
+    " #######  ",
+    "   ##     ",
+    "   ##     ",
+    "   ##     ",
+    "    ####  ",
+    "          "
+]
+
+MED_FONT["u"] = [
+    "          ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ##   ##  ",
+    "  ######  ",
+    "          "
+]
+
+MED_FONT["v"] = [
+    "          ",
+    " ##   ##  ",
+    " ##   ##  ",
+    "  ## ##   ",
+    "  ## ##   ",
+    "   ###    ",
+    "    #     ",
+    "          "
+]
+
+MED_FONT["w"] = [
+    "          ",
+    " ##   ##  ",
+    " ##   ##  ",
+    " ## # ##  ",
+    " ######## ",
+    " ### ###  ",
+    " ##   ##  ",
+    "          "
+]
+
+MED_FONT["x"] = [
+    "          ",
+    " ##   ##  ",
+    "  ## ##   ",
+    "   ###    ",
+    "   ###    ",
+    "  ## ##   ",
+    " ##   ##  ",
+    "          "
+]
+
+MED_FONT["y"] = [
+    "          ",
+    " ##   ##  ",
+    " ##   ##  ",
+    "  ## ##   ",
+    "   ###    ",
+    "    ##    ",
+    "   ##     ",
+    " ####     "
+]
+
+MED_FONT["z"] = [
+    "          ",
+    " #######  ",
+    "     ##   ",
+    "    ##    ",
+    "   ##     ",
+    "  ##      ",
+    " #######  ",
+    "          "
+]
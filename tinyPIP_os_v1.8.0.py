@@ -9,21 +9,36 @@ UPDATE_STATE = 0
 UPDATE_STATE_TIME = 0
 
 from machine import Pin, SPI, PWM, RTC
-import framebuf
 import utime
+
+# boot phases as raw ticks_ms, which on rp2 count from reset, so the
+# "main" mark is what firmware start-up and boot.py took; saved to
+# BOOT_TIMES_FILE once the first menu frame is up
+BOOT_MARKS = []
+
+def boot_mark(name):
+    BOOT_MARKS.append((name, utime.ticks_ms()))
+
+boot_mark("main")
+
+import framebuf
+import micropython
+import array
 import os
+import sys
 import gc
-import network
 import urandom
+import uasyncio as asyncio
 import math
 import random
-from wifi_update import wifi_fallback_update
+from collections import OrderedDict
+import fonts
 
-try:
-    import bluetooth
-    HAS_BLE = True
-except:
-    HAS_BLE = False
+# network, bluetooth, urequests and wifi_update are imported by the
+# apps that use them, so they cost nothing at boot. The apps themselves
+# are modules in apps/, imported when opened (see APP REGISTRY).
+
+boot_mark("imports")
 
 rtc = RTC()
 
@@ -32,6 +47,7 @@ OS_YEAR    = "2026"
 
 LAST_UPDATE_OK = False
 LAST_UPDATE_TIME = 0
+LAST_UPDATE_STEPS = []
 
 # ============================================================
 # LCD DRIVER
@@ -44,11 +60,121 @@ MOSI = 11
 SCK = 10
 CS = 9
 
+# ST7789 register setup as (command, parameters) pairs. These are packed
+# once by compile_cmd_stream() so sending them allocates nothing.
+ST7789_INIT = (
+    (0x36, b"\x70"),
+    (0x3A, b"\x05"),
+    (0xB2, b"\x0C\x0C\x00\x33\x33"),
+    (0xB7, b"\x35"),
+    (0xBB, b"\x19"),
+    (0xC0, b"\x2C"),
+    (0xC2, b"\x01"),
+    (0xC3, b"\x12"),
+    (0xC4, b"\x20"),
+    (0xC6, b"\x0F"),
+    (0xD0, b"\xA4\xA1"),
+    (0xE0, b"\xD0\x04\x0D\x11\x13\x2B\x3F\x54\x4C\x18\x0D\x0B\x1F\x23"),
+    (0xE1, b"\xD0\x04\x0C\x11\x13\x2C\x3F\x44\x51\x2F\x1F\x1F\x20\x23"),
+    (0x21, b""),
+    (0x11, b""),
+    (0x29, b""),
+)
+
+# CASET / RASET / RAMWR. set_window() patches the coordinates in place.
+ST7789_WINDOW = (
+    (0x2A, b"\x00\x00\x00\xEF"),
+    (0x2B, b"\x00\x00\x00\xEF"),
+    (0x2C, b""),
+)
+
+def compile_cmd_stream(table):
+    size = 0
+    for cmd, args in table:
+        size += 1 + len(args)
+
+    buf = bytearray(size)
+    mv = memoryview(buf)
+    stream = []
+    i = 0
+    for cmd, args in table:
+        n = len(args)
+        buf[i] = cmd
+        buf[i+1:i+1+n] = args
+        stream.append((mv[i:i+1], mv[i+1:i+1+n]))
+        i += 1 + n
+    return buf, stream
+
+# Dirty rectangles: show() only pushes the regions drawn since the last
+# flush. Past DIRTY_FULL_PCT of the screen a single full frame is cheaper.
+DIRTY_MAX_RECTS = 6
+DIRTY_FULL_PCT = 60
+
+# Strip mode: draw into a 240 x LCD_STRIP_ROWS band instead of a full
+# 240x240 framebuffer. Drawing calls go into a display list that show()
+# replays once per band, trading CPU for ~95 KB of RAM. 0 = full buffer.
+LCD_STRIP_ROWS = 0
+
+# Framebuffer depth. 16 = RGB565. 8 (GS8) and 4 (GS4) store palette
+# slots and are expanded to RGB565 through a lookup table while
+# streaming, cutting framebuffer memory to 1/2 or 1/4.
+LCD_COLOR_DEPTH = 16
+LUT_CHUNK_ROWS = 8
+
+# Async flush: core 1 streams finished frames (or bands) over SPI while
+# core 0 renders the next one. Costs a transmit buffer the size of the
+# framebuffer or strip.
+LCD_ASYNC_FLUSH = False
+
+@micropython.viper
+def expand_indexed(dst, src, lut, args):
+    # args: pixel offset, width, rows, row stride (pixels), depth
+    a = ptr32(args)
+    off = a[0]
+    w = a[1]
+    rows = a[2]
+    stride = a[3]
+    depth = a[4]
+    d = ptr16(dst)
+    s = ptr8(src)
+    t = ptr16(lut)
+    j = 0
+    while rows > 0:
+        i = 0
+        while i < w:
+            p = off + i
+            if depth == 8:
+                v = s[p]
+            elif p & 1:
+                v = s[p >> 1] & 0x0F
+            else:
+                v = s[p >> 1] >> 4
+            d[j] = t[v]
+            i += 1
+            j += 1
+        off += stride
+        rows -= 1
+
 class LCD_1inch3(framebuf.FrameBuffer):
-    def __init__(self):
+    def __init__(self, strip_rows=0, depth=16, lut=None):
         self.width = 240
         self.height = 240
-        
+
+        # [x0, y0, x1, y1) rectangles waiting for show()
+        self.dirty = []
+        self.dirty_full = True
+
+        # strip mode state; band_y is the screen row of buffer row 0
+        self.strip_rows = strip_rows
+        self.band_y = 0
+        self.ops = []
+        self.recording = strip_rows > 0
+        self.replaying = False
+        self.async_flush = False
+
+        # called after every show(); see LATENCY
+        self.on_show = None
+
         self.cs = Pin(CS, Pin.OUT)
         self.rst = Pin(RST, Pin.OUT)
         
@@ -59,8 +185,25 @@ class LCD_1inch3(framebuf.FrameBuffer):
                        sck=Pin(SCK), mosi=Pin(MOSI), miso=None)
         self.dc = Pin(DC, Pin.OUT)
         self.dc(1)
-        self.buffer = bytearray(self.height * self.width * 2)
-        super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
+
+        self._win, self._win_stream = compile_cmd_stream(ST7789_WINDOW)
+
+        # indexed modes expand through lut into a small row chunk
+        self.depth = depth
+        self.lut = lut
+        if depth == 16:
+            fmt = framebuf.RGB565
+        else:
+            fmt = framebuf.GS8 if depth == 8 else framebuf.GS4_HMSB
+            self._chunk = bytearray(self.width * 2 * LUT_CHUNK_ROWS)
+            self._chunk_mv = memoryview(self._chunk)
+            self._xargs = array.array("i", [0, 0, 0, self.width, depth])
+
+        rows = strip_rows or self.height
+        self.buffer = bytearray(rows * self.width * depth // 8)
+        self._mv = memoryview(self.buffer)
+        self.fmt = fmt
+        super().__init__(self.buffer, self.width, rows, fmt)
         self.init_display()
         
         self.red   = 0x07E0
@@ -68,94 +211,426 @@ class LCD_1inch3(framebuf.FrameBuffer):
         self.blue  = 0xf800
         self.white = 0xffff
         
-    def write_cmd(self, cmd):
-        self.cs(1)
-        self.dc(0)
-        self.cs(0)
-        self.spi.write(bytearray([cmd]))
-        self.cs(1)
-
-    def write_data(self, buf):
-        self.cs(1)
-        self.dc(1)
-        self.cs(0)
-        self.spi.write(bytearray([buf]))
-        self.cs(1)
+    def send_stream(self, stream):
+        # caller holds CS low; only DC flips between command and data
+        dc = self.dc
+        spi = self.spi
+        for cmd, args in stream:
+            dc(0)
+            spi.write(cmd)
+            if len(args):
+                dc(1)
+                spi.write(args)
 
     def init_display(self):
         self.rst(1)
         self.rst(0)
         self.rst(1)
-        
-        self.write_cmd(0x36)
-        self.write_data(0x70)
 
-        self.write_cmd(0x3A)
-        self.write_data(0x05)
+        _, stream = compile_cmd_stream(ST7789_INIT)
+        self.cs(0)
+        self.send_stream(stream)
+        self.cs(1)
+
+    # --------------------------------------------------------
+    # DIRTY TRACKING
+    # --------------------------------------------------------
+
+    def invalidate(self):
+        if self.replaying:
+            return
+        self.dirty_full = True
+        self.dirty.clear()
+
+    def mark_dirty(self, x, y, w, h):
+        if self.dirty_full or self.replaying:
+            return
 
-        self.write_cmd(0xB2)
-        for v in [0x0C,0x0C,0x00,0x33,0x33]:
-            self.write_data(v)
+        # clip to the panel
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        x = max(0, x)
+        y = max(0, y)
+        if x >= x1 or y >= y1:
+            return
 
-        self.write_cmd(0xB7)
-        self.write_data(0x35)
+        rects = self.dirty
 
-        self.write_cmd(0xBB)
-        self.write_data(0x19)
+        # grow an existing rect if this one touches it
+        hit = None
+        for r in rects:
+            if x <= r[2] and r[0] <= x1 and y <= r[3] and r[1] <= y1:
+                hit = r
+                break
 
-        self.write_cmd(0xC0)
-        self.write_data(0x2C)
+        if hit is None and len(rects) >= DIRTY_MAX_RECTS:
+            # out of slots: merge into the rect that grows the least
+            best = -1
+            for r in rects:
+                grow = ((max(r[2], x1) - min(r[0], x)) * (max(r[3], y1) - min(r[1], y))
+                        - (r[2] - r[0]) * (r[3] - r[1]))
+                if best < 0 or grow < best:
+                    best = grow
+                    hit = r
+
+        if hit is None:
+            rects.append([x, y, x1, y1])
+        else:
+            hit[0] = min(hit[0], x)
+            hit[1] = min(hit[1], y)
+            hit[2] = max(hit[2], x1)
+            hit[3] = max(hit[3], y1)
+
+            # the grown rect may now swallow others
+            i = 0
+            while i < len(rects):
+                r = rects[i]
+                if r is not hit and r[0] <= hit[2] and hit[0] <= r[2] and r[1] <= hit[3] and hit[1] <= r[3]:
+                    hit[0] = min(hit[0], r[0])
+                    hit[1] = min(hit[1], r[1])
+                    hit[2] = max(hit[2], r[2])
+                    hit[3] = max(hit[3], r[3])
+                    rects.pop(i)
+                    i = 0
+                else:
+                    i += 1
+
+        area = 0
+        for r in rects:
+            area += (r[2] - r[0]) * (r[3] - r[1])
+        if area * 100 >= self.width * self.height * DIRTY_FULL_PCT:
+            self.invalidate()
+
+    # --------------------------------------------------------
+    # DISPLAY LIST (STRIP MODE)
+    # --------------------------------------------------------
+
+    def record(self, fn, args, x, y, w, h, opaque=False):
+        # In strip mode the call is queued for show() instead of drawn.
+        # Returns False when the caller should draw immediately.
+        if not self.recording:
+            return False
+        self.mark_dirty(x, y, w, h)
+        x1 = x + w
+        y1 = y + h
+        if opaque:
+            # drop entries this one paints over, so screens that redraw
+            # parts of themselves keep a bounded list
+            self.ops = [op for op in self.ops
+                        if not (x <= op[2] and y <= op[3] and op[4] <= x1 and op[5] <= y1)]
+        self.ops.append((fn, args, x, y, x1, y1))
+        return True
 
-        self.write_cmd(0xC2)
-        self.write_data(0x01)
+    def replay_bands(self):
+        rows = self.strip_rows
+        self.recording = False
+        self.replaying = True
+        try:
+            for band in range(0, self.height, rows):
+                h = min(rows, self.height - band)
+                if self.dirty_full:
+                    spans = ((0, band, self.width, h),)
+                else:
+                    spans = []
+                    for r in self.dirty:
+                        y0 = max(r[1], band)
+                        y1 = min(r[3], band + h)
+                        if y0 < y1:
+                            spans.append((r[0], y0, r[2] - r[0], y1 - y0))
+                    if not spans:
+                        continue
+
+                self.band_y = band
+                super().fill(0)
+                for op in self.ops:
+                    op[0](*op[1])
+                self.submit(spans)
+        finally:
+            self.band_y = 0
+            self.replaying = False
+            self.recording = True
+
+    # Drawing primitives record what they touch before drawing. In strip
+    # mode they are queued and later drawn shifted up by band_y.
+
+    def fill(self, c):
+        if self.recording:
+            # everything queued so far is about to be painted over
+            self.ops.clear()
+            self.invalidate()
+            self.ops.append((self.fill, (c,), 0, 0, self.width, self.height))
+            return
+        self.invalidate()
+        super().fill(c)
 
-        self.write_cmd(0xC3)
-        self.write_data(0x12)
+    def fill_rect(self, x, y, w, h, c):
+        if self.recording:
+            self.record(self.fill_rect, (x, y, w, h, c), x, y, w, h, True)
+            return
+        self.mark_dirty(x, y, w, h)
+        super().fill_rect(x, y - self.band_y, w, h, c)
 
-        self.write_cmd(0xC4)
-        self.write_data(0x20)
+    def rect(self, x, y, w, h, c, *args):
+        if self.recording:
+            self.record(self.rect, (x, y, w, h, c) + args, x, y, w, h)
+            return
+        self.mark_dirty(x, y, w, h)
+        super().rect(x, y - self.band_y, w, h, c, *args)
 
-        self.write_cmd(0xC6)
-        self.write_data(0x0F)
+    def hline(self, x, y, w, c):
+        if self.recording:
+            self.record(self.hline, (x, y, w, c), x, y, w, 1)
+            return
+        self.mark_dirty(x, y, w, 1)
+        super().hline(x, y - self.band_y, w, c)
 
-        self.write_cmd(0xD0)
-        self.write_data(0xA4)
-        self.write_data(0xA1)
+    def vline(self, x, y, h, c):
+        if self.recording:
+            self.record(self.vline, (x, y, h, c), x, y, 1, h)
+            return
+        self.mark_dirty(x, y, 1, h)
+        super().vline(x, y - self.band_y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        bx = min(x1, x2)
+        by = min(y1, y2)
+        bw = abs(x2 - x1) + 1
+        bh = abs(y2 - y1) + 1
+        if self.recording:
+            self.record(self.line, (x1, y1, x2, y2, c), bx, by, bw, bh)
+            return
+        self.mark_dirty(bx, by, bw, bh)
+        super().line(x1, y1 - self.band_y, x2, y2 - self.band_y, c)
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return super().pixel(x, y - self.band_y)
+        if self.recording:
+            self.record(self.pixel, (x, y, c), x, y, 1, 1)
+            return
+        self.mark_dirty(x, y, 1, 1)
+        super().pixel(x, y - self.band_y, c)
 
-        self.write_cmd(0xE0)
-        for v in [0xD0,0x04,0x0D,0x11,0x13,0x2B,0x3F,0x54,0x4C,0x18,0x0D,0x0B,0x1F,0x23]:
-            self.write_data(v)
+    def text(self, s, x, y, c=1):
+        if self.recording:
+            self.record(self.text, (s, x, y, c), x, y, len(s) * 8, 8)
+            return
+        self.mark_dirty(x, y, len(s) * 8, 8)
+        super().text(s, x, y - self.band_y, c)
 
-        self.write_cmd(0xE1)
-        for v in [0xD0,0x04,0x0C,0x11,0x13,0x2C,0x3F,0x44,0x51,0x2F,0x1F,0x1F,0x20,0x23]:
-            self.write_data(v)
-        
-        self.write_cmd(0x21)
-        self.write_cmd(0x11)
-        self.write_cmd(0x29)
+    def blit_rect(self, fbuf, x, y, w, h, *args):
+        # blit with a known source size so only that area is dirtied
+        if self.recording:
+            self.record(self.blit_rect, (fbuf, x, y, w, h) + args, x, y, w, h)
+            return
+        self.mark_dirty(x, y, w, h)
+        super().blit(fbuf, x, y - self.band_y, *args)
 
-    def show(self):
-        self.write_cmd(0x2A)
-        for v in [0x00,0x00,0x00,0xEF]:
-            self.write_data(v)
-        
-        self.write_cmd(0x2B)
-        for v in [0x00,0x00,0x00,0xEF]:
-            self.write_data(v)
-        
-        self.write_cmd(0x2C)
-        
-        self.cs(1)
-        self.dc(1)
+    def blit(self, fbuf, x, y, *args):
+        # source size is unknown here, so assume the worst
+        if self.recording:
+            self.record(self.blit, (fbuf, x, y) + args, 0, 0, self.width, self.height)
+            return
+        self.invalidate()
+        super().blit(fbuf, x, y - self.band_y, *args)
+
+    def scroll(self, dx, dy):
+        # a band buffer holds no history to scroll
+        if self.strip_rows:
+            return
+        self.invalidate()
+        super().scroll(dx, dy)
+
+    def scroll_rows(self, y0, y1, dy):
+        # Shift rows y0..y1 by dy (negative = up) inside the framebuffer
+        # and mark just that band dirty; the caller paints the rows it
+        # exposed. The panel's own VSCSAD scroll runs along screen X with
+        # MADCTL 0x70, so lists are scrolled here instead.
+        step = abs(dy)
+        if self.strip_rows or step == 0 or step >= y1 - y0:
+            return False
+
+        stride = self.width * self.depth // 8
+        buf = self.buffer
+        mv = self._mv
+        if dy < 0:
+            # copy top-down in chunks that never overlap their source
+            y = y0
+            while y < y1 - step:
+                n = min(step, y1 - step - y)
+                buf[y * stride:(y + n) * stride] = mv[(y + step) * stride:(y + step + n) * stride]
+                y += n
+        else:
+            y = y1
+            while y > y0 + step:
+                n = min(step, y - y0 - step)
+                buf[(y - n) * stride:y * stride] = mv[(y - n - step) * stride:(y - step) * stride]
+                y -= n
+
+        self.mark_dirty(0, y0, self.width, y1 - y0)
+        return True
+
+    def paste_rows(self, rows, x, y, w, h):
+        # Copy columns x..x+w of a row template (one buffer per screen
+        # row, in this framebuffer's format) into rows y..y+h. Returns
+        # False when the area can't be copied bytewise (strip mode, or
+        # GS4 edges that split a byte) so the caller can draw instead.
+        if self.strip_rows:
+            return False
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return True
+        d = self.depth
+        if (x0 * d) % 8 or (x1 * d) % 8:
+            return False
+
+        a = x0 * d // 8
+        b = x1 * d // 8
+        stride = self.width * d // 8
+        buf = self.buffer
+        for yy in range(y0, y1):
+            o = yy * stride
+            buf[o + a:o + b] = rows[yy][a:b]
+
+        self.mark_dirty(x0, y0, x1 - x0, y1 - y0)
+        return True
+
+    # --------------------------------------------------------
+    # FLUSH
+    # --------------------------------------------------------
+
+    def set_window(self, x0, y0, x1, y1):
+        w = self._win
+        w[1] = x0 >> 8
+        w[2] = x0 & 0xFF
+        w[3] = x1 >> 8
+        w[4] = x1 & 0xFF
+        w[6] = y0 >> 8
+        w[7] = y0 & 0xFF
+        w[8] = y1 >> 8
+        w[9] = y1 & 0xFF
+        self.send_stream(self._win_stream)
+
+    def send_rect(self, buf, mv, band_y, x, y, w, h):
+        # window setup and pixel payload share one CS assertion
         self.cs(0)
-        self.spi.write(self.buffer)
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self.dc(1)
+        stride = self.width * 2
+        y -= band_y
+        if self.depth != 16:
+            self.send_indexed(buf, x, y, w, h)
+        elif w == self.width and h == self.height:
+            self.spi.write(buf)
+        elif w == self.width:
+            # full-width rows are contiguous in the buffer
+            self.spi.write(mv[y * stride:(y + h) * stride])
+        else:
+            off = y * stride + x * 2
+            n = w * 2
+            for _ in range(h):
+                self.spi.write(mv[off:off + n])
+                off += stride
         self.cs(1)
 
+    def send_indexed(self, buf, x, y, w, h):
+        a = self._xargs
+        a[0] = y * self.width + x
+        a[1] = w
+        while h > 0:
+            n = min(h, LUT_CHUNK_ROWS)
+            a[2] = n
+            expand_indexed(self._chunk, buf, self.lut, a)
+            self.spi.write(self._chunk_mv[:w * n * 2])
+            a[0] += self.width * n
+            h -= n
+
+    def submit(self, spans):
+        # spans: (x, y, w, h) screen rects held in the current buffer/band
+        if not self.async_flush:
+            for x, y, w, h in spans:
+                self.send_rect(self.buffer, self._mv, self.band_y, x, y, w, h)
+            return
+
+        # core 1 owns tx until it clears the pending flag
+        self.wait_idle()
+        stride = self.width * self.depth // 8
+        js = self._job_spans
+        n = 0
+        for x, y, w, h in spans:
+            a = (y - self.band_y) * stride
+            b = a + h * stride
+            self._tx_mv[a:b] = self._mv[a:b]
+            js[n * 4] = x
+            js[n * 4 + 1] = y
+            js[n * 4 + 2] = w
+            js[n * 4 + 3] = h
+            n += 1
+        self._job_band = self.band_y
+        self._job[1] = n
+        self._job[0] = 1
+
+    def wait_idle(self):
+        while self.async_flush and self._job[0]:
+            utime.sleep_us(20)
+
+    def start_async(self):
+        import _thread
+        self.tx = bytearray(len(self.buffer))
+        self._tx_mv = memoryview(self.tx)
+        self._job = bytearray(2)    # [pending, span count]
+        self._job_spans = array.array("h", [0] * (4 * DIRTY_MAX_RECTS))
+        self._job_band = 0
+        self.async_flush = True
+        _thread.start_new_thread(self.flush_worker, ())
+
+    def flush_worker(self):
+        # runs on core 1 and is the only user of the SPI bus from here on
+        job = self._job
+        js = self._job_spans
+        while True:
+            if not job[0]:
+                utime.sleep_us(50)
+                continue
+            for i in range(job[1]):
+                k = i * 4
+                self.send_rect(self.tx, self._tx_mv, self._job_band,
+                               js[k], js[k + 1], js[k + 2], js[k + 3])
+            job[0] = 0
+
+    def set_palette(self, slot, c):
+        # recolours every pixel using the slot on the next show()
+        self.lut[slot * 2] = c & 0xFF
+        self.lut[slot * 2 + 1] = c >> 8
+        self.invalidate()
+
+    def show(self):
+        if self.strip_rows:
+            self.replay_bands()
+        elif self.dirty_full:
+            self.submit(((0, 0, self.width, self.height),))
+        else:
+            self.submit([(r[0], r[1], r[2] - r[0], r[3] - r[1]) for r in self.dirty])
+        self.dirty_full = False
+        self.dirty.clear()
+        if self.on_show:
+            self.on_show()
+
 # ============================================================
 # COLOUR FUNCTION
 # ============================================================
 
-def colour(R, G, B):
+# Indexed modes: slot 0 is black (a cleared buffer), slots 1-3 belong to
+# the theme so apply_theme() only rewrites the lookup table. colour()
+# hands out the remaining slots, falling back to the nearest match.
+THEME_SLOTS = (1, 2, 3)
+PALETTE_RGB = [(0, 0, 0), None, None, None]
+PALETTE_LUT = bytearray(2 << LCD_COLOR_DEPTH) if LCD_COLOR_DEPTH < 16 else None
+
+def rgb565(R, G, B):
     rp = int(R * 31 / 255)
     r = rp * 8
     gp = int(G * 63 / 255)
@@ -164,6 +639,34 @@ def colour(R, G, B):
     b = bp * 256
     return r + g + b
 
+def colour(R, G, B):
+    c = rgb565(R, G, B)
+    if PALETTE_LUT is None:
+        return c
+    return palette_index(R, G, B, c)
+
+def palette_index(R, G, B, c):
+    rgb = (R, G, B)
+    best = 0
+    best_d = -1
+    for i, p in enumerate(PALETTE_RGB):
+        if p is None or i in THEME_SLOTS:
+            continue
+        if p == rgb:
+            return i
+        d = (p[0] - R) ** 2 + (p[1] - G) ** 2 + (p[2] - B) ** 2
+        if best_d < 0 or d < best_d:
+            best = i
+            best_d = d
+
+    slot = len(PALETTE_RGB)
+    if slot >= 1 << LCD_COLOR_DEPTH:
+        return best
+    PALETTE_RGB.append(rgb)
+    PALETTE_LUT[slot * 2] = c & 0xFF
+    PALETTE_LUT[slot * 2 + 1] = c >> 8
+    return slot
+
 # ============================================================
 # TERMINAL THEME / COLORS
 # ============================================================
@@ -176,877 +679,213 @@ PIP_DIM   = 0
 PIP_BLACK = colour(0, 0, 0)
 PIP_RED = colour(255, 60, 60)
 
+# cached background rows per layer; see bg_template()
+BG_TEMPLATES = {}
+
 def apply_theme():
     global PIP_GREEN, PIP_DARK, PIP_DIM
+    BG_TEMPLATES.clear()   # rebuilt in the new colours on next use
     if COLOR_MODE == "GREEN":
-        PIP_GREEN = colour(0, 255, 0)
-        PIP_DARK  = colour(0, 40, 0)
-        PIP_DIM   = colour(0, 120, 0)
+        theme = ((0, 255, 0), (0, 40, 0), (0, 120, 0))
+    else:
+        theme = ((255, 180, 0), (40, 20, 0), (120, 80, 0))
+
+    if PALETTE_LUT is None:
+        PIP_GREEN = colour(*theme[0])
+        PIP_DARK  = colour(*theme[1])
+        PIP_DIM   = colour(*theme[2])
+        return
+
+    # indexed: same slots, new colours; the next show() repaints
+    for slot, rgb in zip(THEME_SLOTS, theme):
+        PALETTE_RGB[slot] = rgb
+        LCD.set_palette(slot, rgb565(*rgb))
+    PIP_GREEN, PIP_DARK, PIP_DIM = THEME_SLOTS
+
+# ============================================================
+# GLYPH BITMAPS
+# ============================================================
+
+# Glyph bitmaps live in fonts.py (generated by build_fonts.py) as 1x
+# MONO_HLSB bytes. A glyph is copied into a FrameBuffer the first time
+# it is drawn and kept; with fonts.py frozen into the firmware the rest
+# of the font stays in flash.
+
+# Big digits are pre-scaled once at load; pick the size here.
+# The clock/stopwatch/timer layouts are tuned for 2.
+BIG_SCALE = 2
+BIG_ADVANCE = 9 * BIG_SCALE
+BIG_HEIGHT = fonts.BIG_H * BIG_SCALE
+
+BIG_FONT = (fonts.BIG_CHARS, fonts.BIG_WIDTHS, fonts.BIG_H, fonts.BIG_STRIDE, fonts.BIG_DATA, BIG_SCALE, {})
+MED_FONT = (fonts.MED_CHARS, fonts.MED_WIDTHS, fonts.MED_H, fonts.MED_STRIDE, fonts.MED_DATA, 1, {})
+
+def load_glyph(font, ch):
+    chars, widths, h, stride, data, scale, glyphs = font
+    glyph = glyphs.get(ch)
+    if glyph is not None:
+        return glyph
+    i = chars.find(ch)
+    if i < 0:
+        return None
+    w = widths[i]
+    pitch = (stride // h) * 8   # rows are padded to the widest glyph
+    src = framebuf.FrameBuffer(bytearray(data[i*stride:(i+1)*stride]), w, h, framebuf.MONO_HLSB, pitch)
+    if scale == 1:
+        glyph = (src, w, h)
     else:
-        PIP_GREEN = colour(255, 180, 0)
-        PIP_DARK  = colour(40, 20, 0)
-        PIP_DIM   = colour(120, 80, 0)
+        sw = w * scale
+        sh = h * scale
+        fb = framebuf.FrameBuffer(bytearray(((sw + 7) // 8) * sh), sw, sh, framebuf.MONO_HLSB)
+        # one fill_rect per horizontal run of lit cells
+        for row in range(h):
+            col = 0
+            while col < w:
+                if not src.pixel(col, row):
+                    col += 1
+                    continue
+                start = col
+                while col < w and src.pixel(col, row):
+                    col += 1
+                fb.fill_rect(start * scale, row * scale, (col - start) * scale, scale, 1)
+        glyph = (fb, sw, sh)
+    glyphs[ch] = glyph
+    return glyph
+
+GLYPH_PALETTES = {}
+
+def glyph_palette(color):
+    # index 1 -> color, index 0 -> a key colour blit() skips
+    pal = GLYPH_PALETTES.get(color)
+    if pal is None:
+        fb = framebuf.FrameBuffer(bytearray(4), 2, 1, LCD.fmt)
+        fb.pixel(0, 0, color ^ 1)
+        fb.pixel(1, 0, color)
+        pal = (fb, color ^ 1)
+        GLYPH_PALETTES[color] = pal
+    return pal
+
+def draw_glyph(x, y, glyph, color):
+    fb, w, h = glyph[:3]
+    pal, key = glyph_palette(color)
+    LCD.blit_rect(fb, x, y, w, h, key, pal)
 
 # ============================================================
 # BIG DIGIT FONT + DRAWING
 # ============================================================
 
-BIG_FONT = {
-    "0": [
-        " ###### ",
-        "##    ##",
-        "##   ###",
-        "##  # ##",
-        "## #  ##",
-        "###   ##",
-        "##    ##",
-        " ###### "
-    ],
-    "1": [
-        "   ##   ",
-        " ####   ",
-        "   ##   ",
-        "   ##   ",
-        "   ##   ",
-        "   ##   ",
-        "   ##   ",
-        " ###### "
-    ],
-    "2": [
-        " ###### ",
-        "##    ##",
-        "      ##",
-        "     ## ",
-        "   ###  ",
-        "  ##    ",
-        " ##     ",
-        "########"
-    ],
-    "3": [
-        " ###### ",
-        "##    ##",
-        "      ##",
-        "   #### ",
-        "      ##",
-        "      ##",
-        "##    ##",
-        " ###### "
-    ],
-    "4": [
-        "##   ## ",
-        "##   ## ",
-        "##   ## ",
-        "##   ## ",
-        "########",
-        "     ## ",
-        "     ## ",
-        "     ## "
-    ],
-    "5": [
-        "########",
-        "##      ",
-        "##      ",
-        "######  ",
-        "     ## ",
-        "     ## ",
-        "##   ## ",
-        " ###### "
-    ],
-    "6": [
-        " ###### ",
-        "##    ##",
-        "##      ",
-        "######  ",
-        "##   ## ",
-        "##   ## ",
-        "##   ## ",
-        " ###### "
-    ],
-    "7": [
-        "########",
-        "     ## ",
-        "    ##  ",
-        "   ##   ",
-        "  ##    ",
-        " ##     ",
-        "##      ",
-        "##      "
-    ],
-    "8": [
-        " ###### ",
-        "##    ##",
-        "##    ##",
-        " ###### ",
-        "##    ##",
-        "##    ##",
-        "##    ##",
-        " ###### "
-    ],
-    "9": [
-        " ###### ",
-        "##    ##",
-        "##    ##",
-        " #######",
-        "      ##",
-        "      ##",
-        "##    ##",
-        " ###### "
-    ],
-    ":": [
-        "   ",
-        "## ",
-        "## ",
-        "   ",
-        "   ",
-        "## ",
-        "## ",
-        "   "
-    ]
-}
-
 def draw_big_char(x, y, ch, color):
-    if ch not in BIG_FONT:
+    glyph = load_glyph(BIG_FONT, ch)
+    if glyph is None:
         return
-    pattern = BIG_FONT[ch]
-    for row, line in enumerate(pattern):
-        for col, pixel in enumerate(line):
-            if pixel == "#":
-                LCD.fill_rect(x + col*2, y + row*2, 2, 2, color)
+    draw_glyph(x, y, glyph, color)
 
 def draw_big_text(x, y, text, color):
+    # strip mode: queue the whole string as one display-list entry
+    if LCD.record(draw_big_text, (x, y, text, color), x, y, len(text) * BIG_ADVANCE, BIG_HEIGHT):
+        return
+    LCD.mark_dirty(x, y, len(text) * BIG_ADVANCE, BIG_HEIGHT)
     for i, ch in enumerate(text):
-        draw_big_char(x + i*18, y, ch, color)
+        draw_big_char(x + i * BIG_ADVANCE, y, ch, color)
+
+# the digit screens stay open longest; have their glyphs ready up front
+for ch in fonts.BIG_CHARS:
+    load_glyph(BIG_FONT, ch)
+boot_mark("fonts")
+
+class DigitField:
+    # Big-digit readout that remembers what is on screen and repaints
+    # only the glyph cells whose character changed.
+    def __init__(self, x, y, color):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.text = ""
+
+    def update(self, text):
+        old = self.text
+        if text == old:
+            return False
+        if len(text) != len(old):
+            pip_clear_rect(self.x, self.y, max(len(text), len(old)) * BIG_ADVANCE, BIG_HEIGHT)
+            draw_big_text(self.x, self.y, text, self.color)
+        else:
+            for i, ch in enumerate(text):
+                if ch != old[i]:
+                    cx = self.x + i * BIG_ADVANCE
+                    pip_clear_rect(cx, self.y, BIG_ADVANCE, BIG_HEIGHT)
+                    draw_big_char(cx, self.y, ch, self.color)
+        self.text = text
+        return True
 
 # ============================================================
-# MEDIUM FONT (BEGINNING)
+# TEXT SURFACE CACHE
 # ============================================================
 
-MED_FONT = {
-    "A": [
-        "   ####    ",
-        "  ##  ##   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ########  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "B": [
-        " #######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " #######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " #######   "
-    ],
-    "C": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "D": [
-        " #######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " #######   "
-    ],
-    "E": [
-        " ########  ",
-        " ##        ",
-        " ##        ",
-        " #######   ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ########  "
-    ],
-    "F": [
-        " ########  ",
-        " ##        ",
-        " ##        ",
-        " #######   ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        "
-    ],
-    "G": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##        ",
-        " ##  ####  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "H": [
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ########  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "I": [
-        " #######   ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        " #######   "
-    ],
-    "J": [
-        "     ###   ",
-        "      ##   ",
-        "      ##   ",
-        "      ##   ",
-        "      ##   ",
-        " ##   ##   ",
-        " ##   ##   ",
-        "  #####    "
-    ],
-    "K": [
-        " ##   ##   ",
-        " ##  ##    ",
-        " ## ##     ",
-        " ####      ",
-        " ####      ",
-        " ## ##     ",
-        " ##  ##    ",
-        " ##   ##   "
-    ],
-    "L": [
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ########  "
-    ],
-    "M": [
-        " ##    ##  ",
-        " ###  ###  ",
-        " ########  ",
-        " ## ## ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "N": [
-        " ##    ##  ",
-        " ###   ##  ",
-        " ####  ##  ",
-        " ## ## ##  ",
-        " ##  ####  ",
-        " ##   ###  ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "O": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "P": [
-        " #######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " #######   ",
-        " ##        ",
-        " ##        ",
-        " ##        ",
-        " ##        "
-    ],
-    "Q": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##  # ##  ",
-        " ##   ###  ",
-        " ##    ##  ",
-        "  #######  "
-    ],
-    "R": [
-        " #######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " #######   ",
-        " ##  ##    ",
-        " ##   ##   ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "S": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##        ",
-        "  ######   ",
-        "       ##  ",
-        "       ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "T": [
-        " ########  ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     "
-    ],
-    "U": [
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "V": [
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ##  ##   ",
-        "   ####    ",
-        "   ####    ",
-        "    ##     "
-    ],
-    "W": [
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ## ## ##  ",
-        " ########  ",
-        " ###  ###  ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "X": [
-        " ##    ##  ",
-        "  ##  ##   ",
-        "   ####    ",
-        "    ##     ",
-        "   ####    ",
-        "  ##  ##   ",
-        " ##    ##  ",
-        " ##    ##  "
-    ],
-    "Y": [
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ##  ##   ",
-        "   ####    ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     ",
-        "    ##     "
-    ],
-    "Z": [
-        " ########  ",
-        "      ##   ",
-        "     ##    ",
-        "    ##     ",
-        "   ##      ",
-        "  ##       ",
-        " ##        ",
-        " ########  "
-    ],
-
-    "0": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##   ###  ",
-        " ##  # ##  ",
-        " ## #  ##  ",
-        " ###   ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "1": [
-        "   ##      ",
-        " ####      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        "   ##      ",
-        " ######    "
-    ],
-    "2": [
-        "  ######   ",
-        " ##    ##  ",
-        "       ##  ",
-        "     ##    ",
-        "   ###     ",
-        "  ##       ",
-        " ##        ",
-        " ########  "
-    ],
-    "3": [
-        "  ######   ",
-        " ##    ##  ",
-        "       ##  ",
-        "   ####    ",
-        "       ##  ",
-        "       ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "4": [
-        " ##   ##   ",
-        " ##   ##   ",
-        " ##   ##   ",
-        " ########  ",
-        "      ##   ",
-        "      ##   ",
-        "      ##   ",
-        "      ##   "
-    ],
-    "5": [
-        " ########  ",
-        " ##        ",
-        " ##        ",
-        " ######    ",
-        "      ##   ",
-        "      ##   ",
-        " ##   ##   ",
-        "  ######   "
-    ],
-    "6": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##        ",
-        " ######    ",
-        " ##   ##   ",
-        " ##   ##   ",
-        " ##   ##   ",
-        "  ######   "
-    ],
-    "7": [
-        " ########  ",
-        "      ##   ",
-        "     ##    ",
-        "    ##     ",
-        "   ##      ",
-        "  ##       ",
-        " ##        ",
-        " ##        "
-    ],
-    "8": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-    "9": [
-        "  ######   ",
-        " ##    ##  ",
-        " ##    ##  ",
-        "  #######  ",
-        "       ##  ",
-        "       ##  ",
-        " ##    ##  ",
-        "  ######   "
-    ],
-
-    "-": [
-        "          ",
-        "          ",
-        "          ",
-        "  ######  ",
-        "  ######  ",
-        "          ",
-        "          ",
-        "          "
-    ],
-    ":": [
-        "    ",
-        " ## ",
-        " ## ",
-        "    ",
-        "    ",
-        " ## ",
-        " ## ",
-        "    "
-    ],
-    "/": [
-        "      ##  ",
-        "     ##   ",
-        "    ##    ",
-        "   ##     ",
-        "  ##      ",
-        " ##       ",
-        "##        ",
-        "          "
-    ],
-    " ": [
-        "          ",
-        "          ",
-        "          ",
-        "          ",
-        "          ",
-        "          ",
-        "          ",
-        "          "
-    ],
-}
-# --- LOWERCASE MED FONT ---
-MED_FONT["a"] = [
-    "          ",
-    "   ####   ",
-    "       ## ",
-    "   ###### ",
-    "  ##   ## ",
-    "  ##   ## ",
-    "   ###### ",
-    "          "
-],
-
-MED_FONT["b"] = [
-    " ##       ",
-    " ##       ",
-    " ## ####  ",
-    " ###   ## ",
-    " ##    ## ",
-    " ##    ## ",
-    " ###   ## ",
-    "  ######  "
-],
-
-MED_FONT["c"] = [
-    "          ",
-    "   #####  ",
-    "  ##   ## ",
-    " ##       ",
-    " ##       ",
-    "  ##   ## ",
-    "   #####  ",
-    "          "
-],
-
-MED_FONT["d"] = [
-    "       ## ",
-    "       ## ",
-    "   ###### ",
-    "  ##   ###",
-    " ##    ## ",
-    " ##    ## ",
-    "  ##   ###",
-    "   ###### "
-],
-
-MED_FONT["e"] = [
-    "          ",
-    "   #####  ",
-    "  ##   ## ",
-    " ######## ",
-    " ##       ",
-    "  ##   ## ",
-    "   #####  ",
-    "          "
-],
-
-MED_FONT["f"] = [
-    "    ####  ",
-    "   ##     ",
-    " #######  ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "          "
-],
-
-MED_FONT["g"] = [
-    "          ",
-    "   ###### ",
-    "  ##   ## ",
-    "  ##   ## ",
-    "   ###### ",
-    "       ## ",
-    "  ##   ## ",
-    "   #####  "
-],
-
-MED_FONT["h"] = [
-    " ##       ",
-    " ##       ",
-    " ## ####  ",
-    " ###  ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    "          "
-],
-
-MED_FONT["i"] = [
-    "   ##     ",
-    "          ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "          "
-],
-
-MED_FONT["j"] = [
-    "     ##   ",
-    "          ",
-    "     ##   ",
-    "     ##   ",
-    "     ##   ",
-    " ##  ##   ",
-    " ##  ##   ",
-    "  ####    "
-],
-
-MED_FONT["k"] = [
-    " ##       ",
-    " ##   ##  ",
-    " ##  ##   ",
-    " ####     ",
-    " ####     ",
-    " ##  ##   ",
-    " ##   ##  ",
-    "          "
-],
-
-MED_FONT["l"] = [
-    "  ##      ",
-    "  ##      ",
-    "  ##      ",
-    "  ##      ",
-    "  ##      ",
-    "  ##      ",
-    "   ####   ",
-    "          "
-],
-
-MED_FONT["m"] = [
-    "          ",
-    " #### ##  ",
-    " ## ## ## ",
-    " ## ## ## ",
-    " ## ## ## ",
-    " ##    ## ",
-    " ##    ## ",
-    "          "
-],
-
-MED_FONT["n"] = [
-    "          ",
-    " ## ####  ",
-    " ###  ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    "          "
-],
-
-MED_FONT["o"] = [
-    "          ",
-    "   ####   ",
-    "  ##  ##  ",
-    " ##    ## ",
-    " ##    ## ",
-    "  ##  ##  ",
-    "   ####   ",
-    "          "
-],
-
-MED_FONT["p"] = [
-    "          ",
-    " ## ####  ",
-    " ###   ## ",
-    " ##    ## ",
-    " ###   ## ",
-    " #######  ",
-    " ##       ",
-    " ##       "
-],
-
-MED_FONT["q"] = [
-    "          ",
-    "   ###### ",
-    "  ##   ## ",
-    " ##    ## ",
-    " ##   ### ",
-    "  #### ## ",
-    "       ## ",
-    "       ## "
-],
-
-MED_FONT["r"] = [
-    "          ",
-    " ## ####  ",
-    " ###   ## ",
-    " ##       ",
-    " ##       ",
-    " ##       ",
-    " ##       ",
-    "          "
-],
-
-MED_FONT["s"] = [
-    "          ",
-    "  ######  ",
-    " ##    ## ",
-    "   ###    ",
-    "      ### ",
-    " ##    ## ",
-    "  ######  ",
-    "          "
-],
-
-MED_FONT["t"] = [
-    "   ##     ",
-    "   ##     ",
-    " #######  ",
-    "   ##     ",
-    "   ##     ",
-    "   ##     ",
-    "    ####  ",
-    "          "
-],
-
-MED_FONT["u"] = [
-    "          ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ##   ##  ",
-    "  ######  ",
-    "          "
-],
-
-MED_FONT["v"] = [
-    "          ",
-    " ##   ##  ",
-    " ##   ##  ",
-    "  ## ##   ",
-    "  ## ##   ",
-    "   ###    ",
-    "    #     ",
-    "          "
-],
-
-MED_FONT["w"] = [
-    "          ",
-    " ##   ##  ",
-    " ##   ##  ",
-    " ## # ##  ",
-    " ######## ",
-    " ### ###  ",
-    " ##   ##  ",
-    "          "
-],
-
-MED_FONT["x"] = [
-    "          ",
-    " ##   ##  ",
-    "  ## ##   ",
-    "   ###    ",
-    "   ###    ",
-    "  ## ##   ",
-    " ##   ##  ",
-    "          "
-],
-
-MED_FONT["y"] = [
-    "          ",
-    " ##   ##  ",
-    " ##   ##  ",
-    "  ## ##   ",
-    "   ###    ",
-    "    ##    ",
-    "   ##     ",
-    " ####     "
-],
-
-MED_FONT["z"] = [
-    "          ",
-    " #######  ",
-    "     ##   ",
-    "    ##    ",
-    "   ##     ",
-    "  ##      ",
-    " #######  ",
-    "          "
-],
+# Whole strings are rendered once into a 1-bpp surface and reused, so a
+# static label is one blit per frame. Surfaces are colourless (colour is
+# applied by the blit palette), so the key is just (font, text). Least
+# recently used entries are dropped once TEXT_CACHE_BYTES is exceeded.
+
+TEXT_CACHE_BYTES = 4096
+
+text_cache = OrderedDict()
+text_cache_used = 0
+text_cache_hits = 0
+text_cache_misses = 0
+
+def text_surface(name, font, text, advance):
+    global text_cache_used, text_cache_hits, text_cache_misses
+    key = (name, text)
+    surf = text_cache.pop(key, None)
+    if surf is not None:
+        text_cache[key] = surf   # re-insert as most recent
+        text_cache_hits += 1
+        return surf
+
+    text_cache_misses += 1
+    w = len(text) * advance
+    h = font[2] * font[5]
+    buf = bytearray(((w + 7) // 8) * h)
+    fb = framebuf.FrameBuffer(buf, w, h, framebuf.MONO_HLSB)
+    for i, ch in enumerate(text):
+        glyph = load_glyph(font, ch)
+        if glyph is not None:
+            fb.blit(glyph[0], i * advance, 0)
+    surf = (fb, w, h, len(buf))
+
+    if surf[3] > TEXT_CACHE_BYTES:
+        return surf
+    while text_cache_used + surf[3] > TEXT_CACHE_BYTES:
+        old = text_cache.pop(next(iter(text_cache)))
+        text_cache_used -= old[3]
+    text_cache[key] = surf
+    text_cache_used += surf[3]
+    return surf
+
+def text_cache_clear():
+    global text_cache_used
+    text_cache.clear()
+    text_cache_used = 0
 
 # ============================================================
 # MEDIUM FONT DRAWING
 # ============================================================
 
 def draw_med_char(x, y, ch, color):
-    lookup = ch
-    if lookup not in MED_FONT:
-        lookup = ch.upper()
-    if lookup not in MED_FONT:
+    glyph = load_glyph(MED_FONT, ch)
+    if glyph is None:
+        glyph = load_glyph(MED_FONT, ch.upper())
+    if glyph is None:
         return
+    draw_glyph(x, y, glyph, color)
 
-    pattern = MED_FONT[lookup]
-    ...
-    # skip unknown characters
-    if ch not in MED_FONT:
+def draw_med_text(x, y, text, color):
+    if LCD.record(draw_med_text, (x, y, text, color), x, y, len(text) * 12, 8):
         return
-
-    pattern = MED_FONT[ch]
-
-    # validate glyph structure
-    if not isinstance(pattern, list):
+    if not text:
         return
-
-    for row, line in enumerate(pattern):
-        if not isinstance(line, str):
-            continue  # skip malformed rows
-
-        for col, pixel in enumerate(line):
-            if pixel == "#":
-                LCD.pixel(x + col, y + row, color)
-                
-def draw_med_text(x, y, text, color):
-    text = sanitize_text(text)
-    for i, ch in enumerate(text):
-        draw_med_char(x + i * 12, y, ch, color)
+    draw_glyph(x, y, text_surface("MED", MED_FONT, sanitize_text(text), 12), color)
     
 # ============================================================
 # ICONS
@@ -1073,8 +912,11 @@ pwm = PWM(Pin(BL))
 pwm.freq(1000)
 pwm.duty_u16(32768)
 
-LCD = LCD_1inch3()
+LCD = LCD_1inch3(LCD_STRIP_ROWS, LCD_COLOR_DEPTH, PALETTE_LUT)
+if LCD_ASYNC_FLUSH:
+    LCD.start_async()
 apply_theme()
+boot_mark("display")
 
 # ============================================================
 # BUTTONS
@@ -1092,8 +934,368 @@ right = Pin(20, Pin.IN, Pin.PULL_UP)
 ctrl  = Pin(3, Pin.IN, Pin.PULL_UP)
 
 def pressed(pin):
+    # level check; for held controls (games, continuous movement)
     return pin.value() == 0
 
+# ============================================================
+# INPUT EVENTS
+# ============================================================
+
+# Pin IRQs timestamp every edge, debounce it and queue press/release
+# events in a ring buffer; long presses and edges lost to contact
+# bounce are noticed when the queue is read. Apps take presses from
+# here instead of polling and sleeping, so a press that lands during
+# LCD.show() is not missed. Button state and the ring are only written
+# from scheduled callbacks (the soft pin IRQ and button_settle()),
+# which never interrupt each other; the read side only asks for a
+# correction with micropython.schedule().
+
+EV_PRESS = 1
+EV_RELEASE = 2
+EV_LONG = 3
+
+DEBOUNCE_MS = 25
+LONG_PRESS_MS = 700
+EVENT_SLOTS = 16
+
+BUTTONS = (keyA, keyB, keyX, keyY, up, down, left, right, ctrl)
+
+btn_down = bytearray(len(BUTTONS))      # debounced level, 1 = held
+btn_long = bytearray(len(BUTTONS))      # long press already reported
+btn_edge = array.array('i', [0] * len(BUTTONS))
+btn_fix = bytearray(len(BUTTONS))       # button_settle() scheduled
+
+ev_button = bytearray(EVENT_SLOTS)
+ev_kind = bytearray(EVENT_SLOTS)
+ev_time = array.array('i', [0] * EVENT_SLOTS)
+ev_pos = array.array('i', [0, 0])       # read index, write index
+
+# set by the IRQ so a waiting next_press() wakes without polling
+INPUT_WAKE = asyncio.ThreadSafeFlag()
+
+def button_queue(i, kind, now):
+    w = ev_pos[1]
+    nxt = (w + 1) % EVENT_SLOTS
+    if nxt == ev_pos[0]:
+        return   # queue full: drop the newest
+    ev_button[w] = i
+    ev_kind[w] = kind
+    ev_time[w] = now
+    ev_pos[1] = nxt
+    INPUT_WAKE.set()
+
+def button_set(i, down, now):
+    btn_down[i] = down
+    btn_long[i] = 0
+    btn_edge[i] = now
+    button_queue(i, EV_PRESS if down else EV_RELEASE, now)
+
+def button_edge(i):
+    def handler(pin):
+        now = utime.ticks_ms()
+        if utime.ticks_diff(now, btn_edge[i]) < DEBOUNCE_MS:
+            return
+        down = 1 if pin.value() == 0 else 0
+        if down == btn_down[i]:
+            return
+        button_set(i, down, now)
+    return handler
+
+def button_settle(i):
+    # scheduled by next_event(); rechecks, since an edge may have come
+    # in between
+    btn_fix[i] = 0
+    now = utime.ticks_ms()
+    since = utime.ticks_diff(now, btn_edge[i])
+    level = 1 if BUTTONS[i].value() == 0 else 0
+    if level != btn_down[i]:
+        # the last edge fell inside a bounce; trust the settled level
+        if since >= DEBOUNCE_MS:
+            button_set(i, level, now)
+    elif level and not btn_long[i] and since >= LONG_PRESS_MS:
+        btn_long[i] = 1
+        button_queue(i, EV_LONG, now)
+
+for i, pin in enumerate(BUTTONS):
+    pin.irq(button_edge(i), Pin.IRQ_FALLING | Pin.IRQ_RISING)
+
+def next_event():
+    # (pin, kind, ticks_ms) or None
+    r = ev_pos[0]
+    if r != ev_pos[1]:
+        ev = (BUTTONS[ev_button[r]], ev_kind[r], ev_time[r])
+        ev_pos[0] = (r + 1) % EVENT_SLOTS
+        return ev
+
+    # read-only here: a settled level the IRQ missed, or a long press,
+    # is queued by button_settle() and comes out on a later call
+    now = utime.ticks_ms()
+    for i, pin in enumerate(BUTTONS):
+        if btn_fix[i]:
+            continue
+        held = btn_down[i]
+        since = utime.ticks_diff(now, btn_edge[i])
+        level = 1 if pin.value() == 0 else 0
+        if ((level != held and since >= DEBOUNCE_MS) or
+                (held and not btn_long[i] and since >= LONG_PRESS_MS)):
+            btn_fix[i] = 1
+            try:
+                micropython.schedule(button_settle, i)
+            except RuntimeError:
+                btn_fix[i] = 0   # schedule queue full; try next time
+    return None
+
+def input_settling():
+    # a key is held (long press, repeats) or its last edge may still
+    # be followed by a bounce the IRQ ignored; these need polling
+    now = utime.ticks_ms()
+    for i in range(len(BUTTONS)):
+        if btn_down[i] or utime.ticks_diff(now, btn_edge[i]) < 2 * DEBOUNCE_MS:
+            return True
+    return False
+
+class Repeat:
+    # Auto-repeat for held keys, one per screen or widget. The first
+    # repeat comes `delay` ms after the press, then every `rate` ms,
+    # with each gap shrinking to `accel` percent of the last, down to
+    # `fastest`. Pass it to next_press() and held keys come back as
+    # repeated presses.
+    def __init__(self, keys, delay=400, rate=150, fastest=30, accel=80):
+        self.keys = keys
+        self.delay = delay
+        self.rate = rate
+        self.fastest = fastest
+        self.accel = accel
+        self.held = None
+        self.next = 0
+        self.interval = rate
+
+    def track(self, ev):
+        pin, kind, t = ev
+        if kind == EV_PRESS and pin in self.keys:
+            self.held = pin
+            self.next = utime.ticks_add(t, self.delay)
+            self.interval = self.rate
+        elif kind == EV_RELEASE and pin == self.held:
+            self.held = None
+
+    def due(self):
+        if self.held is None:
+            return None
+        if not pressed(self.held):
+            self.held = None
+            return None
+        now = utime.ticks_ms()
+        if utime.ticks_diff(now, self.next) < 0:
+            return None
+        # from now, not from the missed slot, so a slow frame can't
+        # release a burst of repeats
+        self.next = utime.ticks_add(now, self.interval)
+        self.interval = max(self.fastest, self.interval * self.accel // 100)
+        return self.held
+
+def held(pin):
+    # what next_press() returns for a long press of pin
+    return (pin, EV_LONG)
+
+async def next_press(timeout_ms=0, keys=None, repeat=None, hold=None):
+    # the next button pressed (one of keys, if given), waiting up to
+    # timeout_ms for it (None: as long as it takes); None if none came.
+    # With a Repeat, a held key
+    # counts as pressed again on its schedule. A long press of one of
+    # hold comes back as held(pin), after its plain press. Always yields
+    # to the other tasks once, even when a press is already queued.
+    if timeout_ms is not None:
+        deadline = utime.ticks_add(utime.ticks_ms(), timeout_ms)
+    await asyncio.sleep_ms(0)
+    while True:
+        ev = next_event()
+        if ev is not None:
+            if repeat is not None:
+                repeat.track(ev)
+            if ev[1] == EV_PRESS and (keys is None or ev[0] in keys):
+                if LATENCY_ON:
+                    latency_press(ev[2])
+                return ev[0]
+            if ev[1] == EV_LONG and hold is not None and ev[0] in hold:
+                return held(ev[0])
+            continue
+        if repeat is not None:
+            k = repeat.due()
+            if k is not None and (keys is None or k in keys):
+                return k
+        if timeout_ms is None:
+            remaining = None
+        else:
+            remaining = utime.ticks_diff(deadline, utime.ticks_ms())
+            if remaining <= 0:
+                return None
+        if input_settling():
+            await asyncio.sleep_ms(5 if remaining is None else min(5, remaining))
+        elif remaining is None:
+            await INPUT_WAKE.wait()
+        else:
+            # nothing held: sleep until a button IRQ or the deadline
+            try:
+                await asyncio.wait_for_ms(INPUT_WAKE.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+async def idle_until(deadline, keys, repeat=None):
+    # sleep until the ticks_ms deadline (None: no deadline), waking
+    # early with the first of keys that is pressed
+    while True:
+        if deadline is None:
+            remaining = None
+        else:
+            remaining = utime.ticks_diff(deadline, utime.ticks_ms())
+            if remaining <= 0:
+                return None
+        k = await next_press(remaining, keys, repeat)
+        if k is not None:
+            return k
+
+# ============================================================
+# LATENCY
+# ============================================================
+
+# Press-to-photon timing. While on, a press taken by next_press() arms
+# a timer from its IRQ timestamp and the next LCD.show() stops it once
+# the frame is off the SPI bus. The last LATENCY_SAMPLES per app are
+# kept, so the percentiles follow recent use. Held-key polling with
+# pressed() (snake, shooter) and auto-repeats are not timed.
+
+LATENCY_ON = False
+LATENCY_SAMPLES = 32
+
+latency_app = "MENU"
+latency_stats = {}      # app name -> [ring of ms, sample count]
+latency_armed = array.array('i', [0, 0])    # armed, press ticks_ms
+
+def latency_press(t):
+    # the first press since the last show() is the one the frame answers
+    if not latency_armed[0]:
+        latency_armed[0] = 1
+        latency_armed[1] = t
+
+def latency_shown():
+    if not latency_armed[0]:
+        return
+    # with async flush show() only queues the frame; wait for core 1
+    LCD.wait_idle()
+    ms = utime.ticks_diff(utime.ticks_ms(), latency_armed[1])
+    latency_armed[0] = 0
+    st = latency_stats.get(latency_app)
+    if st is None:
+        st = [array.array('H', [0] * LATENCY_SAMPLES), 0]
+        latency_stats[latency_app] = st
+    st[0][st[1] % LATENCY_SAMPLES] = min(ms, 65535)
+    st[1] += 1
+
+def latency_enable(on):
+    global LATENCY_ON
+    LATENCY_ON = on
+    latency_armed[0] = 0
+    LCD.on_show = latency_shown if on else None
+
+def latency_reset():
+    latency_stats.clear()
+    latency_armed[0] = 0
+
+def latency_rank(v, pct):
+    # nearest-rank percentile of the sorted samples v
+    return v[max(0, (len(v) * pct + 99) // 100 - 1)]
+
+def latency_summary(app):
+    # (presses timed, p50, p95, max) over the app's recent samples; p95
+    # is "-" below 20 samples, where it can only be the max
+    st = latency_stats[app]
+    n = min(st[1], LATENCY_SAMPLES)
+    v = sorted(st[0][:n])
+    p95 = latency_rank(v, 95) if n >= 20 else "-"
+    return st[1], latency_rank(v, 50), p95, v[-1]
+
+def latency_dump():
+    # plain text table on the USB serial console
+    print("LATENCY app n p50_ms p95_ms max_ms")
+    for app in sorted(latency_stats):
+        print("LATENCY", app, *latency_summary(app))
+
+# ============================================================
+# TASKS
+# ============================================================
+
+# The menu and apps are uasyncio coroutines. They yield to the loop in
+# next_press() / idle_until() at least once a frame, or with
+# asyncio.sleep_ms(), and work that has to carry on meanwhile runs as a
+# named background task. A task blocked in a driver call (wlan.scan(),
+# wlan.connect()) still holds up everything until that call returns.
+
+TASKS = {}
+
+def spawn(name, fn, *args):
+    # start fn(*args) as background task `name` unless it is running
+    t = TASKS.get(name)
+    if t is None or t.done():
+        t = asyncio.create_task(fn(*args))
+        TASKS[name] = t
+    return t
+
+def cancel(name):
+    t = TASKS.pop(name, None)
+    if t is not None and not t.done():
+        t.cancel()
+
+def running(name):
+    t = TASKS.get(name)
+    return t is not None and not t.done()
+
+# ============================================================
+# FRAME SCHEDULER
+# ============================================================
+
+# Screens only draw a frame when something on them changed. Apps wait
+# with next_frame(), which returns the next press straight away, or
+# None when the next animation frame is due. Frames are frame_ms apart
+# (from the open app's declared fps), measured from frame to frame, so
+# drawing time comes out of the budget. At fps 0 nothing on screen
+# moves by itself: the app is only woken by input, and the status bar
+# is refreshed here when its clock or icon changes. In between, the
+# core sits in the uasyncio wait until the button IRQ or a timer.
+
+frame_ms = 0
+frame_due = 0
+
+def frame_rate(fps):
+    global frame_ms, frame_due
+    frame_ms = 1000 // fps if fps else 0
+    frame_due = utime.ticks_add(utime.ticks_ms(), frame_ms)
+
+def refresh_status():
+    key = status_bar_key()
+    if key[:4] != status_rows_key or key[2] == 1:
+        draw_status_bar()
+        LCD.show()
+
+async def next_frame(keys=None, repeat=None, hold=None):
+    global frame_due
+    while True:
+        if frame_ms:
+            wait = max(0, utime.ticks_diff(frame_due, utime.ticks_ms()))
+        else:
+            # the update pulse blinks at 300 ms, the clock ticks by minutes
+            wait = 300 if update_icon_state() == 1 else 1000
+        k = await next_press(wait, keys, repeat, hold)
+        if k is not None:
+            return k
+        if frame_ms:
+            frame_due = utime.ticks_add(frame_due, frame_ms)
+            if utime.ticks_diff(frame_due, utime.ticks_ms()) <= 0:
+                # over budget; start afresh rather than catch up
+                frame_due = utime.ticks_add(utime.ticks_ms(), frame_ms)
+            return None
+        refresh_status()
+
 # ============================================================
 # TERMINAL EFFECTS
 # ============================================================
@@ -1102,24 +1304,51 @@ def draw_scanlines():
     for yy in range(0, 240, 4):
         LCD.hline(0, yy, 240, PIP_DARK)
 
+# CRT noise: a few 1-bpp strips of random dots are generated once and a
+# random strip is blitted into each band of the screen per frame. At
+# LOW a band gets a strip with probability density/300, which matches
+# the old average of density/8 dots per frame; HIGH doubles it.
+NOISE_LEVELS = ("OFF", "LOW", "HIGH")
+NOISE_LEVEL = "LOW"
+NOISE_MASKS = 4
+NOISE_ROWS = 40
+NOISE_DOTS = 6   # per strip
+
+def make_noise_mask():
+    buf = bytearray(30 * NOISE_ROWS)
+    fb = framebuf.FrameBuffer(buf, 240, NOISE_ROWS, framebuf.MONO_HLSB)
+    for _ in range(NOISE_DOTS):
+        fb.pixel(urandom.getrandbits(8) % 240, urandom.getrandbits(8) % NOISE_ROWS, 1)
+    return fb
+
+NOISE = [make_noise_mask() for _ in range(NOISE_MASKS)]
+
 def draw_noise(density=150):
-    for _ in range(density):
-        x = urandom.getrandbits(8) % 240
-        y = urandom.getrandbits(8) % 240
-        if urandom.getrandbits(3) == 0:
-            LCD.pixel(x, y, PIP_DIM)
+    scale = NOISE_LEVELS.index(NOISE_LEVEL)
+    if scale == 0:
+        return
+    if LCD.record(draw_noise, (density,), 0, 0, 240, 240):
+        return
+    chance = density * scale * 256 // 300
+    pal, key = glyph_palette(PIP_DIM)
+    for y in range(0, 240, NOISE_ROWS):
+        if urandom.getrandbits(8) < chance:
+            mask = NOISE[urandom.getrandbits(8) % NOISE_MASKS]
+            LCD.blit_rect(mask, 0, y, 240, NOISE_ROWS, key, pal)
 
 def screen_flicker():
+    # the black frame stays up while the app renders its first one
     LCD.fill(PIP_BLACK)
     LCD.show()
-    utime.sleep_ms(40)
-    draw_scanlines()
-    LCD.show()
-    utime.sleep_ms(40)
 
 def draw_terminal_frame():
     LCD.rect(2, 48, 236, 190, PIP_GREEN)
 
+def draw_frame_sides(y, h):
+    # repaint the frame's side edges over a band cleared at full width
+    LCD.vline(2, y, h, PIP_GREEN)
+    LCD.vline(237, y, h, PIP_GREEN)
+
 def draw_footer(left_msg="B: BACK", right_msg="A: SELECT"):
     y = 220
     LCD.fill_rect(0, y-2, 240, 20, PIP_BLACK)
@@ -1133,22 +1362,80 @@ def draw_footer(left_msg="B: BACK", right_msg="A: SELECT"):
 # CORE HELPERS
 # ============================================================
 
-def pip_clear():
+# Background layers are the same every frame for a given theme, so each
+# is rendered once and kept as a list of screen rows, sharing one buffer
+# between identical rows. Restoring is then a row copy, for the whole
+# screen or just a dirty area. Not used in strip mode.
+BG_BASE = 0     # pip_clear(): fill + scanlines
+BG_CHROME = 1   # base + title bar + terminal frame
+
+def draw_bg_layer(layer):
     LCD.fill(PIP_DARK)
     draw_scanlines()
+    if layer == BG_CHROME:
+        LCD.fill_rect(0, 48, 240, 20, PIP_BLACK)
+        draw_terminal_frame()
+
+def capture_rows(h):
+    # copy frame rows 0..h for LCD.paste_rows(), keeping one copy of
+    # each distinct row
+    stride = LCD.width * LCD.depth // 8
+    seen = {}
+    rows = []
+    for y in range(h):
+        row = bytes(LCD.buffer[y * stride:(y + 1) * stride])
+        if row not in seen:
+            seen[row] = memoryview(row)
+        rows.append(seen[row])
+    return rows
+
+def bg_template(layer):
+    rows = BG_TEMPLATES.get(layer)
+    if rows is None and not LCD.strip_rows:
+        # render into the frame (callers are about to repaint it anyway)
+        draw_bg_layer(layer)
+        rows = capture_rows(LCD.height)
+        BG_TEMPLATES[layer] = rows
+    return rows
+
+def bg_restore(layer, x=0, y=0, w=240, h=240):
+    rows = BG_TEMPLATES.get(layer)
+    if rows is None:
+        return False
+    return LCD.paste_rows(rows, x, y, w, h)
+
+def pip_clear(layer=BG_BASE):
+    if bg_template(layer) is None:
+        draw_bg_layer(layer)
+    else:
+        bg_restore(layer)
+
+def pip_clear_rect(x, y, w, h):
+    # pip_clear() limited to one area
+    if bg_restore(BG_BASE, x, y, w, h):
+        return
+    LCD.fill_rect(x, y, w, h, PIP_DARK)
+    for yy in range(y + (-y) % 4, y + h, 4):
+        LCD.hline(x, yy, w, PIP_DARK)
 
 def pip_title(msg):
     LCD.fill_rect(0, 48, 240, 20, PIP_BLACK)
     draw_med_text(16, 50, msg.upper(), PIP_GREEN)   # FIXED OFFSET
     draw_terminal_frame()
 
+def pip_screen(msg):
+    # pip_clear() + pip_title() with the frame and title bar restored
+    # from the cached chrome layer
+    pip_clear(BG_CHROME)
+    draw_med_text(16, 50, msg.upper(), PIP_GREEN)
+
 def draw_small_text(x, y, text, color):
     LCD.text(text, x, y, color)
 
 def sanitize_text(s):
     out = ""
     for ch in s:
-        if ch.upper() in MED_FONT:
+        if ch.upper() in fonts.MED_CHARS:
             out += ch.upper()
         else:
             out += " "  # replace unknown with space
@@ -1161,8 +1448,44 @@ CONTENT_BOTTOM = 220
 # STATUS BAR
 # ============================================================
 
-def draw_status_bar():
-    LCD.fill_rect(0, 0, 240, 48, PIP_BLACK)
+# The bar is rendered into rows 0..STATUS_H of the frame and those rows
+# are kept (identical rows shared) until something on it changes; other
+# calls just copy them back. Only the update pulse is drawn every time.
+STATUS_H = 48
+BATTERY_LEVEL = 75   # no battery sense yet
+
+status_rows = None
+status_rows_key = None
+
+def update_icon_state():
+    # auto-clear after 5 minutes
+    if utime.time() - UPDATE_STATE_TIME > 300:
+        return 0
+    return UPDATE_STATE
+
+def update_pulse_phase(state):
+    return (utime.ticks_ms() // 300) % 2 if state == 1 else 0
+
+def status_bar_key():
+    # what the status bar shows; redraw it only when this changes. The
+    # last item is the update pulse, which the kept rows don't hold
+    t = utime.localtime()
+    state = update_icon_state()
+    return (t[1:5], BATTERY_LEVEL, state, PIP_GREEN, update_pulse_phase(state))
+
+def status_bar_wake(deadline):
+    # pull a ticks_ms deadline in to the next update pulse flip, so apps
+    # that only redraw on a status_bar_key() change keep it blinking
+    if update_icon_state() != 1:
+        return deadline
+    now = utime.ticks_ms()
+    flip = utime.ticks_add(now, 300 - now % 300)
+    if deadline is None or utime.ticks_diff(flip, deadline) < 0:
+        return flip
+    return deadline
+
+def render_status_bar(state):
+    LCD.fill_rect(0, 0, 240, STATUS_H, PIP_BLACK)
 
     t = utime.localtime()
     timestr = "{:02d}:{:02d}".format(t[3], t[4])
@@ -1172,28 +1495,13 @@ def draw_status_bar():
     draw_med_text(8, 24, datestr, PIP_GREEN)
 
     icon_circle_dot_small(150, 10, PIP_GREEN)
-    icon_battery(190, 18, 75, PIP_GREEN)
-    global UPDATE_STATE, UPDATE_STATE_TIME
-    # Update icon (small square)
-    # Update status icon
-    state = UPDATE_STATE
-    age = utime.time() - UPDATE_STATE_TIME
-
-    # auto-clear after 5 minutes
-    if age > 300:
-        state = 0
+    icon_battery(190, 18, BATTERY_LEVEL, PIP_GREEN)
 
+    # Update status icon
     x = 190
     y = 6
 
-    if state == 1:
-    # TRYING: pulsing dot
-        if (utime.ticks_ms() // 300) % 2 == 0:
-            LCD.fill_rect(x+3, y+3, 4, 4, PIP_GREEN)
-        else:
-            LCD.rect(x+3, y+3, 4, 4, PIP_DIM)
-
-    elif state == 2:
+    if state == 2:
     # CONNECTED + UPDATING: solid square
         LCD.fill_rect(x, y, 8, 8, PIP_GREEN)
     elif state == 3:
@@ -1211,85 +1519,366 @@ def draw_status_bar():
         LCD.pixel(x+2, y+5, PIP_GREEN)
         LCD.pixel(x+5, y+2, PIP_GREEN)
 
+def draw_update_pulse(phase):
+    # TRYING: pulsing dot
+    x = 190
+    y = 6
+    if phase == 0:
+        LCD.fill_rect(x+3, y+3, 4, 4, PIP_GREEN)
+    else:
+        LCD.rect(x+3, y+3, 4, 4, PIP_DIM)
+
+def draw_status_bar():
+    global status_rows, status_rows_key
+    key = status_bar_key()
+    if key[:4] != status_rows_key or not LCD.paste_rows(status_rows, 0, 0, 240, STATUS_H):
+        render_status_bar(key[2])
+        if not LCD.strip_rows:
+            status_rows = capture_rows(STATUS_H)
+            status_rows_key = key[:4]
+
+    if key[2] == 1:
+        draw_update_pulse(key[4])
+
+# ============================================================
+# SCROLLING LISTS
+# ============================================================
+
+class ListView:
+    # Fixed-height rows inside the terminal frame. Moving the viewport by
+    # a few rows shifts the pixels already in the framebuffer and only
+    # paints the rows that scrolled into view, so show() pushes the list
+    # band instead of the whole screen.
+    def __init__(self, y, row_h, rows, draw_row):
+        self.y = y
+        self.row_h = row_h
+        self.rows = rows
+        self.draw_row = draw_row   # draw_row(index, row_top, selected)
+        self.count = 0
+        self.top = 0
+        self.sel = -1
+
+    def visible(self, i):
+        return self.top <= i < self.top + self.rows
+
+    def draw_item(self, i):
+        if not self.visible(i):
+            return
+        y = self.y + (i - self.top) * self.row_h
+        LCD.fill_rect(0, y, 240, self.row_h, PIP_DARK)
+        draw_frame_sides(y, self.row_h)
+        if 0 <= i < self.count:
+            self.draw_row(i, y, i == self.sel)
+
+    def draw(self, count, top=0, sel=-1):
+        self.count = count
+        self.top = top
+        self.sel = sel
+        for i in range(top, top + self.rows):
+            self.draw_item(i)
+
+    def move(self, top, sel=-1):
+        old_top = self.top
+        old_sel = self.sel
+        d = top - old_top
+
+        if d == 0:
+            self.sel = sel
+            if sel != old_sel:
+                self.draw_item(old_sel)
+                self.draw_item(sel)
+            return
+
+        y1 = self.y + self.rows * self.row_h
+        if not LCD.scroll_rows(self.y, y1, -d * self.row_h):
+            self.draw(self.count, top, sel)
+            return
+
+        self.top = top
+        self.sel = sel
+        if d > 0:
+            exposed = range(top + self.rows - d, top + self.rows)
+        else:
+            exposed = range(top, top - d)
+        for i in exposed:
+            self.draw_item(i)
+
+        # the highlight travelled with the pixels; fix up both rows
+        if old_sel != sel:
+            self.draw_item(old_sel)
+            self.draw_item(sel)
+
+# ============================================================
+# TIMELINES
+# ============================================================
+
+class Timeline:
+    # Keyframes played against ticks_ms: each step is (hold_ms, draw)
+    # and draw() runs once when the step starts. tick() never sleeps, so
+    # the caller keeps polling input or doing work between frames.
+    def __init__(self, steps):
+        self.steps = steps
+        self.index = -1
+        self.t0 = 0
+
+    def enter(self):
+        if self.index < len(self.steps):
+            draw = self.steps[self.index][1]
+            if draw is not None:
+                draw()
+
+    def tick(self):
+        now = utime.ticks_ms()
+        if self.index < 0:
+            self.index = 0
+            self.t0 = now
+            self.enter()
+        while self.index < len(self.steps):
+            hold = self.steps[self.index][0]
+            if utime.ticks_diff(now, self.t0) < hold:
+                return True
+            self.t0 = utime.ticks_add(self.t0, hold)
+            self.index += 1
+            self.enter()
+        return False
+
+    def skip(self):
+        self.index = len(self.steps)
+
+async def play(timeline, keys=(keyA, keyB)):
+    # run a timeline to the end; any of keys skips the rest
+    while timeline.tick():
+        LCD.show()
+        if await next_press(10, keys) is not None:
+            timeline.skip()
+    LCD.show()
+
 # ============================================================
 # BOOT: TERMINAL LOG + ANIMATION
 # ============================================================
 
 def boot_log():
-    LCD.fill(PIP_BLACK)
-    draw_scanlines()
+    def start():
+        LCD.fill(PIP_BLACK)
+        draw_scanlines()
+
+    def log_line(y, line):
+        def step():
+            draw_med_text(10, y, line, PIP_GREEN)
+            draw_noise(80)
+        return step
+
     lines = [
         "[ OK ] INITIALIZING DISPLAY",
         "[ OK ] LOADING KERNEL MODULES",
         "[ OK ] MOUNTING FILESYSTEM",
         "[ OK ] STARTING TINYPIP OS"
     ]
+    steps = [(0, start)]
     y = 40
     for line in lines:
-        draw_med_text(10, y, line, PIP_GREEN)
-        draw_noise(80)
-        LCD.show()
-        utime.sleep_ms(400)
+        steps.append((400, log_line(y, line)))
         y += 18
-    utime.sleep_ms(300)
+    steps.append((300, None))
+    return steps
 
 def boot_animation():
-    LCD.fill(PIP_BLACK)
-    LCD.show()
-    utime.sleep_ms(100)
-
-    for i in range(3):
+    def blank():
         LCD.fill(PIP_BLACK)
-        LCD.rect(80, 41, 80, 80, PIP_DIM if i < 2 else PIP_GREEN)
-        draw_med_text(40, 190, "VAULT-TEC SYSTEMS", PIP_GREEN)
-        draw_scanlines()
-        LCD.show()
-        utime.sleep_ms(300)
 
+    def vault(i):
+        def step():
+            LCD.fill(PIP_BLACK)
+            LCD.rect(80, 41, 80, 80, PIP_DIM if i < 2 else PIP_GREEN)
+            draw_med_text(40, 190, "VAULT-TEC SYSTEMS", PIP_GREEN)
+            draw_scanlines()
+        return step
+
+    def online(i):
+        def step():
+            LCD.fill(PIP_BLACK)
+            LCD.rect(80, 41, 80, 80, PIP_GREEN)
+            LCD.rect(92, 53, 56, 56, PIP_GREEN)
+            LCD.rect(96, 57, 48, 48, PIP_GREEN)
+            draw_med_text(90, 190, "ONLINE", PIP_GREEN if i % 2 == 0 else PIP_DIM)
+            draw_scanlines()
+        return step
+
+    steps = [(100, blank)]
+    for i in range(3):
+        steps.append((300, vault(i)))
     for i in range(4):
-        LCD.fill(PIP_BLACK)
-        LCD.rect(80, 41, 80, 80, PIP_GREEN)
-        LCD.rect(92, 53, 56, 56, PIP_GREEN)
-        LCD.rect(96, 57, 48, 48, PIP_GREEN)
-        draw_med_text(90, 190, "ONLINE", PIP_GREEN if i % 2 == 0 else PIP_DIM)
-        draw_scanlines()
-        LCD.show()
-        utime.sleep_ms(200)
+        steps.append((200, online(i)))
+    return steps
 
+def boot_done():
     LCD.fill(PIP_DARK)
     draw_scanlines()
     LCD.show()
 
-boot_log()
-boot_animation()
+# The full animation only plays on the first boot (no BOOT_SEEN_FILE
+# yet); after that the menu comes straight up. A or B skips it anyway.
+# The boot times are rewritten on every boot, so the log always holds
+# the latest one, fast or animated.
+BOOT_SEEN_FILE = "boot_seen"
+BOOT_TIMES_FILE = "boot_times.log"
+
+def boot_seen():
+    try:
+        os.stat(BOOT_SEEN_FILE)
+        return True
+    except:
+        return False
+
+def boot_save_times():
+    try:
+        with open(BOOT_TIMES_FILE, "w") as f:
+            for name, ms in BOOT_MARKS:
+                f.write("{} {}\n".format(name, ms))
+    except:
+        pass
+
+async def boot():
+    if not boot_seen():
+        await play(Timeline(boot_log() + boot_animation()))
+        boot_mark("animation")
+        try:
+            open(BOOT_SEEN_FILE, "w").close()
+        except:
+            pass
+    boot_done()
+
+# ============================================================
+# APP REGISTRY
+# ============================================================
+
+# Each app is a module in apps/ with an `async def run()`, and reaches
+# the core with `from __main__ import *`. It is imported when opened and
+# dropped again when it returns, so only the open app's code is on the
+# heap. Names the core rebinds at runtime (theme colours, settings)
+# are copied at import; an app that changes them reads them back
+# through `import __main__ as core`.
+#
+# mem: free heap (KB) the app needs to start. fps: the redraw rate it
+# needs; 0 if it only changes on input (see FRAME SCHEDULER). radio:
+# it drives STA_IF, so it can't open while the update holds the radio.
+# Menu order is registry order.
+
+class App:
+    def __init__(self, name, module, mem=8, fps=0, radio=False):
+        self.name = name
+        self.module = module
+        self.mem = mem
+        self.fps = fps
+        self.radio = radio
+
+APPS = (
+    App("CLOCK", "clock", mem=4, fps=1),
+    App("STATUS", "status", mem=8, fps=2, radio=True),
+    App("ADD NOTE", "add_note", mem=6),
+    App("VIEW NOTES", "view_notes", mem=8),
+    App("SYSTEM", "system", mem=6, fps=1),
+    App("LATENCY", "latency", mem=4),
+    App("SETTINGS", "settings", mem=4),
+    App("FILES", "files", mem=8),
+    App("STOPWATCH", "stopwatch", mem=4, fps=1),
+    App("TIMER", "timer", mem=4, fps=1),
+    App("SNAKE", "snake", mem=8, fps=50),
+    App("WIFI SCANNER", "wifi_scanner", mem=12, fps=5, radio=True),
+    App("ADD WIFI", "add_wifi", mem=12, radio=True),
+    App("BLUETOOTH SCANNER", "bluetooth", mem=24, fps=5),
+    App("WEATHER", "weather", mem=16),
+    App("GPS", "gps", mem=4),
+    App("COMPASS", "compass", mem=4, fps=25),
+    App("TRACKER", "tracker", mem=10, fps=25, radio=True),
+    App("SET DATE", "set_date", mem=4),
+    App("SET TIME", "set_time", mem=4),
+    App("SHOOTER", "shooter", mem=8, fps=30),
+    App("FLASHLIGHT", "flashlight", mem=2),
+)
+
+def find_app(name):
+    for app in APPS:
+        if app.name == name:
+            return app
+    return None
+
+# STA_IF has one user at a time: the open radio app or the background
+# update. radio_owner names it; the other is refused until it lets go.
+radio_owner = None
+
+def radio_take(name):
+    global radio_owner
+    if radio_owner is not None:
+        return False
+    radio_owner = name
+    return True
+
+def radio_drop(name):
+    global radio_owner
+    if radio_owner == name:
+        radio_owner = None
+
+open_app = None     # module path of the app in launch(), if any
+
+def app_unload(path):
+    sys.modules.pop(path, None)
+    pkg = sys.modules.get("apps")
+    if pkg is not None:
+        try:
+            delattr(pkg, path.split(".")[1])
+        except:
+            pass
+    gc.collect()
+
+async def launch(app):
+    global latency_app, open_app
+    if app.radio and not radio_take(app.name):
+        pip_screen("RADIO BUSY")
+        draw_status_bar()
+        draw_med_text(10, CONTENT_TOP, "UPDATE RUNNING", PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+18, "Y IN MENU STOPS IT", PIP_GREEN)
+        draw_footer("B: BACK", "")
+        LCD.show()
+        await idle_until(None, (keyB,))
+        return
+
+    gc.collect()
+    if gc.mem_free() < app.mem * 1024:
+        # the text cache is the one big reclaimable thing in the core
+        text_cache_clear()
+        gc.collect()
+    if gc.mem_free() < app.mem * 1024:
+        pip_screen("LOW MEMORY")
+        draw_status_bar()
+        draw_med_text(10, CONTENT_TOP, "{} NEEDS {} KB".format(app.name, app.mem), PIP_GREEN)
+        draw_med_text(10, CONTENT_TOP+18, "FREE: {} KB".format(gc.mem_free() // 1024), PIP_GREEN)
+        draw_footer("B: BACK", "")
+        LCD.show()
+        await idle_until(None, (keyB,))
+        radio_drop(app.name)
+        return
+
+    path = "apps." + app.module
+    latency_app = app.name
+    open_app = path
+    frame_rate(app.fps)
+    try:
+        __import__(path)
+        await sys.modules[path].run()
+    except Exception as e:
+        print("APP ERROR:", app.name, e)
+    finally:
+        latency_app = "MENU"
+        open_app = None
+        app_unload(path)
+        radio_drop(app.name)
 
 # ============================================================
 # MENU SYSTEM
 # ============================================================
 
-MENU = [
-    "CLOCK",
-    "STATUS",
-    "ADD NOTE",
-    "VIEW NOTES",
-    "SYSTEM",
-    "SETTINGS",
-    "FILES",
-    "STOPWATCH",
-    "TIMER",
-    "SNAKE",
-    "WIFI SCANNER",
-    "ADD WIFI",
-    "BLUETOOTH SCANNER",
-    "WEATHER",
-    "GPS",
-    "COMPASS",
-    "TRACKER",
-    "SET DATE",
-    "SET TIME",
-    "SHOOTER",
-    "FLASHLIGHT"
-]
+MENU = [app.name for app in APPS]
 
 menu_index = 0
 menu_offset = 0
@@ -1302,92 +1891,115 @@ def apply_brightness():
     duty = int((brightness_level / 100) * 65535)
     pwm.duty_u16(duty)
 
-def draw_menu():
-    global menu_offset
-    pip_clear()
-    draw_status_bar()
-    pip_title("TINYPIP OS")
+MENU_ROW_H = 22
+menu_blink = 0
+menu_status_ms = 0
 
-    if menu_index < menu_offset:
+def draw_menu_row(i, y, selected):
+    if selected:
+        LCD.fill_rect(0, y, 240, MENU_ROW_H, PIP_BLACK)
+        if menu_blink == 1:
+            LCD.fill_rect(6, y + 2, 6, MENU_ROW_H - 4, PIP_GREEN)
+    draw_med_text(40, y + 2, MENU[i].upper(), PIP_GREEN)
+
+MENU_LIST = ListView(CONTENT_TOP - 2, MENU_ROW_H, VISIBLE_ITEMS, draw_menu_row)
+
+def menu_scroll_offset():
+    global menu_offset
+    if menu_index < menu_offset:
         menu_offset = menu_index
     elif menu_index >= menu_offset + VISIBLE_ITEMS:
         menu_offset = menu_index - VISIBLE_ITEMS + 1
 
-    blink = (utime.ticks_ms() // 400) % 2
-    y = CONTENT_TOP
-    row_height = 22
-
-    for i in range(menu_offset, min(menu_offset + VISIBLE_ITEMS, len(MENU))):
-        item = MENU[i]
-        if i == menu_index:
-            LCD.fill_rect(0, y - 2, 240, row_height, PIP_BLACK)
-            if blink == 1:
-                LCD.fill_rect(6, y, 6, row_height-4, PIP_GREEN)
-            draw_med_text(40, y, item.upper(), PIP_GREEN)
-        else:
-            draw_med_text(40, y, item.upper(), PIP_GREEN)
-        y += row_height
+def draw_menu():
+    global menu_blink, menu_status_ms
+    pip_clear()
+    draw_status_bar()
+    menu_status_ms = utime.ticks_ms()
+    pip_title("TINYPIP OS")
+
+    menu_scroll_offset()
+    menu_blink = (utime.ticks_ms() // 400) % 2
+    MENU_LIST.draw(len(MENU), menu_offset, menu_index)
 
     draw_footer("A: SELECT", "B: BACK")
     draw_noise(120)
     LCD.show()
 
+def update_menu():
+    # incremental frame: only what moved, blinked or ticked is repainted
+    global menu_blink, menu_status_ms
+    menu_scroll_offset()
+    MENU_LIST.move(menu_offset, menu_index)
+
+    blink = (utime.ticks_ms() // 400) % 2
+    if blink != menu_blink:
+        menu_blink = blink
+        MENU_LIST.draw_item(menu_index)
+
+    # the update pulse blinks faster than the clock ticks
+    period = 300 if update_icon_state() == 1 else 1000
+    if utime.ticks_diff(utime.ticks_ms(), menu_status_ms) >= period:
+        menu_status_ms = utime.ticks_ms()
+        draw_status_bar()
+
+    LCD.show()
+
 #MENU
 
-def menu_loop():
+MENU_REPEAT = Repeat((up, down), delay=350, rate=120, fastest=60)
+MENU_FPS = 5    # the cursor blinks every 400 ms
+
+async def menu_loop():
     global menu_index
-    global UPDATE_STATE, UPDATE_STATE_TIME   # ← REQUIRED
+
+    frame_rate(MENU_FPS)
+    draw_menu()
+    if BOOT_MARKS and BOOT_MARKS[-1][0] != "menu":
+        boot_mark("menu")
+        boot_save_times()
+    banner = None   # update result, shown over the menu for a while
+    updating = running("update")
 
     while True:
-        draw_menu()
+        if updating and not running("update"):
+            updating = False
+            msg = update_result()
+            def result():
+                pip_screen(msg)
+            banner = Timeline([(1500, result)])
+
+        if banner is not None and not banner.tick():
+            banner = None
+            draw_menu()
+        if banner is None:
+            update_menu()
+        else:
+            LCD.show()
+
+        k = await next_frame(repeat=MENU_REPEAT)
 
-        if pressed(up):
+        if k == up:
             menu_index = (menu_index - 1) % len(MENU)
-            utime.sleep_ms(150)
+            if banner is not None:
+                banner.skip()
 
-        if pressed(down):
+        elif k == down:
             menu_index = (menu_index + 1) % len(MENU)
-            utime.sleep_ms(150)
+            if banner is not None:
+                banner.skip()
 
-        if pressed(keyA):
-            utime.sleep_ms(200)
+        elif k == keyA:
             return MENU[menu_index]
 
-        # Y = UPDATE NOW  (NOW CORRECTLY INDENTED)
-        if pressed(keyY):
-            spinner = ["-", "\\", "|", "/"]
-
-            # STATE: TRYING
-            UPDATE_STATE = 1
-            UPDATE_STATE_TIME = utime.time()
-
-            for i in range(12):
-                pip_clear()
-                pip_title("UPDATING " + spinner[i % 4])
-                LCD.show()
-                utime.sleep_ms(100)
-
-            ok = wifi_fallback_update()
-
-            # STATE: SUCCESS / FAIL
-            UPDATE_STATE = 3 if ok else 4
-            UPDATE_STATE_TIME = utime.time()
-
-            pip_clear()
-            pip_title("UPDATED" if ok else "NO WIFI")
-            LCD.show()
-            utime.sleep_ms(1500)
+        # Y = UPDATE NOW, in the background; Y again cancels
+        elif k == keyY:
+            if running("update"):
+                cancel("update")
+            elif radio_owner is None:
+                spawn("update", wifi_update_task)
+                updating = True
             
-# ============================================================
-# NOTES HELPERS
-# ============================================================
-
-def save_note(text):
-    try:
-        with open("notes.txt", "a") as f:
-            f.write(text + "\n")
-    except:
-        pass
 
 # ============================================================
 # MINIMAP HELPER (GPS + TRACKER)
@@ -1417,8 +2029,9 @@ def draw_minimap(x, y, target_x=0.5, target_y=0.5, color=PIP_GREEN):
 # Keyboard Input helper
 # ============================================================
 
-def keyboard_input(title="INPUT"):
+async def keyboard_input(title="INPUT"):
     screen_flicker()
+    repeat = Repeat((left, right, up, down))
 
     keyboard = [
         "1234567890",
@@ -1435,9 +2048,8 @@ def keyboard_input(title="INPUT"):
     text = ""
 
     while True:
-        pip_clear()
+        pip_screen(title)
         draw_status_bar()
-        pip_title(title)
 
         y = CONTENT_TOP
         for r, line in enumerate(keyboard):
@@ -1457,26 +2069,24 @@ def keyboard_input(title="INPUT"):
         LCD.show()
 
         # movement
-        if pressed(left):
+        k = await next_frame(repeat=repeat)
+
+        if k == left:
             col = max(0, col - 1)
-            utime.sleep_ms(120)
 
-        if pressed(right):
+        if k == right:
             col = min(len(keyboard[row]) - 1, col + 1)
-            utime.sleep_ms(120)
 
-        if pressed(up):
+        if k == up:
             row = max(0, row - 1)
             col = min(col, len(keyboard[row]) - 1)
-            utime.sleep_ms(120)
 
-        if pressed(down):
+        if k == down:
             row = min(len(keyboard) - 1, row + 1)
             col = min(col, len(keyboard[row]) - 1)
-            utime.sleep_ms(120)
 
         # select key
-        if pressed(keyA):
+        if k == keyA:
             key = keyboard[row][col]
 
             if key == "<":
@@ -1488,1705 +2098,154 @@ def keyboard_input(title="INPUT"):
             else:
                 text += key
 
-            utime.sleep_ms(150)
-
         # cancel
-        if pressed(keyB):
+        if k == keyB:
             return ""
 
         
 # ============================================================
-# APPS
+# BEACON SERVICE
 # ============================================================
 
-def app_clock():
-    screen_flicker()
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("CLOCK")
-
-        t = utime.localtime()
-        timestr = "{:02d}:{:02d}:{:02d}".format(t[3], t[4], t[5])
-        draw_big_text(30, 120, timestr, PIP_GREEN)
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(200)
-
-# ==========================================
-# STATUS app
-# ===========================================
-
-def app_status():
-    screen_flicker()
-
-    scroll_y = 0
-    SCROLL_STEP = 14
-    MAX_SCROLL = 120  # adjust if you add more lines
-
-    start_time = utime.ticks_ms()
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("STATUS")
-
-        y = CONTENT_TOP - scroll_y
-
-        # --- DEVICE ---
-        draw_med_text(10, y, "DEVICE", PIP_GREEN)
-        y += 18
-        draw_small_text(20, y, "Model: Pico 2 W", PIP_GREEN)
-        y += 14
-        draw_small_text(20, y, "OS: TinyPIP v1.8.0", PIP_GREEN)
-        y += 20
-
-        # --- SYSTEM ---
-        draw_med_text(10, y, "SYSTEM", PIP_GREEN)
-        y += 18
-
-        # CPU MHz
-        try:
-            cpu = machine.freq() // 1000000
-        except:
-            cpu = 133
-        draw_small_text(20, y, "CPU: {} MHz".format(cpu), PIP_GREEN)
-        y += 14
-
-        # Uptime
-        uptime_ms = utime.ticks_ms() - start_time
-        uptime_s = uptime_ms // 1000
-        uptime_m = uptime_s // 60
-        uptime_h = uptime_m // 60
-        draw_small_text(20, y, "Uptime: {}h {}m".format(uptime_h, uptime_m % 60), PIP_GREEN)
-        y += 14
-
-        # RAM usage
-        import gc
-        free_ram = gc.mem_free()
-        used_ram = gc.mem_alloc()
-        draw_small_text(20, y, "RAM: {} used / {} free".format(used_ram, free_ram), PIP_GREEN)
-        y += 20
-
-        # --- NETWORK ---
-        draw_med_text(10, y, "NETWORK", PIP_GREEN)
-        y += 18
-
-        wlan = network.WLAN(network.STA_IF)
-        if wlan.active() and wlan.isconnected():
-            ip = wlan.ifconfig()[0]
-            draw_small_text(20, y, "WiFi: Connected", PIP_GREEN)
-            y += 14
-            draw_small_text(20, y, "IP: {}".format(ip), PIP_GREEN)
-            y += 14
-        else:
-            draw_small_text(20, y, "WiFi: Offline", PIP_DIM)
-            y += 20
-
-        # --- BEACON STATUS ---
-        draw_med_text(10, y, "BEACON", PIP_GREEN)
-        y += 18
-
-        beacon_found = False
-        beacon_battery = None
-
+class BeaconService:
+    # Looks for the beacon's "BEACON|<battery>" access point every
+    # `period` ms and keeps the last result, so screens render from the
+    # snapshot instead of scanning per frame. run() is the background
+    # task; poll() scans only when one is due. wlan.scan() itself still
+    # blocks core 0 (cyw43 has to stay there) for about 1-2 s, so input
+    # and animation stall that long once a period. When run() ends, STA
+    # is powered back down if scan() was what turned it on.
+    def __init__(self, period=10000):
+        self.period = period
+        self.wlan = None
+        self.powered = False    # scan() turned STA on
+        self.last_scan = None   # ticks_ms of the last scan
+        self.seen = None        # ticks_ms the beacon was last seen
+        self.battery = None
+        self.rssi = None
+
+    def scan(self):
+        import network
+        if self.wlan is None:
+            self.wlan = network.WLAN(network.STA_IF)
+        if not self.wlan.active():
+            self.wlan.active(True)
+            self.powered = True
         try:
-            nets = wlan.scan()
+            nets = self.wlan.scan()
         except:
             nets = []
+        self.last_scan = utime.ticks_ms()
 
         for n in nets:
             ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
             if ssid.startswith("BEACON"):
-                beacon_found = True
+                self.seen = self.last_scan
+                self.rssi = n[3]
+                self.battery = None
                 if "|" in ssid:
                     try:
-                        beacon_battery = int(ssid.split("|")[1])
+                        self.battery = int(ssid.split("|")[1])
                     except:
-                        beacon_battery = None
-                break
-
-        if beacon_found:
-            draw_small_text(20, y, "Status: ONLINE", PIP_GREEN)
-            y += 14
-            if beacon_battery is not None:
-                draw_small_text(20, y, "Battery: {}%".format(beacon_battery), PIP_GREEN)
-                y += 14
-        else:
-            draw_small_text(20, y, "Status: OFFLINE", PIP_DIM)
-            y += 20
-
-        # --- STORAGE ---
-        draw_med_text(10, y, "STORAGE", PIP_GREEN)
-        y += 18
-
-        try:
-            fs = os.statvfs("/")
-            total = (fs[0] * fs[2]) // 1024
-            free = (fs[0] * fs[3]) // 1024
-            used = total - free
-            draw_small_text(20, y, "Used: {} KB".format(used), PIP_GREEN)
-            y += 14
-            draw_small_text(20, y, "Free: {} KB".format(free), PIP_GREEN)
-            y += 14
-        except:
-            draw_small_text(20, y, "Storage: N/A", PIP_DIM)
-            y += 14
-
-        # FOOTER
-        draw_footer("UP/DN: SCROLL", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        # INPUT
-        if pressed(up):
-            scroll_y = max(0, scroll_y - SCROLL_STEP)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            scroll_y = min(MAX_SCROLL, scroll_y + SCROLL_STEP)
-            utime.sleep_ms(120)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(40)
-        
-#===========================================
-        
-def app_add_note():
-    screen_flicker()
-    chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,-!?"
-    index = 0
-    note = ""
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("ADD NOTE")
-
-        draw_med_text(10, CONTENT_TOP,     "NOTE:", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+18,  note[:18], PIP_GREEN)
-
-        draw_med_text(10, CONTENT_TOP+48,  "CHAR: {}".format(chars[index]), PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+66,  "UP/DOWN: CHANGE", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+84,  "A: ADD CHAR", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+102, "X: SAVE", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+120, "B: CANCEL", PIP_GREEN)
-
-        draw_footer("A: ADD", "X: SAVE")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            index = (index - 1) % len(chars)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            index = (index + 1) % len(chars)
-            utime.sleep_ms(120)
-
-        if pressed(keyA):
-            note += chars[index]
-            utime.sleep_ms(120)
-
-        if pressed(keyX):
-            save_note(note)
-            utime.sleep_ms(200)
-            return
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-def app_view_notes():
-    screen_flicker()
-    pip_clear()
-    draw_status_bar()
-    pip_title("VIEW NOTES")
-
-    try:
-        with open("notes.txt") as f:
-            lines = f.read().splitlines()
-    except:
-        lines = ["NO NOTES FOUND"]
-
-    index = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("VIEW NOTES")
-
-        y = CONTENT_TOP
-        for line in lines[index:index+6]:
-            draw_med_text(10, y, line[:18], PIP_GREEN)
-            y += 18
-
-        draw_footer("UP/DOWN: SCROLL", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            index = max(0, index - 1)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            if index < max(0, len(lines) - 6):
-                index += 1
-            utime.sleep_ms(120)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-# =============================================================
-# System app
-# =============================================================
-
-def app_system():
-    screen_flicker()
-
-    start_time = utime.ticks_ms()
-    scroll_y = 0
-    SCROLL_STEP = 14
-    MAX_SCROLL = 120  # adjust if you add more lines
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("SYSTEM INFO")
-
-        y = CONTENT_TOP - scroll_y
-
-        # --- DEVICE SECTION ---
-        draw_med_text(10, y, "DEVICE", PIP_GREEN)
-        y += 18
-        draw_small_text(20, y, "Model: Pico 2 W", PIP_GREEN)
-        y += 14
-        draw_small_text(20, y, "OS: TinyPIP v1.8.0", PIP_GREEN)
-        y += 20
-
-        # --- SYSTEM SECTION ---
-        draw_med_text(10, y, "SYSTEM", PIP_GREEN)
-        y += 18
-
-        try:
-            cpu = machine.freq() // 1000000
-        except:
-            cpu = 133
-        draw_small_text(20, y, "CPU: {} MHz".format(cpu), PIP_GREEN)
-        y += 14
-
-        uptime_ms = utime.ticks_ms() - start_time
-        uptime_s = uptime_ms // 1000
-        uptime_m = uptime_s // 60
-        uptime_h = uptime_m // 60
-        draw_small_text(20, y, "Uptime: {}h {}m".format(uptime_h, uptime_m % 60), PIP_GREEN)
-        y += 20
-
-        # --- NETWORK SECTION ---
-        draw_med_text(10, y, "NETWORK", PIP_GREEN)
-        y += 18
-
-        wlan = network.WLAN(network.STA_IF)
-        if wlan.active() and wlan.isconnected():
-            ip = wlan.ifconfig()[0]
-            draw_small_text(20, y, "WiFi: Connected", PIP_GREEN)
-            y += 14
-            draw_small_text(20, y, "IP: {}".format(ip), PIP_GREEN)
-            y += 14
-        else:
-            draw_small_text(20, y, "WiFi: Offline", PIP_DIM)
-            y += 20
+                        pass
+                return True
+        return False
 
-        # --- STORAGE SECTION ---
-        draw_med_text(10, y, "STORAGE", PIP_GREEN)
-        y += 18
+    def poll(self):
+        if self.last_scan is None or utime.ticks_diff(utime.ticks_ms(), self.last_scan) >= self.period:
+            self.scan()
 
+    async def run(self):
         try:
-            fs_stat = os.statvfs("/")
-            total = (fs_stat[0] * fs_stat[2]) // 1024
-            free = (fs_stat[0] * fs_stat[3]) // 1024
-            used = total - free
-            draw_small_text(20, y, "Used: {} KB".format(used), PIP_GREEN)
-            y += 14
-            draw_small_text(20, y, "Free: {} KB".format(free), PIP_GREEN)
-            y += 14
-        except:
-            draw_small_text(20, y, "Storage: N/A", PIP_DIM)
-            y += 14
-
-        # FOOTER
-        draw_footer("UP/DOWN: SCROLL", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        # --- INPUT ---
-        if pressed(up):
-            scroll_y = max(0, scroll_y - SCROLL_STEP)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            scroll_y = min(MAX_SCROLL, scroll_y + SCROLL_STEP)
-            utime.sleep_ms(120)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(40)
-        
-        
-# ==================================================
-# Flashlight
-# ==================================================
-
-def app_flashlight():
-    screen_flicker()
-
-    # 0 = dim, 1 = medium, 2 = bright
-    level = 1
-    # 0 = white, 1 = green, 2 = red
-    mode = 0
-
-    def get_color():
-        if mode == 0:  # white
-            if level == 0:
-                return colour(80, 80, 80)
-            elif level == 1:
-                return colour(160, 160, 160)
-            else:
-                return colour(255, 255, 255)
-        elif mode == 1:  # green
-            if level == 0:
-                return colour(0, 60, 0)
-            elif level == 1:
-                return colour(0, 140, 0)
-            else:
-                return colour(0, 255, 0)
-        else:  # red
-            if level == 0:
-                return colour(60, 0, 0)
-            elif level == 1:
-                return colour(140, 0, 0)
-            else:
-                return colour(255, 0, 0)
-
-    while True:
-        c = get_color()
-        LCD.fill(c)
-
-        draw_status_bar()
-        pip_title("FLASHLIGHT")
-
-        draw_med_text(10, CONTENT_TOP, "LEVEL: {}".format(level + 1), PIP_GREEN)
-        mode_name = ["WHITE", "GREEN", "RED"][mode]
-        draw_med_text(10, CONTENT_TOP + 18, "MODE: {}".format(mode_name), PIP_GREEN)
-
-        draw_footer("A: MODE  UP/DN: BRIGHT", "B: BACK")
-        LCD.show()
-
-        if pressed(up):
-            level = min(2, level + 1)
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            level = max(0, level - 1)
-            utime.sleep_ms(150)
-
-        if pressed(keyA):
-            mode = (mode + 1) % 3
-            utime.sleep_ms(150)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(40)
-        
-# ====================================================
-
-def app_compass():
-    screen_flicker()
-
-    heading = 0  # degrees, 0 = North
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("COMPASS")
-
-        # center of compass
-        cx = 120
-        cy = 140
-        radius = 60
-
-        # outer circle
-        for angle in range(0, 360, 4):
-            rad = math.radians(angle)
-            px = int(cx + radius * math.cos(rad))
-            py = int(cy + radius * math.sin(rad))
-            if 0 <= px < 240 and 0 <= py < 240:
-                LCD.pixel(px, py, PIP_GREEN)
-
-        # cardinal marks
-        LCD.text("N", cx - 3, cy - radius - 10, PIP_GREEN)
-        LCD.text("S", cx - 3, cy + radius + 2, PIP_GREEN)
-        LCD.text("W", cx - radius - 10, cy - 3, PIP_GREEN)
-        LCD.text("E", cx + radius + 4, cy - 3, PIP_GREEN)
-
-        # needle (red tip to North-ish)
-        rad = math.radians(heading)
-        nx = int(cx + (radius - 8) * math.sin(rad))
-        ny = int(cy - (radius - 8) * math.cos(rad))
-        LCD.line(cx, cy, nx, ny, colour(255, 60, 60))
-
-        # tail (dim)
-        tx = int(cx - (radius - 20) * math.sin(rad))
-        ty = int(cy + (radius - 20) * math.cos(rad))
-        LCD.line(cx, cy, tx, ty, PIP_DIM)
-
-        # heading readout
-        draw_med_text(70, CONTENT_TOP, "HEADING: {:03d}°".format(heading % 360), PIP_GREEN)
-        draw_small_text(40, CONTENT_TOP + 20, "LEFT/RIGHT: ADJUST (VIRTUAL)", PIP_DIM)
-
-        draw_footer("B: BACK", "")
-        draw_noise(80)
-        LCD.show()
-
-        if pressed(left):
-            heading = (heading - 5) % 360
-            utime.sleep_ms(80)
-
-        if pressed(right):
-            heading = (heading + 5) % 360
-            utime.sleep_ms(80)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
+            while True:
+                self.poll()
+                await asyncio.sleep_ms(500)
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self.powered:
+            self.powered = False
+            try:
+                self.wlan.active(False)
+            except:
+                pass
 
-        utime.sleep_ms(40)
-        
-        
-# ==================================================
+    def scanned(self):
+        return self.last_scan is not None
 
-def app_settings():
-    global brightness_level, COLOR_MODE
-    screen_flicker()
-    mode_index = 0
-    modes = ["BRIGHTNESS", "COLOR MODE"]
+    def online(self):
+        # seen in the most recent scan
+        return self.seen is not None and self.seen == self.last_scan
 
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("SETTINGS")
-
-        draw_med_text(10, CONTENT_TOP,     "UP/DOWN: SELECT OPTION", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+18,  "A: CHANGE VALUE", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+36,  "B: BACK", PIP_GREEN)
-
-        y = CONTENT_TOP+60
-        for i, m in enumerate(modes):
-            if i == mode_index:
-                LCD.fill_rect(0, y - 2, 240, 18, PIP_BLACK)
-                LCD.fill_rect(6, y, 6, 14, PIP_GREEN)
-            draw_med_text(40, y, m, PIP_GREEN)
-            y += 18
-
-        if modes[mode_index] == "BRIGHTNESS":
-            draw_med_text(10, CONTENT_TOP+96, "LEVEL: {}%".format(brightness_level), PIP_GREEN)
-        elif modes[mode_index] == "COLOR MODE":
-            draw_med_text(10, CONTENT_TOP+96, "MODE: {}".format(COLOR_MODE), PIP_GREEN)
-
-        draw_footer("A: CHANGE", "B: BACK")
-        draw_noise(120)
-        LCD.show()
+    def seen_ago_s(self):
+        if self.seen is None:
+            return None
+        return utime.ticks_diff(utime.ticks_ms(), self.seen) // 1000
 
-        if pressed(up):
-            mode_index = (mode_index - 1) % len(modes)
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            mode_index = (mode_index + 1) % len(modes)
-            utime.sleep_ms(150)
-
-        if pressed(keyA):
-            if modes[mode_index] == "BRIGHTNESS":
-                brightness_level += 10
-                if brightness_level > 100:
-                    brightness_level = 10
-                apply_brightness()
-            elif modes[mode_index] == "COLOR MODE":
-                COLOR_MODE = "AMBER" if COLOR_MODE == "GREEN" else "GREEN"
-                apply_theme()
-            utime.sleep_ms(200)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
+BEACON = BeaconService()
 
-        utime.sleep_ms(50)
+# ============================================================
+# WIFI UPDATE
+# ============================================================
 
-def app_files():
-    screen_flicker()
-    pip_clear()
-    draw_status_bar()
-    pip_title("FILES")
+# Y in the menu starts the wifi_update.py state machine as a background
+# task ticking every UPDATE_TICK_MS, and Y again cancels it. It holds
+# the radio (see radio_owner) until it ends, so radio apps wait. The
+# status bar icon follows UPDATE_STATE (1 trying, 2 connected, 3 done,
+# 4 failed) while the watch stays usable. It stays on core 0 with the
+# cyw43 driver. The per-step results are kept for the SYSTEM app and
+# printed to the serial console.
+UPDATE_TICK_MS = 50
 
-    try:
-        entries = os.listdir()
-    except:
-        entries = []
+def set_update_state(state):
+    global UPDATE_STATE, UPDATE_STATE_TIME
+    UPDATE_STATE = state
+    UPDATE_STATE_TIME = utime.time()
 
-    if not entries:
-        draw_med_text(10, CONTENT_TOP+10, "NO FILES FOUND", PIP_GREEN)
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-        while not pressed(keyB):
-            utime.sleep_ms(50)
+async def wifi_update_task():
+    global LAST_UPDATE_OK, LAST_UPDATE_TIME, LAST_UPDATE_STEPS
+    if not radio_take("update"):
         return
+    from wifi_update import WifiUpdate
+    job = WifiUpdate(set_update_state)
+    set_update_state(1)
+    # the weather updater comes from its app module
+    had_weather = "apps.weather" in sys.modules
+    try:
+        while job.tick():
+            await asyncio.sleep_ms(UPDATE_TICK_MS)
+    finally:
+        # also runs when the task is cancelled
+        job.cancel()
+        LAST_UPDATE_OK = job.ok
+        LAST_UPDATE_TIME = utime.time()
+        LAST_UPDATE_STEPS = job.results
+        set_update_state(3 if job.ok else 4)
+        print("UPDATE", "OK" if job.ok else "FAILED", job.report())
+        radio_drop("update")
+        if not had_weather and open_app != "apps.weather":
+            app_unload("apps.weather")
+
+def update_result():
+    # banner text for the last update
+    if LAST_UPDATE_OK:
+        return "UPDATED"
+    if LAST_UPDATE_STEPS and LAST_UPDATE_STEPS[-1][1] == "cancel":
+        return "CANCELLED"
+    return "NO WIFI"
 
-    index = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("FILES")
-
-        y = CONTENT_TOP
-        for name in entries[index:index+6]:
-            draw_med_text(10, y, name[:18], PIP_GREEN)
-            y += 18
-
-        draw_footer("UP/DOWN: SCROLL", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            index = max(0, index - 1)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            if index < max(0, len(entries) - 6):
-                index += 1
-            utime.sleep_ms(120)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-def app_stopwatch():
-    screen_flicker()
-    running = False
-    start_time = 0
-    elapsed = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("STOPWATCH")
-
-        if running:
-            elapsed = utime.ticks_diff(utime.ticks_ms(), start_time)
-
-        total_s = elapsed // 1000
-        mins = total_s // 60
-        secs = total_s % 60
-
-        timestr = "{:02d}:{:02d}".format(mins, secs)
-        draw_big_text(40, 120, timestr, PIP_GREEN)
-
-        draw_footer("A: START/STOP", "B: RESET/BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyA):
-            if not running:
-                start_time = utime.ticks_ms() - elapsed
-                running = True
-            else:
-                running = False
-            utime.sleep_ms(200)
-
-        if pressed(keyB):
-            if elapsed > 0:
-                elapsed = 0
-                running = False
-                utime.sleep_ms(200)
-            else:
-                utime.sleep_ms(200)
-                return
-
-        utime.sleep_ms(50)
-
-def app_timer():
-    screen_flicker()
-    minutes = 1
-    running = False
-    end_time = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("TIMER")
-
-        draw_med_text(10, CONTENT_TOP,     "UP/DOWN: SET MINUTES", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+18,  "A: START/STOP", PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+36,  "B: BACK", PIP_GREEN)
-
-        if not running:
-            timestr = "{:02d}:00".format(minutes)
-        else:
-            remaining_ms = utime.ticks_diff(end_time, utime.ticks_ms())
-            if remaining_ms <= 0:
-                remaining_ms = 0
-                running = False
-            total_s = remaining_ms // 1000
-            m = total_s // 60
-            s = total_s % 60
-            timestr = "{:02d}:{:02d}".format(m, s)
-
-        draw_big_text(40, 130, timestr, PIP_GREEN)
-
-        draw_footer("A: START/STOP", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if not running:
-            if pressed(up):
-                minutes = min(99, minutes + 1)
-                utime.sleep_ms(150)
-            if pressed(down):
-                minutes = max(1, minutes - 1)
-                utime.sleep_ms(150)
-
-        if pressed(keyA):
-            if not running:
-                end_time = utime.ticks_ms() + minutes * 60 * 1000
-                running = True
-            else:
-                running = False
-            utime.sleep_ms(200)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(50)
-
-def app_snake():
-    screen_flicker()
-    grid_size = 10
-    cell = 14
-    offset_x = 25
-    offset_y = CONTENT_TOP
-
-    snake = [(5, 5), (4, 5), (3, 5)]
-    direction = (1, 0)
-    food = (8, 5)
-    alive = True
-    last_move = utime.ticks_ms()
-
-    def draw_grid():
-        pip_clear()
-        draw_status_bar()
-        pip_title("SNAKE")
-        LCD.rect(offset_x-2, offset_y-2, grid_size*cell+4, grid_size*cell+4, PIP_GREEN)
-        for (sx, sy) in snake:
-            LCD.fill_rect(offset_x + sx*cell, offset_y + sy*cell, cell-2, cell-2, PIP_GREEN)
-        LCD.fill_rect(offset_x + food[0]*cell+3, offset_y + food[1]*cell+3, cell-6, cell-6, PIP_GREEN)
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
+# ============================================================
+# MAIN LOOP
+# ============================================================
 
-    def spawn_food():
-        while True:
-            fx = urandom.getrandbits(4) % grid_size
-            fy = urandom.getrandbits(4) % grid_size
-            if (fx, fy) not in snake:
-                return (fx, fy)
+async def main():
+    await boot()
 
     while True:
-        if not alive:
-            pip_clear()
-            draw_status_bar()
-            pip_title("SNAKE")
-            draw_med_text(40, 120, "GAME OVER", PIP_GREEN)
-            draw_footer("B: BACK", "")
-            draw_noise(120)
-            LCD.show()
-            if pressed(keyB):
-                utime.sleep_ms(200)
-                return
-            utime.sleep_ms(100)
-            continue
-
-        draw_grid()
-
-        if pressed(up) and direction != (0, 1):
-            direction = (0, -1)
-        elif pressed(down) and direction != (0, -1):
-            direction = (0, 1)
-        elif pressed(left) and direction != (1, 0):
-            direction = (-1, 0)
-        elif pressed(right) and direction != (-1, 0):
-            direction = (1, 0)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        if utime.ticks_diff(utime.ticks_ms(), last_move) > 220:
-            last_move = utime.ticks_ms()
-            head = snake[0]
-            new_head = (head[0] + direction[0], head[1] + direction[1])
-
-            if (new_head[0] < 0 or new_head[0] >= grid_size or
-                new_head[1] < 0 or new_head[1] >= grid_size or
-                new_head in snake):
-                alive = False
-                continue
-
-            snake.insert(0, new_head)
-            if new_head == food:
-                food = spawn_food()
-            else:
-                snake.pop()
-
-        utime.sleep_ms(20)
-
-# ============================================================
-# WIFI SCANNER + DETAILS
-# ============================================================
-
-def app_wifi_details(net):
-    ssid, bssid, channel, rssi, auth, hidden = net
-
-    freq = 2412
-    distance = 10 ** ((27.55 - (20 * math.log10(freq)) + abs(rssi)) / 20)
-
-    screen_flicker()
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("WIFI INFO")
-
-        ssid_str = ssid.decode() if isinstance(ssid, bytes) else ssid
-        bssid_hex = ":".join(["{:02X}".format(b) for b in bssid])
-
-        draw_med_text(10, CONTENT_TOP,     "SSID: " + ssid_str[:12], PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+18,  "BSSID: " + bssid_hex, PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+36,  "RSSI: {} dBm".format(rssi), PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+54,  "CHAN: {}".format(channel), PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+72,  "DIST: {:.1f} m".format(distance), PIP_GREEN)
-
-        bar = max(0, min(100, 100 + rssi))
-        LCD.fill_rect(10, CONTENT_TOP+96, bar, 10, PIP_GREEN)
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-def app_wifi_scanner():
-    screen_flicker()
-    wlan = network.WLAN(network.STA_IF)
-    if not wlan.active():
-        wlan.active(True)
-
-    nets = []
-    index = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("WIFI SCANNER")
-
-        try:
-            nets = wlan.scan()
-        except:
-            nets = []
-
-        if not nets:
-            draw_med_text(10, CONTENT_TOP, "NO NETWORKS FOUND", PIP_GREEN)
-        else:
-            if index >= len(nets):
-                index = len(nets) - 1
-            y = CONTENT_TOP
-            for i, n in enumerate(nets[index:index+6]):
-                ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
-                rssi = n[3]
-                line = "{} ({})".format(ssid[:10], rssi)
-                if i == 0:
-                    LCD.fill_rect(0, y-2, 240, 18, PIP_BLACK)
-                draw_med_text(10, y, line, PIP_GREEN)
-                y += 18
-
-        draw_footer("A: DETAILS", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            if index > 0:
-                index -= 1
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            if nets and index < len(nets) - 1:
-                index += 1
-            utime.sleep_ms(150)
-
-        if pressed(keyA) and nets:
-            utime.sleep_ms(200)
-            app_wifi_details(nets[index])
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(200)
-
-# ===========================================================
-# ADD WIFI app
-# ===========================================================
-
-def app_add_wifi():
-    screen_flicker()
-
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(True)
-
-    # --- SCAN ---
-    pip_clear()
-    draw_status_bar()
-    pip_title("SCAN WIFI")
-    draw_med_text(20, CONTENT_TOP, "Scanning...", PIP_GREEN)
-    LCD.show()
-
-    nets = wlan.scan()
-    networks = []
-
-    for n in nets:
-        ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
-        if len(ssid) > 0:
-            networks.append(ssid)
-
-    if not networks:
-        pip_clear()
-        draw_status_bar()
-        pip_title("ADD WIFI")
-        draw_med_text(20, CONTENT_TOP, "No networks found", PIP_RED)
-        draw_footer("B: BACK", "")
-        LCD.show()
-        while not pressed(keyB):
-            utime.sleep_ms(50)
-        return
-
-    index = 0
-
-    # --- SELECT NETWORK ---
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("ADD WIFI")
-
-        y = CONTENT_TOP
-        for i, ssid in enumerate(networks):
-            color = PIP_GREEN if i == index else PIP_DIM
-            draw_med_text(20, y, ssid, color)
-            y += 20
-
-        draw_footer("A: SELECT", "B: BACK")
-        LCD.show()
-
-        if pressed(up):
-            index = (index - 1) % len(networks)
-            utime.sleep_ms(120)
-
-        if pressed(down):
-            index = (index + 1) % len(networks)
-            utime.sleep_ms(120)
-
-        if pressed(keyA):
-            ssid = networks[index]
-            break
-
-        if pressed(keyB):
-            return
-
-    # --- ENTER PASSWORD ---
-    password = keyboard_input("PASSWORD")
-
-# --- RESET WIFI STACK ---
-    ap = network.WLAN(network.AP_IF)
-    ap.active(False)
-
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(False)
-    utime.sleep_ms(200)
-    wlan.active(True)
-    utime.sleep_ms(200)
-
-# --- CONNECT ---
-    wlan.connect(ssid, password)
-
-    timeout = 0
-    while not wlan.isconnected() and timeout < 150:
-        utime.sleep_ms(100)
-        timeout += 1
-        
-    for _ in range(120):  # 12 seconds
-        if wlan.isconnected():
-            break
-        utime.sleep_ms(100)
-
-    if not wlan.isconnected():
-        pip_clear()
-        draw_status_bar()
-        pip_title("FAILED")
-        draw_med_text(20, CONTENT_TOP, "Connection failed", PIP_RED)
-        draw_footer("B: BACK", "")
-        LCD.show()
-        while not pressed(keyB):
-            utime.sleep_ms(50)
-        return
-
-    # --- SAVE CREDENTIALS ---
-    try:
-        with open("wifi.json", "w") as f:
-            f.write(json.dumps({"ssid": ssid, "password": password}))
-    except:
-        pass
-
-    # --- AUTO UPDATE TIME ---
-    try:
-        ntptime.settime()
-    except:
-        pass
-
-    # --- AUTO UPDATE WEATHER ---
-    try:
-        update_weather()
-    except:
-        pass
-
-    # --- SUCCESS ---
-    pip_clear()
-    draw_status_bar()
-    pip_title("CONNECTED")
-    draw_med_text(20, CONTENT_TOP, "WiFi Connected!", PIP_GREEN)
-    draw_med_text(20, CONTENT_TOP + 20, ssid, PIP_GREEN)
-    draw_footer("B: BACK", "")
-    LCD.show()
-
-    while not pressed(keyB):
-        utime.sleep_ms(50)
-
-
-# ============================================================
-# BLUETOOTH SCANNER (BASIC)
-# ============================================================
-
-def app_bluetooth_scanner():
-    screen_flicker()
-    if not HAS_BLE:
-        pip_clear()
-        draw_status_bar()
-        pip_title("BLUETOOTH")
-        draw_med_text(10, CONTENT_TOP+10, "BLE NOT AVAILABLE", PIP_GREEN)
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-        while not pressed(keyB):
-            utime.sleep_ms(50)
-        return
-
-    ble = bluetooth.BLE()
-    ble.active(True)
-    devices = []
-
-    def scan_cb(addr_type, addr, adv_type, rssi, adv_data):
-        name = ""
-        try:
-            name = adv_data.decode(errors="ignore")
-        except:
-            name = ""
-        devices.append((addr, rssi, name))
-
-    # NOTE: MicroPython BLE API differs by port; this is a placeholder.
-    # You may need to adapt to your firmware's BLE scan API.
-
-    start = utime.ticks_ms()
-    while utime.ticks_diff(utime.ticks_ms(), start) < 3000:
-        utime.sleep_ms(100)
-
-    index = 0
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("BLUETOOTH")
-
-        if not devices:
-            draw_med_text(10, CONTENT_TOP, "NO DEVICES FOUND", PIP_GREEN)
-        else:
-            if index >= len(devices):
-                index = len(devices) - 1
-            y = CONTENT_TOP
-            for i, d in enumerate(devices[index:index+6]):
-                addr, rssi, name = d
-                addr_str = ":".join(["{:02X}".format(b) for b in addr])
-                line = "{} {}".format(addr_str[-8:], rssi)
-                if i == 0:
-                    LCD.fill_rect(0, y-2, 240, 18, PIP_BLACK)
-                draw_med_text(10, y, line[:18], PIP_GREEN)
-                y += 18
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            if index > 0:
-                index -= 1
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            if devices and index < len(devices) - 1:
-                index += 1
-            utime.sleep_ms(150)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            ble.active(False)
-            return
-
-        utime.sleep_ms(200)
-
-# ============================================================
-# WEATHER APP
-# ============================================================
-def draw_icon(x, y, code, color):
-    # All icons are 12×12 pixel blocks
-
-    if code == "CLEAR":
-        # Simple sun: square center + rays
-        LCD.fill_rect(x+4, y+4, 4, 4, color)
-        LCD.pixel(x+6, y+1, color)
-        LCD.pixel(x+6, y+10, color)
-        LCD.pixel(x+1, y+6, color)
-        LCD.pixel(x+10, y+6, color)
-
-    elif code == "CLOUDY":
-        # Cloud shape using rectangles
-        LCD.fill_rect(x+2, y+6, 8, 4, color)
-        LCD.fill_rect(x+4, y+4, 6, 3, color)
-
-    elif code == "RAIN":
-        # Cloud + rain drops
-        LCD.fill_rect(x+2, y+4, 8, 4, color)
-        LCD.pixel(x+4, y+9, color)
-        LCD.pixel(x+7, y+9, color)
-        LCD.pixel(x+10, y+9, color)
-
-    elif code == "PART":
-        # Half sun + cloud
-        LCD.fill_rect(x+2, y+6, 8, 4, color)   # cloud
-        LCD.fill_rect(x+4, y+4, 3, 3, color)   # sun core
-        LCD.pixel(x+5, y+2, color)             # sun ray
-
-    else:
-        # Unknown → X
-        LCD.pixel(x+4, y+4, color)
-        LCD.pixel(x+7, y+7, color)
-        LCD.pixel(x+4, y+7, color)
-        LCD.pixel(x+7, y+4, color)
-# Weather Update
-def get_weather_data():
-    try:
-        with open("weather.json") as f:
-            data = json.loads(f.read())
-            return data
-    except:
-        # fallback if file missing or corrupted
-        return {
-            "today": ("ERR", "--", "NO DATA"),
-            "week": []
-        }
-# app
-def app_weather():
-    screen_flicker()
-    page = 0  # 0 = today, 1 = week
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("WEATHER")
-
-        data = get_weather_data()
-
-        # -------------------------------
-        # TODAY VIEW
-        # -------------------------------
-        if page == 0:
-            day, temp, cond = data["today"]
-
-            # Icon
-            draw_icon(10, CONTENT_TOP, cond, PIP_GREEN)
-
-            # Text
-            draw_med_text(40, CONTENT_TOP, day, PIP_GREEN)
-            draw_med_text(40, CONTENT_TOP+24, temp, PIP_GREEN)
-            draw_med_text(40, CONTENT_TOP+48, cond, PIP_GREEN)
-
-            draw_footer("A: WEEK", "B: BACK")
-
-        # -------------------------------
-        # WEEK VIEW (7‑day grid)
-        # -------------------------------
-        else:
-            y = CONTENT_TOP
-            for d, t, c in data["week"]:
-                # Icon
-                draw_icon(10, y, c, PIP_GREEN)
-
-                # DAY TEMP COND
-                draw_small_text(30, y, d, PIP_GREEN)
-                draw_small_text(70, y, t, PIP_GREEN)
-                draw_small_text(120, y, c, PIP_GREEN)
-
-                y += 20
-
-            draw_footer("A: TODAY", "B: BACK")
-
-        draw_noise(120)
-        LCD.show()
-
-        # Controls
-        if pressed(keyA):
-            page = 1 - page
-            utime.sleep_ms(200)
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-# Updater
-import urequests
-import json
-import utime
-
-# Your location (Flint area)
-LAT = 43.0
-LON = -83.7
-
-# Map Open‑Meteo weather codes → TinyPIP condition strings
-def map_code(code):
-    if code in (0, 1):
-        return "CLEAR"
-    if code in (2,):
-        return "PART"
-    if code in (3,):
-        return "CLOUDY"
-    if code in (51, 53, 55, 61, 63, 65, 80, 81, 82):
-        return "RAIN"
-    return "CLOUDY"
-
-def update_weather():
-    try:
-        # Request daily + current weather
-        url = (
-            "https://api.open-meteo.com/v1/forecast?"
-            f"latitude={LAT}&longitude={LON}"
-            "&current_weather=true"
-            "&daily=weathercode,temperature_2m_max"
-            "&timezone=auto"
-        )
-
-        r = urequests.get(url)
-        data = r.json()
-        r.close()
-
-        # -------------------------------
-        # TODAY
-        # -------------------------------
-        temp_now = int(data["current_weather"]["temperature"])
-        code_now = map_code(data["current_weather"]["weathercode"])
-
-        today = (
-            "TODAY",
-            f"{temp_now}F",
-            code_now
-        )
-
-        # -------------------------------
-        # WEEK (7‑day forecast)
-        # -------------------------------
-        week = []
-        days = ["MON","TUE","WED","THU","FRI","SAT","SUN"]
-
-        temps = data["daily"]["temperature_2m_max"]
-        codes = data["daily"]["weathercode"]
-
-        for i in range(7):
-            t = int(temps[i])
-            c = map_code(codes[i])
-            week.append((days[i], f"{t}F", c))
-
-        # -------------------------------
-        # FINAL STRUCTURE
-        # -------------------------------
-        final = {
-            "today": today,
-            "week": week
-        }
-
-        # Write to weather.json
-        with open("weather.json", "w") as f:
-            f.write(json.dumps(final))
-
-        return True
-
-    except Exception as e:
-        print("WEATHER UPDATE ERROR:", e)
-        return False
-    
-# ============================================================
-# GPS (MOCK) APP
-# ============================================================
-
-def get_gps_data():
-    return {
-        "lat": 43.0123,
-        "lon": -83.6870,
-        "fix": True,
-        "sats": 7,
-        "map_x": 0.5,
-        "map_y": 0.5
-    }
-
-def app_gps():
-    screen_flicker()
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("GPS")
-
-        gps = get_gps_data()
-
-        draw_med_text(10, CONTENT_TOP,     "LAT: {:.4f}".format(gps["lat"]), PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+24,  "LON: {:.4f}".format(gps["lon"]), PIP_GREEN)
-        draw_med_text(10, CONTENT_TOP+48,  "SAT: {} FIX: {}".format(gps["sats"], gps["fix"]), PIP_GREEN)
-
-        draw_minimap(150, CONTENT_TOP, gps["map_x"], gps["map_y"])
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-# ============================================================
-# BEACON APP (DRAGON BALL STYLE)
-# ============================================================
-
-def app_tracker():
-    screen_flicker()
-
-    wlan = network.WLAN(network.STA_IF)
-    if not wlan.active():
-        wlan.active(True)
-
-    pulse = 0  # radar pulse animation counter
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("BEACON TRACKER")
-
-        # --- RSSI AVERAGING ---
-        rssi_values = []
-        ssid_found = None
-
-        for _ in range(8):
-            try:
-                nets = wlan.scan()
-            except:
-                nets = []
-
-            for n in nets:
-                raw_ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
-                if raw_ssid.startswith("BEACON"):
-                    ssid_found = raw_ssid
-                    rssi_values.append(n[3])
-                    break
-
-            utime.sleep_ms(30)
-
-        found = ssid_found is not None and len(rssi_values) > 0
-
-        # --- Parse battery from SSID ---
-        battery = None
-        if found and "|" in ssid_found:
-            try:
-                battery = int(ssid_found.split("|")[1])
-            except:
-                battery = None
-
-        if found:
-            avg_rssi = sum(rssi_values) / len(rssi_values)
-
-            freq = 2412
-            distance = 10 ** ((27.55 - (20 * math.log10(freq)) + abs(avg_rssi)) / 20)
-
-            draw_med_text(10, CONTENT_TOP, "BEACON FOUND", PIP_GREEN)
-            draw_med_text(10, CONTENT_TOP+18, "DIST: {:.1f} m".format(distance), PIP_GREEN)
-
-            if battery is not None:
-                draw_med_text(10, CONTENT_TOP+36, "BAT: {}%".format(battery), PIP_GREEN)
-
-            bar = max(0, min(100, 100 + int(avg_rssi)))
-            LCD.fill_rect(10, CONTENT_TOP+54, bar, 12, PIP_GREEN)
-
-            tpos = max(0.0, min(1.0, (100 + avg_rssi) / 100.0))
-        else:
-            draw_med_text(10, CONTENT_TOP, "SEARCHING...", PIP_DIM)
-            tpos = 0.5
-
-        # --- MINIMAP LOWERED ---
-        map_x = 150
-        map_y = CONTENT_TOP + 70
-        draw_minimap(map_x, map_y, tpos, 0.5)
-
-        # --- RADAR PULSE RING ---
-        pulse = (pulse + 1) % 30
-        radius = pulse
-
-        cx = map_x + 35
-        cy = map_y + 35
-
-        fade = max(20, 120 - radius * 4)
-        pulse_color = colour(0, fade, 0)
-
-        for angle in range(0, 360, 10):
-            rad = math.radians(angle)
-            px = int(cx + radius * math.cos(rad))
-            py = int(cy + radius * math.sin(rad))
-            if 0 <= px < 240 and 0 <= py < 240:
-                LCD.pixel(px, py, pulse_color)
-
-        # --- PULSING DOT ---
-        dot_radius = 3 + (pulse // 6)
-        dot_color = PIP_GREEN if found else PIP_DIM
-
-        dot_x = int(map_x + tpos * 70)
-        dot_y = int(map_y + 0.5 * 70)
-
-        for angle in range(0, 360, 20):
-            rad = math.radians(angle)
-            px = int(dot_x + dot_radius * math.cos(rad))
-            py = int(dot_y + dot_radius * math.sin(rad))
-            if 0 <= px < 240 and 0 <= py < 240:
-                LCD.pixel(px, py, dot_color)
-
-        LCD.pixel(dot_x, dot_y, dot_color)
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(40)
-        
-# ============================================================
-# SET DATE / SET TIME APPS
-# ============================================================
-
-def app_set_date():
-    screen_flicker()
-    year, month, day, weekday, hour, minute, second, sub = rtc.datetime()
-    cursor = 0  # 0=year,1=month,2=day
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("SET DATE")
-
-        labels = ["YEAR", "MONTH", "DAY"]
-        values = [year, month, day]
-
-        for i, label in enumerate(labels):
-            draw_med_text(10, CONTENT_TOP + i*24,
-                          label + ":", PIP_GREEN if cursor == i else PIP_DIM)
-            draw_med_text(130, CONTENT_TOP + i*24,
-                          str(values[i]), PIP_GREEN)
-
-        draw_footer("A: APPLY", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            if cursor == 0:
-                year += 1
-            elif cursor == 1:
-                month = 1 if month >= 12 else month + 1
-            elif cursor == 2:
-                day = 1 if day >= 31 else day + 1
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            if cursor == 0:
-                year -= 1
-            elif cursor == 1:
-                month = 12 if month <= 1 else month - 1
-            elif cursor == 2:
-                day = 31 if day <= 1 else day - 1
-            utime.sleep_ms(150)
-
-        if pressed(left):
-            cursor = (cursor - 1) % 3
-            utime.sleep_ms(150)
-
-        if pressed(right):
-            cursor = (cursor + 1) % 3
-            utime.sleep_ms(150)
-
-        if pressed(keyA):
-            rtc.datetime((year, month, day, weekday, hour, minute, second, sub))
-            utime.sleep_ms(200)
-            return
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-def app_set_time():
-    screen_flicker()
-    year, month, day, weekday, hour, minute, second, sub = rtc.datetime()
-    cursor = 0  # 0=hour,1=minute,2=second
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("SET TIME")
-
-        labels = ["HOUR", "MINUTE", "SECOND"]
-        values = [hour, minute, second]
-
-        for i, label in enumerate(labels):
-            draw_med_text(10, CONTENT_TOP + i*24,
-                          label + ":", PIP_GREEN if cursor == i else PIP_DIM)
-            draw_med_text(130, CONTENT_TOP + i*24,
-                          "{:02d}".format(values[i]), PIP_GREEN)
-
-        draw_footer("A: APPLY", "B: BACK")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(up):
-            if cursor == 0:
-                hour = (hour + 1) % 24
-            elif cursor == 1:
-                minute = (minute + 1) % 60
-            elif cursor == 2:
-                second = (second + 1) % 60
-            utime.sleep_ms(150)
-
-        if pressed(down):
-            if cursor == 0:
-                hour = (hour - 1) % 24
-            elif cursor == 1:
-                minute = (minute - 1) % 60
-            elif cursor == 2:
-                second = (second - 1) % 60
-            utime.sleep_ms(150)
-
-        if pressed(left):
-            cursor = (cursor - 1) % 3
-            utime.sleep_ms(150)
-
-        if pressed(right):
-            cursor = (cursor + 1) % 3
-            utime.sleep_ms(150)
-
-        if pressed(keyA):
-            rtc.datetime((year, month, day, weekday, hour, minute, second, sub))
-            utime.sleep_ms(200)
-            return
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-# ============================================================
-# PIP Shooter game.
-# ============================================================
-
-def app_shooter():
-    screen_flicker()
-
-    # Player
-    px = 120
-    py = 210
-    p_speed = 4
-
-    # Bullets
-    bullets = []
-
-    # Enemies
-    enemies = []
-    enemy_timer = 0
-    enemy_speed = 2
-
-    score = 0
-    lives = 3
-
-    while True:
-        pip_clear()
-        draw_status_bar()
-        pip_title("PIP-SHOOTER")
-
-        # --- INPUT ---
-        if pressed(left):
-            px -= p_speed
-        if pressed(right):
-            px += p_speed
-        if pressed(keyA):
-            bullets.append([px, py - 10])
-
-        # Clamp player
-        px = max(10, min(230, px))
-
-        # --- UPDATE BULLETS ---
-        for b in bullets:
-            b[1] -= 6
-        bullets = [b for b in bullets if b[1] > 0]
-
-        # --- SPAWN ENEMIES ---
-        enemy_timer += 1
-        if enemy_timer > 20:
-            enemy_timer = 0
-            enemies.append([random.randint(10, 230), 0])
-
-        # --- UPDATE ENEMIES ---
-        for e in enemies:
-            e[1] += enemy_speed
-
-        # --- COLLISIONS ---
-        for b in bullets:
-            for e in enemies:
-                if abs(b[0] - e[0]) < 10 and abs(b[1] - e[1]) < 10:
-                    score += 1
-                    e[1] = 999  # remove enemy
-                    b[1] = -999 # remove bullet
-
-        enemies = [e for e in enemies if e[1] < 240]
-
-        # --- ENEMY HITS BOTTOM ---
-        for e in enemies:
-            if e[1] > 200:
-                lives -= 1
-                e[1] = 999
-
-        if lives <= 0:
-            pip_clear()
-            draw_status_bar()
-            pip_title("GAME OVER")
-            draw_med_text(40, 120, "SCORE: {}".format(score), PIP_GREEN)
-            draw_footer("B: BACK", "")
-            LCD.show()
-            while not pressed(keyB):
-                utime.sleep_ms(50)
-            return
-
-        # --- DRAW PLAYER ---
-        LCD.fill_rect(px - 5, py - 5, 10, 10, PIP_GREEN)
-
-        # --- DRAW BULLETS ---
-        for b in bullets:
-            LCD.fill_rect(b[0] - 1, b[1] - 4, 2, 4, colour(180, 255, 180))
-
-        # --- DRAW ENEMIES ---
-        for e in enemies:
-            LCD.fill_rect(e[0] - 5, e[1] - 5, 10, 10, colour(255, 60, 60))
-
-        # --- HUD ---
-        draw_med_text(10, CONTENT_TOP, "SCORE: {}".format(score), PIP_GREEN)
-        draw_med_text(150, CONTENT_TOP, "LIVES: {}".format(lives), PIP_GREEN)
-
-        draw_footer("B: BACK", "")
-        draw_noise(120)
-        LCD.show()
-
-        if pressed(keyB):
-            utime.sleep_ms(200)
-            return
-
-        utime.sleep_ms(30)
-
-
-# ============================================================
-# MAIN LOOP
-# ============================================================
+        choice = await menu_loop()
+        app = find_app(choice)
+        if app is not None:
+            await launch(app)
 
-while True:
-    choice = menu_loop()
-
-    if choice == "CLOCK":
-        app_clock()
-    elif choice == "STATUS":
-        app_status()
-    elif choice == "ADD NOTE":
-        app_add_note()
-    elif choice == "VIEW NOTES":
-        app_view_notes()
-    elif choice == "SYSTEM":
-        app_system()
-    elif choice == "SETTINGS":
-        app_settings()
-    elif choice == "FILES":
-        app_files()
-    elif choice == "STOPWATCH":
-        app_stopwatch()
-    elif choice == "TIMER":
-        app_timer()
-    elif choice == "SNAKE":
-        app_snake()
-    elif choice == "WIFI SCANNER":
-        app_wifi_scanner()
-    elif choice == "BLUETOOTH SCANNER":
-        app_bluetooth_scanner()
-    elif choice == "WEATHER":
-        app_weather()
-    elif choice == "GPS":
-        app_gps()
-    elif choice == "TRACKER":
-        app_tracker()
-    elif choice == "SET DATE":
-        app_set_date()
-    elif choice == "SET TIME":
-        app_set_time()
-    elif choice == "SHOOTER":
-        app_shooter()
-    elif choice == "FLASHLIGHT":
-        app_flashlight()
-    elif choice == "COMPASS":
-        app_compass()
-    elif choice == "ADD WIFI":
-        app_add_wifi()
\ No newline at end of file
+asyncio.run(main())
@@ -2,91 +2,166 @@ import network
 import utime
 import json
 
-def wifi_fallback_update():
-    # Reset WiFi stack
-    ap = network.WLAN(network.AP_IF)
-    ap.active(False)
-
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(False)
-    utime.sleep_ms(200)
-    wlan.active(True)
-    utime.sleep_ms(200)
-
-    # --- Load saved WiFi credentials ---
-    saved_ssid = None
-    saved_pass = None
-
+# The Wi-Fi update as a state machine: reset the stack, try the saved
+# network, else scan and try the strongest open one, then set the clock
+# and fetch the weather. tick() does one small piece of work and says
+# whether there is more, so any loop can drive it, and nothing in here
+# sleeps. Each step has its own time limit; wlan.scan(), NTP and the
+# weather request are single blocking calls, so those are only
+# stopped by their own timeouts.
+#
+# results: (step, outcome, ms) for each step run, outcome one of "ok",
+# "fail", "timeout", "skip" or "cancel". failed: the step the update
+# gave up in, or None.
+
+# step: (limit ms, next step if it worked, next step if not)
+# None gives up; "done" ends the update after a connection.
+STEPS = {
+    "reset":   (2000,  "saved",   None),
+    "saved":   (15000, "ntp",     "scan"),
+    "scan":    (10000, "open",    None),
+    "open":    (15000, "ntp",     None),
+    "ntp":     (5000,  "weather", "weather"),
+    "weather": (15000, "done",    "done"),
+}
+
+def load_saved():
     try:
         with open("wifi.json") as f:
             data = json.loads(f.read())
-            saved_ssid = data.get("ssid", "")
-            saved_pass = data.get("password", "")
+        return data.get("ssid", ""), data.get("password", "")
     except:
-        pass
-
-    # --- Connection helper ---
-    def try_connect(ssid, password=None):
-        wlan.connect(ssid, password)
-        for _ in range(150):  # 15 seconds
-            if wlan.isconnected():
-                return True
-            utime.sleep_ms(100)
-        return False
-
-    connected = False
-
-    # --- Try saved WiFi first ---
-    if saved_ssid:
-        if try_connect(saved_ssid, saved_pass):
-            connected = True
-
-    # --- Try open networks if saved WiFi fails ---
-    if not connected:
+        return None, None
+
+class WifiUpdate:
+    def __init__(self, progress=None):
+        # progress(2) is called once connected
+        self.progress = progress
+        self.wlan = None
+        self.best_open = None
+        self.results = []
+        self.connected = False
+        self.failed = None
+        self.done = False
+        self.ok = False
+        self.enter("reset")
+
+    def enter(self, step):
+        self.step = step
+        self.phase = 0
+        self.started = utime.ticks_ms()
+
+    def elapsed(self):
+        return utime.ticks_diff(utime.ticks_ms(), self.started)
+
+    def tick(self):
+        if self.done:
+            return False
+        limit, on_ok, on_fail = STEPS[self.step]
         try:
-            nets = wlan.scan()
-        except:
-            nets = []
-
+            r = getattr(self, "do_" + self.step)()
+        except Exception as e:
+            print("UPDATE", self.step, "ERROR:", e)
+            r = False
+        if r is None:
+            if self.elapsed() < limit:
+                return True
+            r = "timeout"
+
+        if r is True:
+            self.results.append((self.step, "ok", self.elapsed()))
+            nxt = on_ok
+        else:
+            self.results.append((self.step, r or "fail", self.elapsed()))
+            nxt = on_fail
+
+        if nxt is None:
+            self.failed = self.step
+            self.finish()
+        elif nxt == "done":
+            self.finish()
+        else:
+            self.enter(nxt)
+        return not self.done
+
+    def cancel(self):
+        if not self.done:
+            self.results.append((self.step, "cancel", self.elapsed()))
+            self.failed = self.step
+            self.finish()
+
+    def finish(self):
+        # the result is set first, so a radio error below can't lose it;
+        # the radio goes off however the update ended
+        self.ok = self.connected and self.failed is None
+        self.done = True
+        if self.wlan is not None:
+            try:
+                self.wlan.disconnect()
+            except:
+                pass
+            try:
+                self.wlan.active(False)
+            except Exception as e:
+                print("UPDATE radio off ERROR:", e)
+
+    def report(self):
+        return " ".join("{}:{}:{}ms".format(*r) for r in self.results)
+
+    # --- steps: None while still working, else True, False or an outcome
+
+    def do_reset(self):
+        if self.phase == 0:
+            network.WLAN(network.AP_IF).active(False)
+            self.wlan = network.WLAN(network.STA_IF)
+            self.wlan.active(False)
+            self.phase = 1
+        elif self.phase == 1 and self.elapsed() >= 200:
+            self.wlan.active(True)
+            self.phase = 2
+        elif self.phase == 2 and self.elapsed() >= 400:
+            return True
+
+    def wait_connected(self):
+        if self.wlan.isconnected():
+            self.connected = True
+            if self.progress:
+                self.progress(2)
+            return True
+
+    def do_saved(self):
+        if self.phase == 0:
+            ssid, password = load_saved()
+            if not ssid:
+                return "skip"
+            self.wlan.connect(ssid, password)
+            self.phase = 1
+        return self.wait_connected()
+
+    def do_scan(self):
         open_nets = []
-        for n in nets:
+        for n in self.wlan.scan():
             ssid = n[0].decode() if isinstance(n[0], bytes) else n[0]
-            rssi = n[3]
-            auth = n[4]
-            if auth == 0 and ssid:
-                open_nets.append((ssid, rssi))
-
-        if open_nets:
-            open_nets.sort(key=lambda x: x[1], reverse=True)
-            best_open = open_nets[0][0]
-            if try_connect(best_open):
-                connected = True
-
-    # --- If still not connected, fail ---
-    if not connected:
-        wlan.active(False)
-        return False
-
-    # --- Sync time ---
-    try:
+            if n[4] == 0 and ssid:
+                open_nets.append((n[3], ssid))
+        if not open_nets:
+            return False
+        self.best_open = max(open_nets)[1]
+        return True
+
+    def do_open(self):
+        if self.phase == 0:
+            # the saved network may still be trying
+            self.wlan.disconnect()
+            self.wlan.connect(self.best_open)
+            self.phase = 1
+        return self.wait_connected()
+
+    def do_ntp(self):
         import ntptime
         ntptime.settime()
-    except:
-        pass
-
-    # --- Sync weather ---
-    try:
-        from weather import update_weather
-        update_weather()
-    except:
-        pass
-
-    # --- Disconnect + turn off WiFi ---
-    try:
-        wlan.disconnect()
-    except:
-        pass
-
-    wlan.active(False)
+        return True
 
-    return True
\ No newline at end of file
+    def do_weather(self):
+        from apps.weather import update_weather
+        return update_weather()